@@ -0,0 +1,19 @@
+"""
+키셋 페이지네이션 커서 — "(정렬 시각 ISO8601)_(id)" 문자열, 다음 페이지 커서는 X-Next-Cursor 헤더로 내려준다.
+"""
+from datetime import datetime
+
+from fastapi import HTTPException
+
+
+def encode_cursor(at: datetime, row_id: int) -> str:
+    return f"{at.isoformat()}_{row_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """encode_cursor 의 역변환. 형식이 틀리면 400."""
+    try:
+        at, row_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(at), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
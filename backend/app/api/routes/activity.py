@@ -0,0 +1,48 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, get_current_user
+from app.api.pagination import decode_cursor, encode_cursor
+from app.models.activity_feed import ActivityFeedItem
+from app.models.user import User
+from app.schemas.activity import ActivityItemOut
+from app.services.activity_service import feed_query
+
+router = APIRouter(prefix="/activity", tags=["activity"])
+
+MAX_FEED_PAGE_SIZE = 100
+
+
+@router.get("/feed", response_model=list[ActivityItemOut])
+def get_feed(
+    response: Response,
+    kinds: Optional[List[str]] = Query(default=None),
+    cursor: Optional[str] = None,
+    limit: int = Query(30, ge=1, le=MAX_FEED_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """친구 활동 타임라인 (최신순) — 다음 페이지 커서는 X-Next-Cursor 헤더"""
+    rows = (
+        feed_query(
+            db, current_user.id, ActivityFeedItem, User.nickname,
+            after=decode_cursor(cursor) if cursor else None, kinds=kinds,
+        )
+        .outerjoin(User, User.id == ActivityFeedItem.actor_id)
+        .limit(limit + 1)
+        .all()
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.occurred_at, last.id)
+    return [
+        ActivityItemOut(
+            id=item.id, actor_id=item.actor_id, actor_nickname=nickname, kind=item.kind,
+            ref_id=item.ref_id, log_type=item.log_type, summary=item.summary,
+            value=item.value, occurred_at=item.occurred_at,
+        )
+        for item, nickname in rows
+    ]
@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, get_current_user
+from app.models.user import User
+from app.schemas.task import FreeBusyOut, TimeSlot, UserBusyOut
+from app.services import freebusy_service
+
+router = APIRouter(prefix="/freebusy", tags=["freebusy"])
+
+MAX_WINDOW_DAYS = 62
+
+
+@router.get("", response_model=FreeBusyOut)
+def get_free_busy(
+    date_from: date,
+    date_to: date,
+    user_ids: list[int] = Query([]),
+    group_id: Optional[int] = None,
+    min_duration_min: int = Query(30, ge=15, le=24 * 60),
+    day_start_hour: int = Query(0, ge=0, le=23),
+    day_end_hour: int = Query(24, ge=1, le=24),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    나 + user_ids (+ group_id 멤버 전원)의 공통 빈 시간과 사용자별 바쁜 시간.
+    date_to 포함. 다른 사용자의 일정은 나에게 보이는 것만 바쁜 시간으로 계산한다.
+    """
+    if date_to < date_from or date_to - date_from >= timedelta(days=MAX_WINDOW_DAYS):
+        raise HTTPException(status_code=400, detail=f"기간은 1~{MAX_WINDOW_DAYS}일이어야 합니다")
+    if day_end_hour <= day_start_hour:
+        raise HTTPException(status_code=400, detail="day_end_hour 는 day_start_hour 보다 커야 합니다")
+
+    allowed = freebusy_service.allowed_user_ids(db, current_user.id)
+    ids = {current_user.id, *user_ids}
+    if group_id is not None:
+        members = freebusy_service.group_member_ids(db, group_id)
+        if current_user.id not in members:
+            raise HTTPException(status_code=403, detail="그룹 멤버가 아닙니다")
+        ids.update(members)
+    if not ids <= allowed:
+        raise HTTPException(status_code=403, detail="친구 또는 같은 그룹 멤버만 조회할 수 있습니다")
+
+    ordered = sorted(ids)
+    free, busy = freebusy_service.free_busy(
+        db, current_user.id, ordered, date_from, date_to,
+        min_duration_min=min_duration_min,
+        day_start_hour=day_start_hour,
+        day_end_hour=day_end_hour,
+    )
+    return FreeBusyOut(
+        date_from=date_from,
+        date_to=date_to,
+        user_ids=ordered,
+        free=[TimeSlot(start_at=s, end_at=e) for s, e in free],
+        users=[
+            UserBusyOut(user_id=uid, busy=[TimeSlot(start_at=s, end_at=e) for s, e in busy[uid]])
+            for uid in ordered
+        ],
+    )
@@ -1,45 +1,36 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, case, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_db, get_current_user
 from app.models.friendship import Friendship
 from app.models.task import Task
+from app.models.task_acl import TaskAclEntry
 from app.models.task_visibility import TaskVisibilityFriend
 from app.models.user import User
 from app.schemas.friend import FriendRequestOut, FriendRequestPayload, FriendOut, FriendSearchResult
 from app.schemas.task import TaskOut
+from app.services.freebusy_service import invalidate_user as invalidate_busy
+from app.services.group_feed_service import invalidate_user as invalidate_group_feed
+from app.services import acl_service
+from app.services.activity_service import on_friendship_added, on_friendship_removed
+from app.services.friend_service import are_friends, get_relations, invalidate_friends
+from app.services.user_search_service import search_nicknames
 
 router = APIRouter(prefix="/friends", tags=["friends"])
 
 
-def _get_friendship(db: Session, user_id_a: int, user_id_b: int):
-    return db.query(Friendship).filter(
-        or_(
-            and_(Friendship.user_id == user_id_a, Friendship.friend_id == user_id_b),
-            and_(Friendship.user_id == user_id_b, Friendship.friend_id == user_id_a),
-        )
-    ).first()
-
-
-def _are_friends(db: Session, user_id_a: int, user_id_b: int) -> bool:
-    fr = _get_friendship(db, user_id_a, user_id_b)
-    return fr is not None and fr.status == "accepted"
-
-
 @router.get("/search", response_model=list[FriendSearchResult])
 def search_users(nickname: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    nickname = nickname.strip()
     if not nickname:
         return []
-    users = db.query(User).filter(
-        User.nickname.ilike(f"%{nickname}%"),
-        User.id != current_user.id,
-        User.nickname.isnot(None),
-    ).limit(20).all()
+    users = search_nicknames(db, nickname, current_user.id, limit=20)
 
+    relations = get_relations(db, current_user.id)
     results = []
     for u in users:
-        fr = _get_friendship(db, current_user.id, u.id)
+        fr = relations.get(u.id)
         results.append(FriendSearchResult(
             id=u.id,
             nickname=u.nickname,
@@ -56,12 +47,12 @@ def send_friend_request(payload: FriendRequestPayload, db: Session = Depends(get
     target = db.query(User).filter(User.id == payload.friend_id).first()
     if not target:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-    existing = _get_friendship(db, current_user.id, payload.friend_id)
-    if existing:
+    if payload.friend_id in get_relations(db, current_user.id):
         raise HTTPException(status_code=400, detail="이미 친구이거나 신청 중입니다")
     fr = Friendship(user_id=current_user.id, friend_id=payload.friend_id, status="pending")
     db.add(fr)
     db.commit()
+    invalidate_friends(current_user.id, payload.friend_id)
     db.refresh(fr)
     return fr
 
@@ -87,7 +78,13 @@ def accept_request(request_id: int, db: Session = Depends(get_db), current_user:
     if not fr:
         raise HTTPException(status_code=404, detail="친구 신청을 찾을 수 없습니다")
     fr.status = "accepted"
+    on_friendship_added(db, fr.user_id, fr.friend_id)
+    acl_service.on_friendship_added(db, fr.user_id, fr.friend_id)
     db.commit()
+    invalidate_friends(fr.user_id, fr.friend_id)
+    # 친구 공개 일정이 서로에게 보이기 시작하므로 캐시된 free/busy · 그룹 피드도 무효화
+    invalidate_busy(fr.user_id, fr.friend_id)
+    invalidate_group_feed(fr.user_id, fr.friend_id)
     db.refresh(fr)
     return fr
 
@@ -101,25 +98,25 @@ def decline_or_cancel_request(request_id: int, db: Session = Depends(get_db), cu
         raise HTTPException(status_code=403, detail="권한이 없습니다")
     db.delete(fr)
     db.commit()
+    invalidate_friends(fr.user_id, fr.friend_id)
     return {"deleted": True}
 
 
 @router.get("", response_model=list[FriendOut])
 def list_friends(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    sent = db.query(Friendship).filter(
-        Friendship.user_id == current_user.id,
-        Friendship.status == "accepted",
-    ).all()
-    received = db.query(Friendship).filter(
-        Friendship.friend_id == current_user.id,
-        Friendship.status == "accepted",
-    ).all()
-    result = []
-    for f in sent:
-        result.append(FriendOut(id=f.id, user=f.recipient, since=f.created_at))
-    for f in received:
-        result.append(FriendOut(id=f.id, user=f.requester, since=f.created_at))
-    return result
+    """수락된 친구 목록 — 상대방 User 를 조인해 쿼리 1번으로 조회"""
+    other_id = case((Friendship.user_id == current_user.id, Friendship.friend_id), else_=Friendship.user_id)
+    rows = (
+        db.query(Friendship.id, Friendship.created_at, User)
+        .join(User, User.id == other_id)
+        .filter(
+            or_(Friendship.user_id == current_user.id, Friendship.friend_id == current_user.id),
+            Friendship.status == "accepted",
+        )
+        .order_by(Friendship.created_at.asc(), Friendship.id.asc())
+        .all()
+    )
+    return [FriendOut(id=fid, user=user, since=since) for fid, since, user in rows]
 
 
 @router.delete("/{friendship_id}")
@@ -131,26 +128,31 @@ def remove_friend(friendship_id: int, db: Session = Depends(get_db), current_use
         raise HTTPException(status_code=403, detail="권한이 없습니다")
     other_id = fr.friend_id if fr.user_id == current_user.id else fr.user_id
     db.delete(fr)
-    # selective 공유 목록에서도 제거
-    db.query(TaskVisibilityFriend).filter(
-        TaskVisibilityFriend.friend_user_id == other_id
-    ).delete()
+    on_friendship_removed(db, current_user.id, other_id)
+    acl_service.on_friendship_removed(db, current_user.id, other_id)
+    # 서로의 selective 공유 목록에서도 제거
+    for owner_id, viewer_id in ((current_user.id, other_id), (other_id, current_user.id)):
+        db.query(TaskVisibilityFriend).filter(
+            TaskVisibilityFriend.friend_user_id == viewer_id,
+            TaskVisibilityFriend.task_id.in_(select(Task.id).where(Task.user_id == owner_id)),
+        ).delete(synchronize_session=False)
     db.commit()
+    invalidate_friends(current_user.id, other_id)
+    invalidate_busy(current_user.id, other_id)
+    invalidate_group_feed(current_user.id, other_id)
     return {"deleted": True}
 
 
 @router.get("/{friend_id}/tasks", response_model=list[TaskOut])
 def get_friend_tasks(friend_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    if not _are_friends(db, current_user.id, friend_id):
+    if not are_friends(db, current_user.id, friend_id):
         raise HTTPException(status_code=403, detail="친구가 아닙니다")
-    selective_ids = db.query(TaskVisibilityFriend.task_id).filter(
-        TaskVisibilityFriend.friend_user_id == current_user.id
-    ).subquery()
-    tasks = db.query(Task).filter(
-        Task.user_id == friend_id,
-        or_(
-            Task.visibility == "public",
-            and_(Task.visibility == "selective", Task.id.in_(selective_ids)),
-        ),
-    ).order_by(Task.start_at.asc()).all()
+    # task_acl (viewer_id, owner_id, start_at) 인덱스 범위 한 번
+    tasks = (
+        db.query(Task)
+        .join(TaskAclEntry, TaskAclEntry.task_id == Task.id)
+        .filter(TaskAclEntry.viewer_id == current_user.id, TaskAclEntry.owner_id == friend_id)
+        .order_by(TaskAclEntry.start_at, TaskAclEntry.task_id)
+        .all()
+    )
     return tasks
@@ -5,6 +5,7 @@ from app.api.deps import get_db, get_current_user
 from app.models.goal import Goal
 from app.models.user import User
 from app.schemas.goal import GoalCreate, GoalBulkCreate, GoalOut
+from app.services.group_feed_service import invalidate_user as invalidate_group_feed
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
@@ -19,6 +20,7 @@ def create_goal(payload: GoalCreate, db: Session = Depends(get_db), current_user
     goal = Goal(user_id=current_user.id, text=payload.text, type=payload.type)
     db.add(goal)
     db.commit()
+    invalidate_group_feed(current_user.id)
     db.refresh(goal)
     return goal
 
@@ -28,6 +30,7 @@ def bulk_create_goals(payload: GoalBulkCreate, db: Session = Depends(get_db), cu
     goals = [Goal(user_id=current_user.id, text=g.text, type=g.type) for g in payload.goals]
     db.add_all(goals)
     db.commit()
+    invalidate_group_feed(current_user.id)
     for g in goals:
         db.refresh(g)
     return goals
@@ -40,4 +43,5 @@ def delete_goal(goal_id: int, db: Session = Depends(get_db), current_user: User
         raise HTTPException(status_code=404, detail="Goal not found")
     db.delete(goal)
     db.commit()
+    invalidate_group_feed(current_user.id)
     return {"deleted": True}
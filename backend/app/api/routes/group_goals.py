@@ -5,10 +5,9 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_user
 from app.models.group import Group, GroupMember
 from app.models.group_goal import GroupGoal
-from app.models.group_project_task import GroupProjectTask
-from app.models.group_project import GroupProject
 from app.models.user import User
 from app.schemas.group_goal import GroupGoalCreate, GroupGoalOut
+from app.services.group_goal_service import get_achievement_rate
 
 router = APIRouter(prefix="/groups", tags=["group-goals"])
 
@@ -23,21 +22,6 @@ def _require_member(db: Session, group_id: int, user_id: int):
     return m
 
 
-def _calc_achievement_rate(db: Session, group_id: int) -> float:
-    """그룹 프로젝트 태스크 완료율 → 그룹 목표 달성률"""
-    projects = db.query(GroupProject).filter(GroupProject.group_id == group_id).all()
-    if not projects:
-        return 0.0
-    project_ids = [p.id for p in projects]
-    all_tasks = db.query(GroupProjectTask).filter(
-        GroupProjectTask.group_project_id.in_(project_ids)
-    ).all()
-    if not all_tasks:
-        return 0.0
-    done = sum(1 for t in all_tasks if t.is_done)
-    return round(done / len(all_tasks), 4)
-
-
 @router.get("/{group_id}/goals", response_model=list[GroupGoalOut])
 def list_group_goals(
     group_id: int,
@@ -46,7 +30,7 @@ def list_group_goals(
 ):
     _require_member(db, group_id, current_user.id)
     goals = db.query(GroupGoal).filter(GroupGoal.group_id == group_id).all()
-    rate = _calc_achievement_rate(db, group_id)
+    rate = get_achievement_rate(db, group_id)
     result = []
     for g in goals:
         out = GroupGoalOut(
@@ -80,7 +64,7 @@ def create_group_goal(
     db.add(goal)
     db.commit()
     db.refresh(goal)
-    rate = _calc_achievement_rate(db, group_id)
+    rate = get_achievement_rate(db, group_id)
     return GroupGoalOut(
         id=goal.id,
         group_id=goal.group_id,
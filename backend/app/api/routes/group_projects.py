@@ -1,7 +1,8 @@
 from datetime import datetime, date
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps import get_db, get_current_user
 from app.models.group import Group, GroupMember
@@ -13,6 +14,10 @@ from app.schemas.group_project import (
     GroupProjectTaskCreate, GroupProjectTaskUpdate,
     GroupProjectTaskOut, GroupProjectStats,
 )
+from app.schemas.project import TaskReorderPayload, TaskRankOut
+from app.services.group_goal_service import invalidate_achievement_rate
+from app.services.overdue_service import record_if_completed_late
+from app.services.rank_service import next_rank, apply_moves
 
 router = APIRouter(prefix="/groups", tags=["group-projects"])
 
@@ -47,55 +52,43 @@ def _build_task_out(task: GroupProjectTask) -> GroupProjectTaskOut:
         is_done=task.is_done,
         done_at=task.done_at,
         order_index=task.order_index,
+        rank=task.rank,
         is_overdue=is_overdue,
         overdue_recorded=task.overdue_recorded,
         created_at=task.created_at,
     )
 
 
-def _build_project_out(project: GroupProject, db: Session) -> GroupProjectOut:
-    today = date.today()
-    task_outs = []
-    overdue_count = 0
-    tasks_to_update = []
-
-    for task in project.tasks:
-        is_overdue = bool(
-            task.deadline
-            and not task.is_done
-            and date.fromisoformat(task.deadline) < today
+def _project_counts(db: Session, project_ids: list[int]) -> dict[int, tuple[int, int]]:
+    """project_id → (total, done) — 프로젝트 수와 무관하게 grouped 쿼리 1번"""
+    if not project_ids:
+        return {}
+    rows = (
+        db.query(
+            GroupProjectTask.group_project_id,
+            func.count(GroupProjectTask.id),
+            func.sum(case((GroupProjectTask.is_done == True, 1), else_=0)),
         )
-        # 기록 보존: 처음 overdue 감지 시 DB 업데이트
-        if is_overdue and not task.overdue_recorded:
-            task.overdue_recorded = True
-            tasks_to_update.append(task)
-        if is_overdue or task.overdue_recorded:
-            overdue_count += 1
-
-        nickname = None
-        if task.assignee:
-            nickname = task.assignee.nickname or task.assignee.email.split("@")[0]
-
-        task_outs.append(GroupProjectTaskOut(
-            id=task.id,
-            group_project_id=task.group_project_id,
-            assigned_to=task.assigned_to,
-            assigned_nickname=nickname,
-            title=task.title,
-            deadline=task.deadline,
-            is_done=task.is_done,
-            done_at=task.done_at,
-            order_index=task.order_index,
-            is_overdue=is_overdue,
-            overdue_recorded=task.overdue_recorded,
-            created_at=task.created_at,
-        ))
-
-    if tasks_to_update:
-        db.commit()
-
-    total = len(task_outs)
-    done = sum(1 for t in task_outs if t.is_done)
+        .filter(GroupProjectTask.group_project_id.in_(project_ids))
+        .group_by(GroupProjectTask.group_project_id)
+        .all()
+    )
+    return {pid: (int(total), int(done or 0)) for pid, total, done in rows}
+
+
+def _build_project_out(
+    project: GroupProject,
+    counts: Optional[tuple[int, int]] = None,
+) -> GroupProjectOut:
+    """읽기 전용 — overdue_recorded 기록은 주기 스윕(services/overdue_service.py)이 담당"""
+    task_outs = [_build_task_out(task) for task in project.tasks]
+    overdue_count = sum(1 for t in task_outs if t.is_overdue or t.overdue_recorded)
+
+    if counts is not None:
+        total, done = counts
+    else:
+        total = len(task_outs)
+        done = sum(1 for t in task_outs if t.is_done)
     completion_pct = round((done / total) * 100, 1) if total > 0 else 0.0
 
     return GroupProjectOut(
@@ -126,13 +119,16 @@ def list_group_projects(
     current_user: User = Depends(get_current_user),
 ):
     _require_member(db, group_id, current_user.id)
+    # 프로젝트 / 태스크 / 담당자를 각각 1번씩 로드 (N+1 방지)
     projects = (
         db.query(GroupProject)
+        .options(selectinload(GroupProject.tasks).selectinload(GroupProjectTask.assignee))
         .filter(GroupProject.group_id == group_id)
         .order_by(GroupProject.created_at.desc())
         .all()
     )
-    return [_build_project_out(p, db) for p in projects]
+    counts = _project_counts(db, [p.id for p in projects])
+    return [_build_project_out(p, counts.get(p.id, (0, 0))) for p in projects]
 
 
 @router.post("/{group_id}/projects", response_model=GroupProjectOut)
@@ -153,7 +149,7 @@ def create_group_project(
     db.add(project)
     db.commit()
     db.refresh(project)
-    return _build_project_out(project, db)
+    return _build_project_out(project)
 
 
 @router.put("/{group_id}/projects/{project_id}", response_model=GroupProjectOut)
@@ -177,7 +173,7 @@ def update_group_project(
         setattr(project, field, val)
     db.commit()
     db.refresh(project)
-    return _build_project_out(project, db)
+    return _build_project_out(project)
 
 
 @router.delete("/{group_id}/projects/{project_id}", status_code=204)
@@ -198,6 +194,7 @@ def delete_group_project(
         raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
     db.delete(project)
     db.commit()
+    invalidate_achievement_rate(group_id)
 
 
 # ── 태스크 CRUD ──────────────────────────────────────────────────────────
@@ -225,11 +222,40 @@ def add_group_project_task(
         title=payload.title,
         deadline=payload.deadline,
         order_index=payload.order_index,
+        rank=next_rank(db, GroupProjectTask, GroupProjectTask.group_project_id, project_id),
     )
     db.add(task)
     db.commit()
+    invalidate_achievement_rate(group_id)
     db.refresh(project)
-    return _build_project_out(project, db)
+    return _build_project_out(project)
+
+
+@router.post("/{group_id}/projects/{project_id}/tasks/reorder", response_model=list[TaskRankOut])
+def reorder_group_project_tasks(
+    group_id: int,
+    project_id: int,
+    payload: TaskReorderPayload,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """드래그앤드롭 이동 일괄 적용 — 이동 1건당 옮긴 태스크 1행만 갱신"""
+    _require_member(db, group_id, current_user.id)
+    project = db.query(GroupProject).filter(
+        GroupProject.id == project_id, GroupProject.group_id == group_id
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+    try:
+        moved = apply_moves(
+            db, GroupProjectTask, GroupProjectTask.group_project_id, project_id, payload.moves
+        )
+    except LookupError:
+        raise HTTPException(status_code=404, detail="태스크를 찾을 수 없습니다.")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="이동 위치가 올바르지 않습니다.")
+    db.commit()
+    return moved
 
 
 @router.put("/{group_id}/projects/{project_id}/tasks/{task_id}", response_model=GroupProjectOut)
@@ -249,17 +275,21 @@ def update_group_project_task(
     if not task:
         raise HTTPException(status_code=404, detail="태스크를 찾을 수 없습니다.")
     updates = payload.model_dump(exclude_unset=True)
+    completing = bool(updates.get("is_done")) and not task.is_done
     if "is_done" in updates:
-        if updates["is_done"] and not task.is_done:
+        if completing:
             task.done_at = datetime.utcnow()
         elif not updates["is_done"]:
             task.done_at = None
     for field, val in updates.items():
         setattr(task, field, val)
+    if completing:
+        record_if_completed_late(task)
     db.commit()
+    invalidate_achievement_rate(group_id)
     project = db.query(GroupProject).filter(GroupProject.id == project_id).first()
     db.refresh(project)
-    return _build_project_out(project, db)
+    return _build_project_out(project)
 
 
 @router.delete("/{group_id}/projects/{project_id}/tasks/{task_id}", response_model=GroupProjectOut)
@@ -279,9 +309,10 @@ def delete_group_project_task(
         raise HTTPException(status_code=404, detail="태스크를 찾을 수 없습니다.")
     db.delete(task)
     db.commit()
+    invalidate_achievement_rate(group_id)
     project = db.query(GroupProject).filter(GroupProject.id == project_id).first()
     db.refresh(project)
-    return _build_project_out(project, db)
+    return _build_project_out(project)
 
 
 # ── AI 피드백 ─────────────────────────────────────────────────────────────
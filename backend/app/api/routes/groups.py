@@ -1,21 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import or_, and_
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
-from app.models.friendship import Friendship
+from app.api.pagination import decode_cursor, encode_cursor
 from app.models.goal import Goal
 from app.models.group import Group, GroupMember
-from app.models.task import Task
-from app.models.task_visibility import TaskVisibilityFriend
 from app.models.user import User
 from app.schemas.group import GroupCreate, GroupOut, GroupDetailOut, AddMemberPayload
 from app.schemas.goal import GoalOut
 from app.schemas.task import TaskOut
 from app.schemas.user import UserPublicOut
+from app.services.friend_service import are_friends
+from app.services.group_feed_service import first_page_key, get_cached, page_tasks, set_cached
+from app.services.group_stats_service import on_member_joined, on_member_left, on_group_deleted
 
 router = APIRouter(prefix="/groups", tags=["groups"])
 
+MAX_FEED_PAGE_SIZE = 200
+
 
 def _get_member(db: Session, group_id: int, user_id: int):
     return db.query(GroupMember).filter(
@@ -24,30 +30,27 @@ def _get_member(db: Session, group_id: int, user_id: int):
     ).first()
 
 
-def _are_friends(db: Session, a: int, b: int) -> bool:
-    fr = db.query(Friendship).filter(
-        or_(
-            and_(Friendship.user_id == a, Friendship.friend_id == b),
-            and_(Friendship.user_id == b, Friendship.friend_id == a),
-        ),
-        Friendship.status == "accepted",
-    ).first()
-    return fr is not None
+def _bump_member_count(group: Group, delta: int) -> None:
+    """UPDATE ... SET member_count = member_count + n 으로 원자적 증감"""
+    group.member_count = Group.member_count + delta
 
 
 @router.get("", response_model=list[GroupOut])
 def list_groups(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    memberships = db.query(GroupMember).filter(GroupMember.user_id == current_user.id).all()
-    group_ids = [m.group_id for m in memberships]
-    groups = db.query(Group).filter(Group.id.in_(group_ids)).all()
-    result = []
-    for g in groups:
-        count = db.query(GroupMember).filter(GroupMember.group_id == g.id).count()
-        result.append(GroupOut(
+    groups = (
+        db.query(Group)
+        .join(GroupMember, GroupMember.group_id == Group.id)
+        .filter(GroupMember.user_id == current_user.id)
+        .order_by(Group.id)
+        .all()
+    )
+    return [
+        GroupOut(
             id=g.id, owner_id=g.owner_id, name=g.name,
-            created_at=g.created_at, member_count=count,
-        ))
-    return result
+            created_at=g.created_at, member_count=g.member_count,
+        )
+        for g in groups
+    ]
 
 
 @router.post("", response_model=GroupOut)
@@ -55,10 +58,11 @@ def create_group(payload: GroupCreate, db: Session = Depends(get_db), current_us
     name = payload.name.strip()
     if not name:
         raise HTTPException(status_code=400, detail="그룹 이름을 입력해주세요")
-    group = Group(owner_id=current_user.id, name=name)
+    group = Group(owner_id=current_user.id, name=name, member_count=1)
     db.add(group)
     db.flush()
     db.add(GroupMember(group_id=group.id, user_id=current_user.id))
+    on_member_joined(db, group.id, current_user.id)
     db.commit()
     db.refresh(group)
     return GroupOut(id=group.id, owner_id=group.owner_id, name=group.name,
@@ -67,14 +71,15 @@ def create_group(payload: GroupCreate, db: Session = Depends(get_db), current_us
 
 @router.get("/{group_id}", response_model=GroupDetailOut)
 def get_group(group_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    if not _get_member(db, group_id, current_user.id):
+    # 멤버 목록으로 가입 여부까지 확인 (별도 멤버 조회 없음)
+    members = db.query(User).join(GroupMember, GroupMember.user_id == User.id).filter(
+        GroupMember.group_id == group_id
+    ).all()
+    if all(u.id != current_user.id for u in members):
         raise HTTPException(status_code=403, detail="그룹 멤버가 아닙니다")
     group = db.query(Group).filter(Group.id == group_id).first()
     if not group:
         raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다")
-    members = db.query(User).join(GroupMember, GroupMember.user_id == User.id).filter(
-        GroupMember.group_id == group_id
-    ).all()
     return GroupDetailOut(
         id=group.id, owner_id=group.owner_id, name=group.name,
         created_at=group.created_at,
@@ -89,11 +94,13 @@ def add_member(group_id: int, payload: AddMemberPayload, db: Session = Depends(g
         raise HTTPException(status_code=404, detail="그룹을 찾을 수 없습니다")
     if group.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="그룹 소유자만 멤버를 추가할 수 있습니다")
-    if not _are_friends(db, current_user.id, payload.user_id):
+    if not are_friends(db, current_user.id, payload.user_id):
         raise HTTPException(status_code=400, detail="친구만 그룹에 초대할 수 있습니다")
     if _get_member(db, group_id, payload.user_id):
         raise HTTPException(status_code=400, detail="이미 그룹 멤버입니다")
     db.add(GroupMember(group_id=group_id, user_id=payload.user_id))
+    _bump_member_count(group, 1)
+    on_member_joined(db, group_id, payload.user_id)
     db.commit()
     return get_group(group_id, db, current_user)
 
@@ -109,40 +116,67 @@ def remove_member(group_id: int, user_id: int, db: Session = Depends(get_db), cu
     if not member:
         raise HTTPException(status_code=404, detail="멤버를 찾을 수 없습니다")
     db.delete(member)
-    remaining = db.query(GroupMember).filter(GroupMember.group_id == group_id).count()
-    if remaining == 0:
+    db.flush()
+    # 메모리의 member_count 가 아니라 UPDATE … RETURNING 결과로 판단 — 그룹 행이 잠기므로
+    # 동시에 나가는 요청들 중 마지막 한 명만 0 을 보고 그룹을 지운다
+    remaining = db.execute(
+        update(Group)
+        .where(Group.id == group_id)
+        .values(member_count=Group.member_count - 1)
+        .returning(Group.member_count)
+    ).scalar_one()
+    on_member_left(db, group_id, user_id)
+    if remaining <= 0:
+        on_group_deleted(db, group_id)
         db.query(Group).filter(Group.id == group_id).delete()
     db.commit()
     return {"deleted": True}
 
 
 @router.get("/{group_id}/feed")
-def get_group_feed(group_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    if not _get_member(db, group_id, current_user.id):
+def get_group_feed(
+    group_id: int,
+    response: Response,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=MAX_FEED_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    그룹 멤버들의 공개 일정을 (start_at, id) 순 페이지로 조회 — 다음 페이지 커서는 X-Next-Cursor 헤더.
+    date_from / date_to 로 시작 시각 범위를 좁힐 수 있고, 목표 / 멤버 목록은 첫 페이지(cursor 없음)에만 담는다.
+    기간 없는 첫 페이지는 짧게 캐시되며 멤버가 일정 / 목표를 쓰면 무효화된다.
+    """
+    member_ids = [uid for (uid,) in db.query(GroupMember.user_id).filter(GroupMember.group_id == group_id)]
+    if current_user.id not in member_ids:
         raise HTTPException(status_code=403, detail="그룹 멤버가 아닙니다")
-    members_rows = db.query(GroupMember).filter(GroupMember.group_id == group_id).all()
-    member_ids = [m.user_id for m in members_rows]
-
-    selective_ids = db.query(TaskVisibilityFriend.task_id).filter(
-        TaskVisibilityFriend.friend_user_id == current_user.id
-    ).subquery()
-
-    tasks = db.query(Task).filter(
-        Task.user_id.in_(member_ids),
-        or_(
-            Task.visibility == "public",
-            and_(Task.visibility == "selective", Task.id.in_(selective_ids)),
-        ),
-    ).order_by(Task.start_at.asc()).all()
 
-    goals = db.query(Goal).filter(Goal.user_id.in_(member_ids)).order_by(Goal.created_at.asc()).all()
-
-    members = db.query(User).join(GroupMember, GroupMember.user_id == User.id).filter(
-        GroupMember.group_id == group_id
-    ).all()
-
-    return {
-        "tasks": [TaskOut.model_validate(t) for t in tasks],
-        "goals": [GoalOut.model_validate(g) for g in goals],
-        "members": [UserPublicOut(id=u.id, nickname=u.nickname) for u in members],
-    }
+    cache_key = None
+    if cursor is None and date_from is None and date_to is None:
+        cache_key = first_page_key(group_id, current_user.id, member_ids, limit)
+        cached = get_cached(cache_key)
+        if cached is not None:
+            body, next_cursor = cached
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+            return body
+
+    tasks, has_more = page_tasks(
+        db, current_user.id, member_ids, limit,
+        after=decode_cursor(cursor) if cursor else None, date_from=date_from, date_to=date_to,
+    )
+    body = {"tasks": [TaskOut.model_validate(t) for t in tasks], "goals": [], "members": []}
+    if cursor is None:
+        goals = db.query(Goal).filter(Goal.user_id.in_(member_ids)).order_by(Goal.created_at.asc()).all()
+        members = db.query(User).filter(User.id.in_(member_ids)).all()
+        body["goals"] = [GoalOut.model_validate(g) for g in goals]
+        body["members"] = [UserPublicOut(id=u.id, nickname=u.nickname) for u in members]
+
+    next_cursor = encode_cursor(tasks[-1].start_at, tasks[-1].id) if has_more else None
+    if cache_key is not None:
+        set_cached(cache_key, (body, next_cursor))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return body
@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from datetime import datetime, date, timezone
+from sqlalchemy import and_, func, or_
+from datetime import datetime, date, time, timedelta, timezone
 from typing import Optional, List
 import json
 
 from app.api.deps import get_db, get_current_user
+from app.api.pagination import decode_cursor, encode_cursor
 from app.models.user import User
 from app.models.log_entry import LogEntry
-from app.models.friendship import Friendship
+from app.models.activity_feed import ActivityFeedItem
 from app.schemas.log_entry import LogEntryCreate, LogEntryOut, DailyAggregateOut
+from app.services.activity_service import fan_out_log, feed_complete_since, feed_query, retract
+from app.services.friend_service import friend_ids as get_friend_ids
+from app.services.group_stats_service import on_sleep_logged
 
 router = APIRouter(prefix="/logs", tags=["logs"])
 
@@ -30,6 +34,10 @@ def create_log(
         note=payload.note,
     )
     db.add(entry)
+    db.flush()
+    if entry.type == "sleep":
+        on_sleep_logged(db, current_user.id, ts, payload.value)
+    fan_out_log(db, entry)
     db.commit()
     db.refresh(entry)
     return entry
@@ -57,29 +65,54 @@ def list_logs(
 
 @router.get("/friends", response_model=list[LogEntryOut])
 def friends_logs(
+    response: Response,
     types: Optional[List[str]] = Query(default=None),
     log_date: Optional[date] = Query(default=None),
+    cursor: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    target_date = log_date or date.today()
-    friendships = db.query(Friendship).filter(
-        or_(Friendship.user_id == current_user.id, Friendship.friend_id == current_user.id),
-        Friendship.status == "accepted",
-    ).all()
-    friend_ids = [
-        f.friend_id if f.user_id == current_user.id else f.user_id
-        for f in friendships
-    ]
-    if not friend_ids:
-        return []
-    q = db.query(LogEntry).filter(
-        LogEntry.user_id.in_(friend_ids),
-        func.date(LogEntry.timestamp) == target_date,
-    )
-    if types:
-        q = q.filter(LogEntry.type.in_(types))
-    return q.order_by(LogEntry.user_id, LogEntry.timestamp.desc()).all()
+    """
+    친구들의 그날 기록 (최신순, timestamp desc / id desc). 다음 페이지 커서는 X-Next-Cursor 헤더.
+    그날이 피드가 빠짐없이 담고 있는 구간(feed_complete_since) 안이면 내 활동 피드(kind=log)의
+    해당 날짜 범위만 읽고 원본 기록을 조인한다 — 친구 수와 관계없이 비용은 limit 에 비례.
+    그보다 오래된 날은 친구들의 원본 기록을 직접 조회한다.
+    커서는 두 경로 모두 (기록 timestamp, 기록 id) 라서 페이지 사이에 경로가 바뀌어도 이어진다.
+    """
+    day_start = datetime.combine(log_date or date.today(), time.min)
+    day_end = day_start + timedelta(days=1)
+    after = decode_cursor(cursor) if cursor else None
+
+    if day_start >= feed_complete_since(db, current_user.id):
+        ts_col, id_col = ActivityFeedItem.occurred_at, ActivityFeedItem.ref_id
+        q = (
+            feed_query(
+                db, current_user.id, LogEntry,
+                kinds=["log"], log_types=types, date_from=day_start, date_to=day_end,
+            )
+            .join(LogEntry, LogEntry.id == ActivityFeedItem.ref_id)
+        )
+    else:
+        friend_ids = list(get_friend_ids(db, current_user.id))
+        if not friend_ids:
+            return []
+        ts_col, id_col = LogEntry.timestamp, LogEntry.id
+        q = db.query(LogEntry).filter(
+            LogEntry.user_id.in_(friend_ids),
+            LogEntry.timestamp >= day_start,
+            LogEntry.timestamp < day_end,
+        )
+        if types:
+            q = q.filter(LogEntry.type.in_(types))
+    if after is not None:
+        q = q.filter(or_(ts_col < after[0], and_(ts_col == after[0], id_col < after[1])))
+    entries = q.order_by(None).order_by(ts_col.desc(), id_col.desc()).limit(limit + 1).all()
+    if len(entries) > limit:
+        entries = entries[:limit]
+        last = entries[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.timestamp, last.id)
+    return entries
 
 
 @router.delete("/{log_id}", status_code=204)
@@ -94,5 +127,8 @@ def delete_log(
     ).first()
     if not entry:
         raise HTTPException(status_code=404, detail="로그를 찾을 수 없습니다.")
+    if entry.type == "sleep":
+        on_sleep_logged(db, current_user.id, entry.timestamp, entry.value, sign=-1)
+    retract(db, "log", entry.id)
     db.delete(entry)
     db.commit()
@@ -1,16 +1,26 @@
-import json
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.api.deps import get_db, get_current_user
+from app.api.pagination import decode_cursor, encode_cursor
 from app.models.user import User
-from app.models.schedule_draft import ScheduleDraft
-from app.schemas.schedule_draft import ScheduleDraftCreate, ScheduleDraftOut, ScheduleDraftEvent
-from app.services.plan_service import generate_draft, apply_draft
+from app.models.schedule_draft import ScheduleDraft, ScheduleDraftEventRow
+from app.schemas.schedule_draft import (
+    ScheduleDraftCreate, ScheduleDraftOut, ScheduleDraftEvent, ScheduleDraftEventUpdate,
+)
+from app.services.plan_service import (
+    generate_draft, apply_draft, event_counts, event_out, list_events, parse_event_dt, replace_events,
+    update_event,
+)
+from app.services.freebusy_service import invalidate_user as invalidate_busy
+from app.services.group_feed_service import invalidate_user as invalidate_group_feed
+from app.services.recurrence_service import parse_rrule
 
 router = APIRouter(prefix="/plan", tags=["plan"])
 
+MAX_EVENT_PAGE_SIZE = 200
+
 
 @router.post("/drafts", response_model=ScheduleDraftOut)
 def create_draft(
@@ -18,15 +28,17 @@ def create_draft(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    draft = generate_draft(
+    draft, unplaced = generate_draft(
         db=db,
         user_id=current_user.id,
         plan_name=payload.plan_name,
         changes=payload.changes or {},
         horizon_days=payload.horizon_days or 7,
-        preferences=None,
+        preferences=payload.preferences,
     )
-    return _to_out(draft)
+    out = _to_out(draft, list_events(db, draft.id))
+    out.unplaced = [dt.isoformat() for dt in unplaced]
+    return out
 
 
 @router.get("/drafts", response_model=list[ScheduleDraftOut])
@@ -34,6 +46,7 @@ def list_drafts(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """최근 초안 20개 (이벤트 본문 없이 개수만)"""
     drafts = (
         db.query(ScheduleDraft)
         .filter(ScheduleDraft.user_id == current_user.id)
@@ -41,17 +54,40 @@ def list_drafts(
         .limit(20)
         .all()
     )
-    return [_to_out(d) for d in drafts]
+    counts = event_counts(db, [d.id for d in drafts])
+    return [_to_out(d, event_count=counts.get(d.id, 0)) for d in drafts]
 
 
 @router.get("/drafts/{draft_id}", response_model=ScheduleDraftOut)
 def get_draft(
     draft_id: int,
+    include_events: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """초안 정보와 이벤트 개수 — 이벤트 본문은 GET /plan/drafts/{id}/events 로 페이지 단위 조회 (include_events=true 면 전체)"""
+    draft = _get_or_404(db, draft_id, current_user.id)
+    if not include_events:
+        return _to_out(draft, event_count=event_counts(db, [draft.id]).get(draft.id, 0))
+    return _to_out(draft, list_events(db, draft.id))
+
+
+@router.get("/drafts/{draft_id}/events", response_model=list[ScheduleDraftEvent])
+def list_draft_events(
+    draft_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=MAX_EVENT_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """초안 이벤트를 (start_at, id) 순으로 페이지 단위 조회 — 다음 페이지 커서는 X-Next-Cursor 헤더"""
     draft = _get_or_404(db, draft_id, current_user.id)
-    return _to_out(draft)
+    rows = list_events(db, draft.id, after=decode_cursor(cursor) if cursor else None, limit=limit + 1)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].start_at, rows[-1].id)
+    return [event_out(r) for r in rows]
 
 
 @router.put("/drafts/{draft_id}", response_model=ScheduleDraftOut)
@@ -61,26 +97,78 @@ def update_draft(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """사용자가 편집한 이벤트 목록으로 초안 업데이트"""
+    """사용자가 편집한 이벤트 목록으로 초안 전체 교체 (한 건만 바꿀 때는 PATCH .../events/{event_id})"""
     draft = _get_or_404(db, draft_id, current_user.id)
-    draft.events = json.dumps([e.model_dump() for e in events], ensure_ascii=False)
+    _ensure_editable(draft)
+    for e in events:
+        _validate_rrule(e.rrule)
+        _normalize_times(e)
+    replace_events(db, draft, events)
     db.commit()
     db.refresh(draft)
-    return _to_out(draft)
+    return _to_out(draft, list_events(db, draft.id))
+
+
+@router.patch("/drafts/{draft_id}/events/{event_id}", response_model=ScheduleDraftEvent)
+def patch_draft_event(
+    draft_id: int,
+    event_id: int,
+    payload: ScheduleDraftEventUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """초안 이벤트 1건만 수정"""
+    row = _get_event_or_404(db, draft_id, event_id, current_user.id)
+    changes = payload.model_dump(exclude_unset=True)
+    if "title" in changes and not changes["title"]:
+        raise HTTPException(status_code=400, detail="제목을 입력해주세요.")
+    _validate_rrule(changes.get("rrule"))
+    try:
+        update_event(row, changes)
+    except ValueError as err:
+        raise HTTPException(status_code=400, detail=str(err))
+    db.commit()
+    db.refresh(row)
+    return event_out(row)
+
+
+@router.delete("/drafts/{draft_id}/events/{event_id}", status_code=204)
+def delete_draft_event(
+    draft_id: int,
+    event_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """초안 이벤트 1건 삭제"""
+    row = _get_event_or_404(db, draft_id, event_id, current_user.id)
+    db.delete(row)
+    db.commit()
 
 
 @router.post("/drafts/{draft_id}/apply")
 def apply_draft_to_calendar(
     draft_id: int,
+    idempotency_key: Optional[str] = Header(None, max_length=64),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """초안 이벤트를 Task로 일괄 등록하고 캘린더에 반영"""
+    """
+    초안 이벤트를 Task로 일괄 등록하고 캘린더에 반영.
+    Idempotency-Key 헤더가 같은 재시도는 새로 만들지 않고 처음 생성된 task_ids 를 돌려준다.
+    """
     draft = _get_or_404(db, draft_id, current_user.id)
-    if draft.status == "applied":
+    try:
+        task_ids = apply_draft(db, draft, idempotency_key)
+    except ValueError:
         raise HTTPException(status_code=400, detail="이미 적용된 초안입니다.")
-    count = apply_draft(db, draft)
-    return {"message": f"{count}개의 일정이 캘린더에 추가되었습니다.", "task_count": count}
+    invalidate_busy(current_user.id)
+    invalidate_group_feed(current_user.id)
+    count = len(task_ids)
+    return {
+        "message": f"{count}개의 일정이 캘린더에 추가되었습니다.",
+        "task_count": count,
+        "task_ids": task_ids,
+    }
 
 
 def _get_or_404(db: Session, draft_id: int, user_id: int) -> ScheduleDraft:
@@ -93,17 +181,53 @@ def _get_or_404(db: Session, draft_id: int, user_id: int) -> ScheduleDraft:
     return draft
 
 
-def _to_out(draft: ScheduleDraft) -> ScheduleDraftOut:
+def _get_event_or_404(db: Session, draft_id: int, event_id: int, user_id: int) -> ScheduleDraftEventRow:
+    """수정 / 삭제 대상 이벤트 — 이미 적용된 초안의 이벤트는 바꿀 수 없다 (400)"""
+    _ensure_editable(_get_or_404(db, draft_id, user_id))
+    row = db.query(ScheduleDraftEventRow).filter(
+        ScheduleDraftEventRow.id == event_id,
+        ScheduleDraftEventRow.draft_id == draft_id,
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="초안 이벤트를 찾을 수 없습니다.")
+    return row
+
+
+def _ensure_editable(draft: ScheduleDraft) -> None:
+    if draft.status != "draft":
+        raise HTTPException(status_code=400, detail="이미 적용된 초안입니다.")
+
+
+def _normalize_times(event: ScheduleDraftEvent) -> None:
+    """시각을 엄격히 파싱해 naive UTC ISO8601 로 맞춘다 — 형식이 틀리거나 종료 ≤ 시작이면 400"""
     try:
-        raw = json.loads(draft.events) if draft.events else []
-    except (json.JSONDecodeError, TypeError):
-        raw = []
-    events = [ScheduleDraftEvent(**e) for e in raw]
+        start_at, end_at = parse_event_dt(event.start_at), parse_event_dt(event.end_at)
+    except ValueError as err:
+        raise HTTPException(status_code=400, detail=str(err))
+    if end_at <= start_at:
+        raise HTTPException(status_code=400, detail="종료 시각은 시작 시각 이후여야 합니다.")
+    event.start_at, event.end_at = start_at.isoformat(), end_at.isoformat()
+
+
+def _validate_rrule(rrule: Optional[str]) -> None:
+    if rrule:
+        try:
+            parse_rrule(rrule)
+        except ValueError as err:
+            raise HTTPException(status_code=400, detail=f"잘못된 반복 규칙입니다: {err}")
+
+
+def _to_out(
+    draft: ScheduleDraft,
+    events: Optional[list[ScheduleDraftEventRow]] = None,
+    event_count: Optional[int] = None,
+) -> ScheduleDraftOut:
     return ScheduleDraftOut(
         id=draft.id,
         user_id=draft.user_id,
         plan_name=draft.plan_name,
-        events=events,
+        events=[event_out(e) for e in events] if events is not None else None,
+        event_count=len(events) if events is not None else (event_count or 0),
         status=draft.status,
         created_at=draft.created_at,
     )
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, selectinload
 from datetime import datetime, date, timedelta
 from typing import Optional
 
@@ -11,7 +12,14 @@ from app.models.goal import Goal
 from app.schemas.project import (
     ProjectCreate, ProjectUpdate, ProjectOut,
     ProjectTaskCreate, ProjectTaskUpdate, ProjectTaskOut, ProjectStatsOut,
+    ProjectSnapshotOut, ProjectForecastOut, TaskReorderPayload, TaskRankOut,
 )
+from app.services.activity_service import crossed_milestone, fan_out
+from app.services.burndown_service import (
+    record_task_event, delete_snapshots, get_burndown, forecast_completion,
+)
+from app.services.group_stats_service import on_project_tasks_changed
+from app.services.rank_service import next_rank, apply_moves
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -25,17 +33,16 @@ GOAL_TYPE_DAYS = {
 
 
 def _compute_stats(project: Project) -> ProjectStatsOut:
+    """프로젝트 카운터(task_total/task_done/...)만으로 계산 — 할 일을 로드하지 않는다."""
     today = date.today()
-    tasks = project.tasks
-    total = len(tasks)
-    done = [t for t in tasks if t.is_done]
-    done_count = len(done)
+    total = project.task_total
+    done_count = project.task_done
 
     completion_pct = done_count / total * 100 if total > 0 else 0
     days_elapsed = max((today - project.created_at.date()).days, 1)
     pace = done_count / days_elapsed  # tasks/day
 
-    total_est = sum(t.estimated_hours for t in tasks if t.estimated_hours) or None
+    total_est = project.estimated_hours_sum or None
 
     deadline_pct = None
     days_until_deadline = None
@@ -55,11 +62,8 @@ def _compute_stats(project: Project) -> ProjectStatsOut:
 
     # 모멘텀 하락: 최근 3일 완료한 할 일이 없고, 이미 시작된 프로젝트
     three_days_ago = today - timedelta(days=3)
-    recent_done = [
-        t for t in done
-        if t.done_at and t.done_at.date() >= three_days_ago
-    ]
-    momentum_drop = done_count > 0 and len(recent_done) == 0
+    recent_done = project.last_done_at is not None and project.last_done_at.date() >= three_days_ago
+    momentum_drop = done_count > 0 and not recent_done
 
     return ProjectStatsOut(
         total_tasks=total,
@@ -74,7 +78,26 @@ def _compute_stats(project: Project) -> ProjectStatsOut:
     )
 
 
-def _to_out(p: Project) -> ProjectOut:
+def _bump_counters(project: Project, total: int = 0, done: int = 0, est: float = 0.0) -> None:
+    """할 일 변경분을 카운터에 반영 (UPDATE ... SET col = col + n 으로 원자적 증감)"""
+    if total:
+        project.task_total = Project.task_total + total
+    if done:
+        project.task_done = Project.task_done + done
+    if est:
+        project.estimated_hours_sum = Project.estimated_hours_sum + est
+
+
+def _refresh_last_done_at(db: Session, project: Project) -> None:
+    """완료 취소/삭제로 최근 완료 시각이 바뀔 수 있을 때만 재계산"""
+    db.flush()
+    project.last_done_at = db.query(func.max(ProjectTask.done_at)).filter(
+        ProjectTask.project_id == project.id,
+        ProjectTask.is_done == True,
+    ).scalar()
+
+
+def _to_out(p: Project, include_tasks: bool = True) -> ProjectOut:
     return ProjectOut(
         id=p.id,
         user_id=p.user_id,
@@ -84,7 +107,7 @@ def _to_out(p: Project) -> ProjectOut:
         description=p.description,
         deadline=p.deadline,
         created_at=p.created_at,
-        tasks=p.tasks,
+        tasks=p.tasks if include_tasks else None,
         stats=_compute_stats(p),
     )
 
@@ -93,16 +116,20 @@ def _to_out(p: Project) -> ProjectOut:
 
 @router.get("", response_model=list[ProjectOut])
 def list_projects(
+    include_tasks: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    projects = (
+    """include_tasks=true 일 때만 할 일 목록을 함께 반환 (기본은 카운터 기반 통계만)"""
+    q = (
         db.query(Project)
+        .options(joinedload(Project.goal))
         .filter(Project.user_id == current_user.id)
         .order_by(Project.created_at.asc())
-        .all()
     )
-    return [_to_out(p) for p in projects]
+    if include_tasks:
+        q = q.options(selectinload(Project.tasks))
+    return [_to_out(p, include_tasks) for p in q.all()]
 
 
 @router.post("", response_model=ProjectOut)
@@ -163,6 +190,12 @@ def delete_project(
     ).first()
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+    on_project_tasks_changed(
+        db, current_user.id,
+        done_delta=-project.task_done,
+        total_delta=-project.task_total,
+    )
+    delete_snapshots(db, project_id)
     db.delete(project)
     db.commit()
 
@@ -187,15 +220,42 @@ def add_task(
         estimated_hours=payload.estimated_hours,
         difficulty=payload.difficulty,
         order_index=payload.order_index,
+        rank=next_rank(db, ProjectTask, ProjectTask.project_id, project_id),
         memo=payload.memo,
         deadline=payload.deadline,
     )
     db.add(task)
+    _bump_counters(project, total=1, est=payload.estimated_hours or 0.0)
+    record_task_event(db, project_id, remaining_delta=1, hours_delta=payload.estimated_hours or 0.0)
+    on_project_tasks_changed(db, current_user.id, total_delta=1)
     db.commit()
     db.refresh(task)
     return task
 
 
+@router.post("/{project_id}/tasks/reorder", response_model=list[TaskRankOut])
+def reorder_tasks(
+    project_id: int,
+    payload: TaskReorderPayload,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """드래그앤드롭 이동 일괄 적용 — 이동 1건당 옮긴 할 일 1행만 갱신"""
+    project = db.query(Project).filter(
+        Project.id == project_id, Project.user_id == current_user.id
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+    try:
+        moved = apply_moves(db, ProjectTask, ProjectTask.project_id, project_id, payload.moves)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="할 일을 찾을 수 없습니다.")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="이동 위치가 올바르지 않습니다.")
+    db.commit()
+    return moved
+
+
 @router.put("/{project_id}/tasks/{task_id}", response_model=ProjectTaskOut)
 def update_task(
     project_id: int,
@@ -216,6 +276,9 @@ def update_task(
         raise HTTPException(status_code=404, detail="할 일을 찾을 수 없습니다.")
 
     data = payload.model_dump(exclude_unset=True)
+    was_done = task.is_done
+    done_before, task_total = project.task_done, project.task_total
+    old_est = task.estimated_hours or 0.0
     if "is_done" in data:
         if data["is_done"] and not task.is_done:
             data["done_at"] = datetime.utcnow()
@@ -223,6 +286,28 @@ def update_task(
             data["done_at"] = None
     for k, v in data.items():
         setattr(task, k, v)
+
+    done_delta = int(task.is_done) - int(was_done)
+    new_est = task.estimated_hours or 0.0
+    _bump_counters(project, done=done_delta, est=new_est - old_est)
+    record_task_event(
+        db, project_id,
+        remaining_delta=-done_delta,
+        hours_delta=(0.0 if task.is_done else new_est) - (0.0 if was_done else old_est),
+        completions_delta=done_delta,
+    )
+    if done_delta > 0:
+        project.last_done_at = task.done_at
+    elif done_delta < 0:
+        _refresh_last_done_at(db, project)
+    on_project_tasks_changed(db, current_user.id, done_delta=done_delta)
+    # 카운터는 SQL 증감식이므로 읽어 둔 값 + 변경분으로 판단
+    milestone = crossed_milestone(done_before, done_before + done_delta, task_total)
+    if milestone:
+        fan_out(
+            db, current_user.id, "project_milestone", project.id, task.done_at or datetime.utcnow(),
+            summary=project.title, value=milestone,
+        )
     db.commit()
     db.refresh(task)
     return task
@@ -245,10 +330,53 @@ def delete_task(
     ).first()
     if not task:
         raise HTTPException(status_code=404, detail="할 일을 찾을 수 없습니다.")
+    on_project_tasks_changed(db, current_user.id, done_delta=-int(task.is_done), total_delta=-1)
+    _bump_counters(project, total=-1, done=-int(task.is_done), est=-(task.estimated_hours or 0.0))
+    # 삭제를 먼저 반영해야 첫 스냅샷을 만들 때 이 할 일이 남은 수에 포함되지 않는다
     db.delete(task)
+    db.flush()
+    if not task.is_done:
+        record_task_event(db, project_id, remaining_delta=-1, hours_delta=-(task.estimated_hours or 0.0))
+    if task.is_done:
+        _refresh_last_done_at(db, project)
     db.commit()
 
 
+# ── 번다운 / 완료 예측 ──────────────────────────────────────────────────────────
+
+@router.get("/{project_id}/burndown", response_model=list[ProjectSnapshotOut])
+def project_burndown(
+    project_id: int,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """일별 스냅샷 (기본: 최근 1년) — (project_id, date) 범위 조회 1번"""
+    project = db.query(Project).filter(
+        Project.id == project_id, Project.user_id == current_user.id
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+    d_to = date_to or date.today()
+    d_from = date_from or (d_to - timedelta(days=364))
+    return get_burndown(db, project_id, d_from, d_to)
+
+
+@router.get("/{project_id}/forecast", response_model=ProjectForecastOut)
+def project_forecast(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    project = db.query(Project).filter(
+        Project.id == project_id, Project.user_id == current_user.id
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+    return forecast_completion(db, project)
+
+
 # ── Twinny AI 피드백 ──────────────────────────────────────────────────────────
 
 @router.post("/{project_id}/twinny-feedback")
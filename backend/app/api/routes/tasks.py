@@ -1,29 +1,107 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, delete, or_, select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
+from app.api.pagination import decode_cursor, encode_cursor
 from app.models.task import Task
 from app.models.task_comment import TaskComment
+from app.models.task_occurrence import TaskOccurrenceOverride
+from app.models.task_participant import TaskParticipant
 from app.models.task_visibility import TaskVisibilityFriend
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskOut, TaskUpdate, TaskCommentCreate, TaskCommentOut
+from app.schemas.task import (
+    TaskCalendarItem, TaskCreate, TaskOut, TaskUpdate, TaskOccurrenceUpdate,
+    TaskParticipationUpdate, TaskParticipantOut, TaskCommentCreate, TaskCommentOut, naive_utc,
+)
+from app.services import acl_service, recurrence_service
+from app.services.activity_service import fan_out, retract
+from app.services.freebusy_service import invalidate_user as invalidate_busy
+from app.services.group_feed_service import invalidate_user as invalidate_group_feed
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+MAX_PAGE_SIZE = 500
+MAX_COMMENT_PAGE_SIZE = 100
+
 
 def _sync_visibility_friends(db: Session, task_id: int, visibility: str, user_ids: list[int]):
-    db.query(TaskVisibilityFriend).filter(TaskVisibilityFriend.task_id == task_id).delete()
-    if visibility == "selective":
-        for uid in user_ids:
-            db.add(TaskVisibilityFriend(task_id=task_id, friend_user_id=uid))
+    """selective 공개 대상 목록 — 바뀐 사용자만 추가 / 삭제"""
+    wanted = set(user_ids) if visibility == "selective" else set()
+    existing = {uid for (uid,) in db.query(TaskVisibilityFriend.friend_user_id).filter(
+        TaskVisibilityFriend.task_id == task_id
+    )}
+    if existing - wanted:
+        db.query(TaskVisibilityFriend).filter(
+            TaskVisibilityFriend.task_id == task_id,
+            TaskVisibilityFriend.friend_user_id.in_(existing - wanted),
+        ).delete(synchronize_session=False)
+    db.add_all(TaskVisibilityFriend(task_id=task_id, friend_user_id=uid) for uid in sorted(wanted - existing))
 
 
-def _get_canonical_task_id(task_id: int, db: Session) -> int:
-    """공유 복사본이면 원본 task_id 반환 (댓글은 항상 원본에 저장)"""
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if task and task.shared_from_task_id:
-        return task.shared_from_task_id
-    return task_id
+def _participating(user_id: int):
+    """내가 참여 중인 일정 ID 서브쿼리 (ix_task_participants_user)"""
+    return select(TaskParticipant.task_id).where(TaskParticipant.user_id == user_id).scalar_subquery()
+
+
+def _participant_ids(db: Session, task_id: int) -> list[int]:
+    return [uid for (uid,) in db.query(TaskParticipant.user_id).filter(TaskParticipant.task_id == task_id)]
+
+
+def _personalize(db: Session, user_id: int, items: list):
+    """참여 중인 일정은 status 를 내 참여 상태로 바꾸고 participating=True 로 표시"""
+    if not items:
+        return items
+    statuses = dict(
+        db.query(TaskParticipant.task_id, TaskParticipant.status)
+        .filter(TaskParticipant.user_id == user_id, TaskParticipant.task_id.in_({i.id for i in items}))
+        .all()
+    )
+    return [
+        i.model_copy(update={"status": statuses[i.id], "participating": True}) if i.id in statuses else i
+        for i in items
+    ]
+
+
+def _record_task_done(db: Session, task: Task, actor_id: int, was_done: bool, is_done: bool) -> None:
+    """
+    완료로 바뀌면 친구 활동 피드에 알리고, 완료가 취소되면 거둬들인다.
+    공개 범위를 따른다: public → 친구 전체, selective → 공개 대상 친구만, private → 알리지 않음.
+    """
+    if is_done and not was_done and task.visibility != "private":
+        recipients = None
+        if task.visibility == "selective":
+            recipients = [uid for (uid,) in db.query(TaskVisibilityFriend.friend_user_id).filter(
+                TaskVisibilityFriend.task_id == task.id
+            )]
+        fan_out(db, actor_id, "task_done", task.id, datetime.utcnow(), summary=task.title, recipients=recipients)
+    elif was_done and not is_done:
+        retract(db, "task_done", task.id, actor_id)
+
+
+def _set_recurrence(task: Task) -> None:
+    """rrule 검증 후 recurrence_until 계산 ("" 은 반복 해제)"""
+    if not task.rrule:
+        task.rrule = None
+        task.recurrence_until = None
+        return
+    try:
+        task.recurrence_until = recurrence_service.series_until(task.start_at, task.end_at, task.rrule)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid rrule: {e}")
+
+
+def _occurrence_out(occ: recurrence_service.Occurrence) -> TaskOut:
+    return TaskOut.model_validate(occ.task).model_copy(update={
+        "title": occ.title,
+        "start_at": occ.start_at,
+        "end_at": occ.end_at,
+        "status": occ.status,
+        "occurrence_start": occ.occurrence_start,
+    })
 
 
 # ── CRUD ────────────────────────────────────────────────────────────────────
@@ -32,41 +110,134 @@ def _get_canonical_task_id(task_id: int, db: Session) -> int:
 def create_task(payload: TaskCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     task_data = payload.model_dump(exclude={"visible_to_user_ids", "participant_ids"})
     task = Task(**task_data, user_id=current_user.id)
+    _set_recurrence(task)
     db.add(task)
     db.flush()
     _sync_visibility_friends(db, task.id, payload.visibility, payload.visible_to_user_ids)
+    if task.visibility != "private":
+        db.flush()
+        acl_service.sync_task(db, task)
 
-    # 참여자 복사본 생성 (함께 하기)
-    for uid in payload.participant_ids:
-        copy = Task(
-            user_id=uid,
-            title=task.title,
-            category=task.category,
-            expected_min=task.expected_min,
-            start_at=task.start_at,
-            end_at=task.end_at,
-            status="planned",
-            visibility="private",
-            shared_from_task_id=task.id,
-        )
-        db.add(copy)
+    # 함께 하기: 일정은 원본 1행만 두고 참여자는 task_participants 에 한 행씩
+    participant_ids = sorted(set(payload.participant_ids) - {current_user.id})
+    db.add_all(TaskParticipant(task_id=task.id, user_id=uid, status="planned") for uid in participant_ids)
 
     db.commit()
+    invalidate_busy(current_user.id, *participant_ids)
+    invalidate_group_feed(current_user.id)
     db.refresh(task)
     return task
 
 
+def _window_query(query, user_id: int, date_from: Optional[datetime], date_to: Optional[datetime]):
+    """
+    기간 [date_from, date_to) 과 겹치는 일정 (내 일정 + 참여 중인 일정).
+    단발 일정은 end_at > date_from — 길이와 관계없이 걸쳐 있는 일정을 모두 찾는다 ((user_id, end_at) 인덱스).
+    반복 일정 원본은 첫 회차의 end_at 이 아니라 마지막 회차 상한(recurrence_until)으로 판단한다.
+    """
+    query = query.filter(or_(Task.user_id == user_id, Task.id.in_(_participating(user_id))))
+    if date_from is not None:
+        query = query.filter(or_(
+            and_(Task.rrule.is_(None), Task.end_at > date_from),
+            and_(
+                Task.rrule.isnot(None),
+                or_(Task.recurrence_until.is_(None), Task.recurrence_until > date_from),
+            ),
+        ))
+    if date_to is not None:
+        query = query.filter(Task.start_at < date_to)
+    return query
+
+
 @router.get("", response_model=list[TaskOut])
-def list_tasks(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return db.query(Task).filter(Task.user_id == current_user.id).order_by(Task.start_at.asc()).all()
+def list_tasks(
+    response: Response,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    기간 파라미터가 없으면 기존처럼 전체 목록 (반복 일정은 원본 행 그대로).
+    date_from/date_to 를 모두 주면 반복 일정은 기간 안의 회차로 전개해 함께 돌려준다.
+    limit 을 주면 (start_at, id) 키셋 페이지네이션 — 다음 페이지 커서는 X-Next-Cursor 헤더로 내려준다.
+    참여 중인 다른 사람의 일정도 포함되며 status 는 내 참여 상태다.
+    """
+    date_from, date_to = naive_utc(date_from), naive_utc(date_to)
+    if date_from is not None and date_to is not None and date_to <= date_from:
+        raise HTTPException(status_code=400, detail="date_to must be after date_from")
+    expand = date_from is not None and date_to is not None
+    query = _window_query(db.query(Task), current_user.id, date_from, date_to)
+    if expand:
+        query = query.filter(Task.rrule.is_(None))
+    after = decode_cursor(cursor) if cursor else None
+    if after:
+        query = query.filter(or_(
+            Task.start_at > after[0],
+            and_(Task.start_at == after[0], Task.id > after[1]),
+        ))
+    query = query.order_by(Task.start_at.asc(), Task.id.asc())
+    rows = query.all() if limit is None else query.limit(limit + 1).all()
+    items = [TaskOut.model_validate(t) for t in rows]
+
+    if expand:
+        occurrences = recurrence_service.expand(
+            db, recurrence_service.load_recurring(db, current_user.id, date_from, date_to), date_from, date_to
+        )
+        items += [_occurrence_out(o) for o in occurrences if not after or (o.start_at, o.task.id) > after]
+        items.sort(key=lambda t: (t.start_at, t.id))
+
+    if limit is not None and len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.start_at, last.id)
+    return _personalize(db, current_user.id, items)
+
+
+@router.get("/calendar", response_model=list[TaskCalendarItem])
+def list_calendar_tasks(
+    date_from: datetime,
+    date_to: datetime,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """월간 캘린더용 경량 목록 — 필요한 컬럼만 조회하고 ORM 객체를 만들지 않는다"""
+    date_from, date_to = naive_utc(date_from), naive_utc(date_to)
+    if date_to <= date_from:
+        raise HTTPException(status_code=400, detail="date_to must be after date_from")
+    columns = db.query(
+        Task.id, Task.title, Task.category, Task.start_at, Task.end_at, Task.status,
+    )
+    rows = (
+        _window_query(columns, current_user.id, date_from, date_to)
+        .filter(Task.rrule.is_(None))
+        .all()
+    )
+    items = [TaskCalendarItem.model_validate(row._mapping) for row in rows]
+    # 반복 일정은 원본 행만 읽어 기간 안 회차로 전개
+    for occ in recurrence_service.expand(
+        db, recurrence_service.load_recurring(db, current_user.id, date_from, date_to), date_from, date_to
+    ):
+        items.append(TaskCalendarItem(
+            id=occ.task.id, title=occ.title, category=occ.task.category,
+            start_at=occ.start_at, end_at=occ.end_at, status=occ.status,
+            occurrence_start=occ.occurrence_start,
+        ))
+    items.sort(key=lambda t: (t.start_at, t.id))
+    return _personalize(db, current_user.id, items)
 
 
 @router.get("/{task_id}", response_model=TaskOut)
 def get_task(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    task = db.query(Task).filter(Task.id == task_id, Task.user_id == current_user.id).first()
+    task = db.query(Task).filter(
+        Task.id == task_id,
+        or_(Task.user_id == current_user.id, Task.id.in_(_participating(current_user.id))),
+    ).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return _personalize(db, current_user.id, [TaskOut.model_validate(task)])[0]
 
 
 @router.put("/{task_id}", response_model=TaskOut)
@@ -76,13 +247,22 @@ def update_task(task_id: int, payload: TaskUpdate, db: Session = Depends(get_db)
         raise HTTPException(status_code=404, detail="Task not found")
 
     data = payload.model_dump(exclude_unset=True, exclude={"visible_to_user_ids"})
+    was_done = task.status == "done"
     for k, v in data.items():
         setattr(task, k, v)
+    if data.keys() & {"rrule", "start_at", "end_at"}:
+        _set_recurrence(task)
 
     if payload.visible_to_user_ids is not None:
         _sync_visibility_friends(db, task_id, task.visibility, payload.visible_to_user_ids)
+    db.flush()
+    if payload.visible_to_user_ids is not None or data.keys() & {"visibility", "start_at"}:
+        acl_service.sync_task(db, task)
+    _record_task_done(db, task, current_user.id, was_done, task.status == "done")
 
     db.commit()
+    invalidate_busy(current_user.id, *_participant_ids(db, task_id))
+    invalidate_group_feed(current_user.id)
     db.refresh(task)
     return task
 
@@ -93,59 +273,223 @@ def delete_task(task_id: int, db: Session = Depends(get_db), current_user: User
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     db.query(TaskVisibilityFriend).filter(TaskVisibilityFriend.task_id == task_id).delete()
+    db.query(TaskOccurrenceOverride).filter(TaskOccurrenceOverride.task_id == task_id).delete()
+    participant_ids = _participant_ids(db, task_id)
+    db.query(TaskParticipant).filter(TaskParticipant.task_id == task_id).delete()
+    retract(db, "task_done", task_id)
+    acl_service.remove_task(db, task_id)
     db.delete(task)
     db.commit()
+    invalidate_busy(current_user.id, *participant_ids)
+    invalidate_group_feed(current_user.id)
     return {"deleted": True}
 
 
-# ── 댓글 ────────────────────────────────────────────────────────────────────
+# ── 함께하기 참여 ────────────────────────────────────────────────────────────
 
-def _can_access_task(task_id: int, user_id: int, db: Session):
-    """댓글 접근 권한: 소유자 / 공유 복사본 / 공개 일정"""
+def _get_participation(db: Session, task_id: int, user_id: int) -> TaskParticipant:
+    participation = db.query(TaskParticipant).filter(
+        TaskParticipant.task_id == task_id, TaskParticipant.user_id == user_id
+    ).first()
+    if not participation:
+        raise HTTPException(status_code=404, detail="Participation not found")
+    return participation
+
+
+@router.put("/{task_id}/participation", response_model=TaskOut)
+def update_participation(
+    task_id: int,
+    payload: TaskParticipationUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """참여 중인 일정의 내 진행 상태만 변경 (일정 자체는 소유자만 수정)"""
+    participation = _get_participation(db, task_id, current_user.id)
+    was_done = participation.status == "done"
+    participation.status = payload.status
     task = db.query(Task).filter(Task.id == task_id).first()
+    _record_task_done(db, task, current_user.id, was_done, payload.status == "done")
+    db.commit()
+    return TaskOut.model_validate(task).model_copy(update={"status": participation.status, "participating": True})
+
+
+@router.delete("/{task_id}/participation")
+def leave_task(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """함께하기 참여 취소 (원본 일정은 그대로)"""
+    db.delete(_get_participation(db, task_id, current_user.id))
+    db.commit()
+    invalidate_busy(current_user.id)
+    return {"deleted": True}
+
+
+@router.get("/{task_id}/participants", response_model=list[TaskParticipantOut])
+def list_participants(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """일정 참여자와 각자의 진행 상태 (소유자 / 참여자만 조회)"""
+    rows = (
+        db.query(TaskParticipant.user_id, User.nickname, TaskParticipant.status, TaskParticipant.joined_at)
+        .join(User, User.id == TaskParticipant.user_id)
+        .filter(TaskParticipant.task_id == task_id)
+        .order_by(TaskParticipant.joined_at.asc(), TaskParticipant.id.asc())
+        .all()
+    )
+    is_owner = db.query(Task.id).filter(Task.id == task_id, Task.user_id == current_user.id).first() is not None
+    if not is_owner and all(r.user_id != current_user.id for r in rows):
+        raise HTTPException(status_code=404, detail="Task not found")
+    return [TaskParticipantOut.model_validate(r._mapping) for r in rows]
+
+
+# ── 반복 일정 회차 ───────────────────────────────────────────────────────────
+
+def _get_occurrence_override(db: Session, task_id: int, occurrence_start: datetime, user_id: int) -> tuple[Task, TaskOccurrenceOverride]:
+    """occurrence_start 는 naive UTC 로 맞춰진 값이어야 한다 (호출부에서 naive_utc 적용)."""
+    task = db.query(Task).filter(Task.id == task_id, Task.user_id == user_id).first()
     if not task:
-        return False, None
-    if task.user_id == user_id:
-        return True, task
-    # 공유 복사본 소유자
-    copy = db.query(Task).filter(
-        Task.shared_from_task_id == task_id, Task.user_id == user_id
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.rrule or not recurrence_service.is_occurrence(task, occurrence_start):
+        raise HTTPException(status_code=404, detail="Occurrence not found")
+    override = db.query(TaskOccurrenceOverride).filter(
+        TaskOccurrenceOverride.task_id == task_id,
+        TaskOccurrenceOverride.occurrence_start == occurrence_start,
     ).first()
-    if copy:
+    if not override:
+        override = TaskOccurrenceOverride(task_id=task_id, occurrence_start=occurrence_start)
+        db.add(override)
+    return task, override
+
+
+@router.put("/{task_id}/occurrences/{occurrence_start}", response_model=TaskOut)
+def update_occurrence(
+    task_id: int,
+    occurrence_start: datetime,
+    payload: TaskOccurrenceUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """반복 일정의 한 회차만 수정 (나머지 회차는 그대로)"""
+    occurrence_start = naive_utc(occurrence_start)
+    task, override = _get_occurrence_override(db, task_id, occurrence_start, current_user.id)
+    for k, v in payload.model_dump(exclude_unset=True).items():
+        setattr(override, k, v)
+    override.is_cancelled = False
+    duration = task.end_at - task.start_at
+    start_at = override.start_at or occurrence_start
+    end_at = override.end_at or start_at + duration
+    # 마지막 회차 뒤로 옮긴 경우에도 기간 조회에서 원본 행이 걸리도록
+    if task.recurrence_until is not None and end_at > task.recurrence_until:
+        task.recurrence_until = end_at
+    db.commit()
+    invalidate_busy(current_user.id, *_participant_ids(db, task_id))
+
+    return _occurrence_out(recurrence_service.Occurrence(
+        task=task,
+        occurrence_start=occurrence_start,
+        title=override.title or task.title,
+        start_at=start_at,
+        end_at=end_at,
+        status=override.status or task.status,
+    ))
+
+
+@router.delete("/{task_id}/occurrences/{occurrence_start}")
+def cancel_occurrence(
+    task_id: int,
+    occurrence_start: datetime,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """반복 일정의 한 회차만 취소 (예외 처리)"""
+    occurrence_start = naive_utc(occurrence_start)
+    _, override = _get_occurrence_override(db, task_id, occurrence_start, current_user.id)
+    override.is_cancelled = True
+    db.commit()
+    invalidate_busy(current_user.id, *_participant_ids(db, task_id))
+    return {"deleted": True}
+
+
+# ── 댓글 ────────────────────────────────────────────────────────────────────
+
+def _can_access_task(task_id: int, user_id: int, db: Session):
+    """댓글 접근 권한: 소유자 / 참여자 / 공개 일정 — 일정과 내 참여 행을 한 번에 조회"""
+    row = (
+        db.query(Task, TaskParticipant.id)
+        .outerjoin(TaskParticipant, and_(TaskParticipant.task_id == Task.id, TaskParticipant.user_id == user_id))
+        .filter(Task.id == task_id)
+        .first()
+    )
+    if not row:
+        return False, None
+    task, participation_id = row
+    if task.user_id == user_id or participation_id is not None:
         return True, task
-    # 역방향: 내가 복사본이고 원본에 접근
-    if task.shared_from_task_id:
-        orig = db.query(Task).filter(
-            Task.id == task.shared_from_task_id, Task.user_id == user_id
-        ).first()
-        if orig:
-            return True, task
     # 공개 일정
     if task.visibility in ("public", "selective"):
         return True, task
     return False, None
 
 
+def _comment_thread_rows(db: Session, task_id: int, after_id: Optional[int], limit: Optional[int]):
+    """
+    최상위 댓글 한 페이지(id 순, limit + 1개) + 그 아래 모든 답글을
+    재귀 CTE 한 번으로 조회하고 작성자 닉네임은 조인으로 가져온다.
+    """
+    roots = select(TaskComment.id).where(TaskComment.task_id == task_id, TaskComment.parent_id.is_(None))
+    if after_id is not None:
+        roots = roots.where(TaskComment.id > after_id)
+    roots = roots.order_by(TaskComment.id.asc())
+    if limit is not None:
+        roots = roots.limit(limit + 1)
+
+    thread = select(TaskComment.id).where(TaskComment.id.in_(roots)).cte("thread", recursive=True)
+    thread = thread.union_all(
+        select(TaskComment.id)
+        .join(thread, TaskComment.parent_id == thread.c.id)
+        .where(TaskComment.task_id == task_id)
+    )
+    return (
+        db.query(
+            TaskComment.id, TaskComment.task_id, TaskComment.user_id, User.nickname,
+            TaskComment.content, TaskComment.parent_id, TaskComment.created_at,
+        )
+        .join(thread, thread.c.id == TaskComment.id)
+        .outerjoin(User, User.id == TaskComment.user_id)
+        .all()
+    )
+
+
 @router.get("/{task_id}/comments", response_model=list[TaskCommentOut])
-def list_comments(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    canonical_id = _get_canonical_task_id(task_id, db)
-    ok, _ = _can_access_task(canonical_id, current_user.id, db)
+def list_comments(
+    task_id: int,
+    response: Response,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_COMMENT_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    스레드 순서(최상위 댓글 → 그 답글들, 각각 작성 순)로 댓글 조회.
+    limit 은 최상위 댓글 개수 기준 — 다음 페이지 커서(마지막 최상위 댓글 id)는 X-Next-Cursor 헤더.
+    댓글 수와 관계없이 쿼리는 권한 확인 1번 + 스레드 조회 1번.
+    """
+    ok, _ = _can_access_task(task_id, current_user.id, db)
     if not ok:
         raise HTTPException(status_code=403, detail="이 일정에 접근할 수 없습니다.")
-    comments = (
-        db.query(TaskComment)
-        .filter(TaskComment.task_id == canonical_id)
-        .order_by(TaskComment.created_at.asc())
-        .all()
-    )
-    return [
-        TaskCommentOut(
-            id=c.id, task_id=c.task_id, user_id=c.user_id,
-            nickname=c.user.nickname if c.user else None,
-            content=c.content, parent_id=c.parent_id, created_at=c.created_at,
-        )
-        for c in comments
-    ]
+    rows = _comment_thread_rows(db, task_id, cursor, limit)
+
+    children: dict[Optional[int], list] = {}
+    for row in sorted(rows, key=lambda r: r.id):
+        children.setdefault(row.parent_id, []).append(row)
+    roots = children.get(None, [])
+    if limit is not None and len(roots) > limit:
+        roots = roots[:limit]
+        response.headers["X-Next-Cursor"] = str(roots[-1].id)
+
+    ordered = []
+    stack = list(reversed(roots))
+    while stack:
+        row = stack.pop()
+        ordered.append(TaskCommentOut.model_validate(row._mapping))
+        stack.extend(reversed(children.get(row.id, [])))
+    return ordered
 
 
 @router.post("/{task_id}/comments", response_model=TaskCommentOut)
@@ -153,14 +497,17 @@ def create_comment(
     task_id: int, body: TaskCommentCreate,
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user),
 ):
-    canonical_id = _get_canonical_task_id(task_id, db)
-    ok, _ = _can_access_task(canonical_id, current_user.id, db)
+    ok, _ = _can_access_task(task_id, current_user.id, db)
     if not ok:
         raise HTTPException(status_code=403, detail="이 일정에 댓글을 달 수 없습니다.")
     if not body.content.strip():
         raise HTTPException(status_code=400, detail="댓글 내용을 입력해주세요.")
+    if body.parent_id is not None and not db.query(TaskComment.id).filter(
+        TaskComment.id == body.parent_id, TaskComment.task_id == task_id
+    ).first():
+        raise HTTPException(status_code=400, detail="답글을 달 댓글을 찾을 수 없습니다.")
     comment = TaskComment(
-        task_id=canonical_id, user_id=current_user.id,
+        task_id=task_id, user_id=current_user.id,
         content=body.content.strip(), parent_id=body.parent_id,
     )
     db.add(comment)
@@ -178,12 +525,17 @@ def delete_comment(
     task_id: int, comment_id: int,
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user),
 ):
-    canonical_id = _get_canonical_task_id(task_id, db)
     comment = db.query(TaskComment).filter(
-        TaskComment.id == comment_id, TaskComment.task_id == canonical_id,
+        TaskComment.id == comment_id, TaskComment.task_id == task_id,
         TaskComment.user_id == current_user.id,
     ).first()
     if not comment:
         raise HTTPException(status_code=404, detail="댓글을 찾을 수 없습니다.")
-    db.delete(comment)
+    # SQLite 는 parent_id 의 ON DELETE CASCADE 를 적용하지 않으므로 답글 서브트리까지 직접 지운다
+    # (남겨두면 스레드 조회 CTE 에서 보이지 않는 고아 답글이 된다)
+    subtree = select(TaskComment.id).where(TaskComment.id == comment.id).cte("subtree", recursive=True)
+    subtree = subtree.union_all(
+        select(TaskComment.id).join(subtree, TaskComment.parent_id == subtree.c.id)
+    )
+    db.execute(delete(TaskComment).where(TaskComment.id.in_(select(subtree.c.id))))
     db.commit()
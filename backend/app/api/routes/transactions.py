@@ -1,20 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException
+import codecs
+import io
+from datetime import date
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from pydantic import ValidationError
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.api.deps import get_db, get_current_user
 from app.models.user import User
 from app.models.transaction import Transaction
-from app.schemas.transaction import TransactionCreate, TransactionOut, MonthlySummary
+from app.schemas.transaction import (
+    TransactionCreate, TransactionOut, MonthlySummary, TransactionImportProfile, TransactionImportResult,
+)
+from app.services.aggregate_service import record_spend
+from app.services.transaction_import_service import import_csv, validation_error
+from app.services.transaction_rollup_service import DEFAULT_CATEGORY, load_months, record_transaction
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+MAX_TREND_MONTHS = 240
+
+
+def _month_range(year: int, month: int) -> tuple[date, date]:
+    """[해당 월 1일, 다음 달 1일)"""
+    try:
+        first = date(year, month, 1)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 연도 / 월입니다.")
+    return first, date(year + month // 12, month % 12 + 1, 1)
+
 
 @router.get("", response_model=list[TransactionOut])
 def list_transactions(
     year: Optional[int] = None,
     month: Optional[int] = None,
-    date: Optional[str] = None,
+    date: Optional[date] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -22,8 +43,8 @@ def list_transactions(
     if date:
         q = q.filter(Transaction.date == date)
     elif year and month:
-        prefix = f"{year:04d}-{month:02d}"
-        q = q.filter(Transaction.date.like(f"{prefix}%"))
+        first, next_first = _month_range(year, month)
+        q = q.filter(Transaction.date >= first, Transaction.date < next_first)
     q = q.order_by(Transaction.date.desc(), Transaction.id.desc())
     return q.all()
 
@@ -34,10 +55,9 @@ def create_transaction(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    if body.type not in ("income", "expense", "investment"):
-        raise HTTPException(status_code=400, detail="type은 income/expense/investment 중 하나여야 합니다.")
-    if body.amount <= 0:
-        raise HTTPException(status_code=400, detail="금액은 0보다 커야 합니다.")
+    error = validation_error(body.type, body.amount)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
     tx = Transaction(
         user_id=current_user.id,
         type=body.type,
@@ -45,13 +65,44 @@ def create_transaction(
         amount=body.amount,
         category=body.category,
         memo=body.memo,
+        is_impulse=body.is_impulse and body.type == "expense",
     )
     db.add(tx)
+    record_transaction(db, tx)
+    record_spend(db, tx)
     db.commit()
     db.refresh(tx)
     return tx
 
 
+@router.post("/import", response_model=TransactionImportResult)
+def import_transactions(
+    file: UploadFile = File(...),
+    profile: Optional[str] = Form(None),  # TransactionImportProfile JSON (없으면 기본 열 이름)
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    CSV 내역 일괄 가져오기 — 한 줄씩 읽어 배치로 저장하고, 이미 가져온 행은 건너뛴다.
+    읽을 수 없는 행은 건너뛰고 failed / errors 로 알려준다.
+    """
+    try:
+        mapping = TransactionImportProfile.model_validate_json(profile) if profile else TransactionImportProfile()
+        codecs.lookup(mapping.encoding)
+    except (ValidationError, LookupError):
+        raise HTTPException(status_code=400, detail="잘못된 가져오기 프로필입니다.")
+    stream = io.TextIOWrapper(file.file, encoding=mapping.encoding, errors="replace", newline="")
+    try:
+        result = import_csv(db, current_user.id, stream, mapping)
+    except ValueError as err:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(err))
+    finally:
+        stream.detach()
+    db.commit()
+    return result
+
+
 @router.delete("/{tx_id}", status_code=204)
 def delete_transaction(
     tx_id: int,
@@ -61,6 +112,8 @@ def delete_transaction(
     tx = db.query(Transaction).filter(Transaction.id == tx_id, Transaction.user_id == current_user.id).first()
     if not tx:
         raise HTTPException(status_code=404, detail="트랜잭션을 찾을 수 없습니다.")
+    record_transaction(db, tx, sign=-1)
+    record_spend(db, tx, sign=-1)
     db.delete(tx)
     db.commit()
 
@@ -72,36 +125,64 @@ def monthly_summary(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    prefix = f"{year:04d}-{month:02d}"
-    txs = (
-        db.query(Transaction)
-        .filter(Transaction.user_id == current_user.id, Transaction.date.like(f"{prefix}%"))
+    first, next_first = _month_range(year, month)
+    # (유형, 분류) 별 합계를 DB 에서 GROUP BY — 결과 행 수는 분류 수만큼
+    category = func.coalesce(Transaction.category, DEFAULT_CATEGORY)
+    rows = (
+        db.query(Transaction.type, category, func.sum(Transaction.amount))
+        .filter(
+            Transaction.user_id == current_user.id,
+            Transaction.date >= first,
+            Transaction.date < next_first,
+        )
+        .group_by(Transaction.type, category)
         .all()
     )
 
-    total_income = sum(t.amount for t in txs if t.type == "income")
-    total_expense = sum(t.amount for t in txs if t.type == "expense")
-    total_investment = sum(t.amount for t in txs if t.type == "investment")
+    return _build_summary(year, month, rows)
+
+
+@router.get("/trend", response_model=list[MonthlySummary])
+def monthly_trend(
+    start: str = Query(..., pattern=r"^\d{4}-\d{2}$"),  # YYYY-MM
+    end: str = Query(..., pattern=r"^\d{4}-\d{2}$"),  # YYYY-MM (포함)
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """[start, end] 월별 요약 — 월 롤업에서 쿼리 1번으로 읽고, 기록 없는 달도 0 으로 채운다"""
+    first, _ = _month_range(*map(int, start.split("-")))
+    last, _ = _month_range(*map(int, end.split("-")))
+    months = (last.year - first.year) * 12 + last.month - first.month + 1
+    if months < 1:
+        raise HTTPException(status_code=400, detail="끝 월이 시작 월보다 앞섭니다.")
+    if months > MAX_TREND_MONTHS:
+        raise HTTPException(status_code=400, detail=f"최대 {MAX_TREND_MONTHS}개월까지 조회할 수 있습니다.")
 
-    expense_by_cat: dict = {}
-    for t in txs:
-        if t.type == "expense":
-            cat = t.category or "기타"
-            expense_by_cat[cat] = expense_by_cat.get(cat, 0) + t.amount
+    by_month: dict[date, list] = {}
+    for month_first, tx_type, cat, amount in load_months(db, current_user.id, first, last):
+        by_month.setdefault(month_first, []).append((tx_type, cat, amount))
+    result = []
+    for i in range(months):
+        year, month = first.year + (first.month - 1 + i) // 12, (first.month - 1 + i) % 12 + 1
+        result.append(_build_summary(year, month, by_month.get(date(year, month, 1), [])))
+    return result
 
-    income_by_cat: dict = {}
-    for t in txs:
-        if t.type == "income":
-            cat = t.category or "기타"
-            income_by_cat[cat] = income_by_cat.get(cat, 0) + t.amount
 
+def _build_summary(year: int, month: int, rows) -> MonthlySummary:
+    """(유형, 분류, 합계) 행들 → 월 요약"""
+    totals = {"income": 0.0, "expense": 0.0, "investment": 0.0}
+    by_cat: dict[str, dict] = {"income": {}, "expense": {}}
+    for tx_type, cat, amount in rows:
+        totals[tx_type] = totals.get(tx_type, 0.0) + amount
+        if tx_type in by_cat:
+            by_cat[tx_type][cat] = amount
     return MonthlySummary(
         year=year,
         month=month,
-        total_income=total_income,
-        total_expense=total_expense,
-        total_investment=total_investment,
-        net_savings=total_income - total_expense - total_investment,
-        expense_by_category=expense_by_cat,
-        income_by_category=income_by_cat,
+        total_income=totals["income"],
+        total_expense=totals["expense"],
+        total_investment=totals["investment"],
+        net_savings=totals["income"] - totals["expense"] - totals["investment"],
+        expense_by_category=by_cat["expense"],
+        income_by_category=by_cat["income"],
     )
@@ -7,6 +7,13 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 43200  # 30일
 
+    # 주기 작업 (app/services/scheduler.py)
+    BACKGROUND_JOBS_ENABLED: bool = True
+    GROUP_STATS_RECONCILE_MINUTES: int = 60
+    GROUP_TASK_OVERDUE_SWEEP_MINUTES: int = 10
+    TASK_RANK_REBALANCE_MINUTES: int = 30
+    ACTIVITY_FEED_TRIM_MINUTES: int = 60
+
     class Config:
         env_file = ".env"
         extra = "ignore"
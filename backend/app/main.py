@@ -1,12 +1,27 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text, inspect
 
+from app.core.config import settings
 from app.db.session import engine
 from app.db.base import Base
+from app.services.scheduler import register_job, start_jobs, stop_jobs
+from app.services.group_stats_service import rebuild_sleep_days, reconcile_group_stats
+from app.services.overdue_service import sweep_overdue_group_tasks
+from app.services.rank_service import rebalance_task_ranks, spread_keys
+from app.services.activity_service import BACKFILL_DAYS, trim_feeds
+from app.services.plan_service import event_row
+from app.services.user_search_service import ensure_nickname_index
+from app.services.transaction_rollup_service import rebuild_statement as rollup_rebuild_statement
+from app.services.aggregate_service import rebuild_spend_aggregates
+from app.services.burndown_service import backfill_snapshots
 
 from app.api.routes.auth import router as auth_router
 from app.api.routes.tasks import router as tasks_router
@@ -23,6 +38,8 @@ from app.api.routes.projects import router as projects_router
 from app.api.routes.group_goals import router as group_goals_router
 from app.api.routes.group_projects import router as group_projects_router
 from app.api.routes.group_stats import router as group_stats_router
+from app.api.routes.freebusy import router as freebusy_router
+from app.api.routes.activity import router as activity_router
 
 # 모델 import (테이블 생성에 필요)
 from app.models.user import User  # noqa: F401
@@ -31,19 +48,35 @@ from app.models.goal import Goal  # noqa: F401
 from app.models.friendship import Friendship  # noqa: F401
 from app.models.group import Group, GroupMember  # noqa: F401
 from app.models.task_visibility import TaskVisibilityFriend  # noqa: F401
+from app.models.task_occurrence import TaskOccurrenceOverride  # noqa: F401
+from app.models.task_participant import TaskParticipant  # noqa: F401
+from app.models.task_acl import TaskAclEntry  # noqa: F401
 from app.models.log_entry import LogEntry  # noqa: F401
 from app.models.daily_aggregate import DailyAggregate  # noqa: F401
 from app.models.life_score import LifeScore  # noqa: F401
-from app.models.schedule_draft import ScheduleDraft  # noqa: F401
+from app.models.schedule_draft import ScheduleDraft, ScheduleDraftEventRow  # noqa: F401
 from app.models.transaction import Transaction  # noqa: F401
+from app.models.transaction_rollup import TransactionRollup  # noqa: F401
 from app.models.task_comment import TaskComment  # noqa: F401
 from app.models.project import Project  # noqa: F401
 from app.models.project_task import ProjectTask  # noqa: F401
 from app.models.group_goal import GroupGoal  # noqa: F401
 from app.models.group_project import GroupProject  # noqa: F401
 from app.models.group_project_task import GroupProjectTask  # noqa: F401
+from app.models.group_stats_rollup import GroupStatsRollup  # noqa: F401
+from app.models.sleep_day_rollup import SleepDayRollup  # noqa: F401
+from app.models.project_snapshot import ProjectDailySnapshot  # noqa: F401
+from app.models.activity_feed import ActivityFeedItem  # noqa: F401
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = start_jobs() if settings.BACKGROUND_JOBS_ENABLED else []
+    yield
+    await stop_jobs(tasks)
 
-app = FastAPI(title="Time Twin API")
+
+app = FastAPI(title="Time Twin API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -54,6 +87,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 키셋 페이지네이션 다음 페이지 커서 (app/api/pagination.py)
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -79,6 +114,12 @@ def _run_migrations():
             if "shared_from_task_id" not in cols:
                 conn.execute(text("ALTER TABLE tasks ADD COLUMN shared_from_task_id INTEGER REFERENCES tasks(id)"))
                 conn.commit()
+            if "rrule" not in cols:
+                conn.execute(text("ALTER TABLE tasks ADD COLUMN rrule VARCHAR(200)"))
+                conn.commit()
+            if "recurrence_until" not in cols:
+                conn.execute(text("ALTER TABLE tasks ADD COLUMN recurrence_until TIMESTAMP"))
+                conn.commit()
 
         # project_tasks 테이블에 memo, deadline 컬럼 추가
         if "project_tasks" in existing_tables:
@@ -90,9 +131,343 @@ def _run_migrations():
                 conn.execute(text("ALTER TABLE project_tasks ADD COLUMN deadline VARCHAR(10)"))
                 conn.commit()
 
+        # groups 테이블에 멤버 수 카운터 추가 후 기존 멤버로 채우기
+        if "groups" in existing_tables:
+            cols = [c["name"] for c in inspector.get_columns("groups")]
+            if "member_count" not in cols:
+                conn.execute(text("ALTER TABLE groups ADD COLUMN member_count INTEGER NOT NULL DEFAULT 0"))
+                conn.execute(text("""
+                    UPDATE groups SET
+                      member_count = (SELECT COUNT(*) FROM group_members m WHERE m.group_id = groups.id)
+                """))
+                conn.commit()
+
+        # projects 테이블에 할 일 진행 카운터 추가 후 기존 할 일로 채우기
+        if "projects" in existing_tables:
+            cols = [c["name"] for c in inspector.get_columns("projects")]
+            if "task_total" not in cols:
+                conn.execute(text("ALTER TABLE projects ADD COLUMN task_total INTEGER NOT NULL DEFAULT 0"))
+                conn.execute(text("ALTER TABLE projects ADD COLUMN task_done INTEGER NOT NULL DEFAULT 0"))
+                conn.execute(text("ALTER TABLE projects ADD COLUMN estimated_hours_sum FLOAT NOT NULL DEFAULT 0"))
+                conn.execute(text("ALTER TABLE projects ADD COLUMN last_done_at TIMESTAMP"))
+                conn.execute(text("""
+                    UPDATE projects SET
+                      task_total = (SELECT COUNT(*) FROM project_tasks t WHERE t.project_id = projects.id),
+                      task_done = (SELECT COUNT(*) FROM project_tasks t
+                                   WHERE t.project_id = projects.id AND t.is_done),
+                      estimated_hours_sum = (SELECT COALESCE(SUM(t.estimated_hours), 0) FROM project_tasks t
+                                             WHERE t.project_id = projects.id),
+                      last_done_at = (SELECT MAX(t.done_at) FROM project_tasks t
+                                      WHERE t.project_id = projects.id AND t.is_done)
+                """))
+                conn.commit()
+
+        # project_tasks / group_project_tasks 에 분수 랭크 키 추가 후 기존 order_index 순서로 채우기
+        for table, parent_col, index_name in (
+            ("project_tasks", "project_id", "ix_project_tasks_rank"),
+            ("group_project_tasks", "group_project_id", "ix_gpt_rank"),
+        ):
+            if table not in existing_tables:
+                continue
+            cols = [c["name"] for c in inspector.get_columns(table)]
+            if "rank" not in cols:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN rank VARCHAR(64) NOT NULL DEFAULT ''"))
+                rows = conn.execute(text(
+                    f"SELECT id, {parent_col} FROM {table} ORDER BY {parent_col}, order_index, id"
+                )).all()
+                by_parent: dict[int, list[int]] = {}
+                for task_id, parent_id in rows:
+                    by_parent.setdefault(parent_id, []).append(task_id)
+                updates = [
+                    {"id": task_id, "rank": key}
+                    for ids in by_parent.values()
+                    for task_id, key in zip(ids, spread_keys(len(ids)))
+                ]
+                if updates:
+                    conn.execute(text(f"UPDATE {table} SET rank = :rank WHERE id = :id"), updates)
+                conn.commit()
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON {table} ({parent_col}, rank)"
+            ))
+            conn.commit()
+
+        # schedule_drafts 테이블에 적용 멱등 키 / 생성된 Task ID 컬럼 추가
+        if "schedule_drafts" in existing_tables:
+            cols = [c["name"] for c in inspector.get_columns("schedule_drafts")]
+            if "apply_key" not in cols:
+                conn.execute(text("ALTER TABLE schedule_drafts ADD COLUMN apply_key VARCHAR(64)"))
+                conn.commit()
+            if "applied_task_ids" not in cols:
+                conn.execute(text("ALTER TABLE schedule_drafts ADD COLUMN applied_task_ids TEXT"))
+                conn.commit()
+
+            # 초안 이벤트 JSON → schedule_draft_events 행으로 이전
+            if "schedule_draft_events" not in existing_tables:
+                ScheduleDraftEventRow.__table__.create(bind=conn)
+                drafts = conn.execute(text("SELECT id, events FROM schedule_drafts")).all()
+                for draft_id, raw in drafts:
+                    try:
+                        events = json.loads(raw or "[]")
+                    except (json.JSONDecodeError, TypeError):
+                        events = []
+                    rows = [event_row(draft_id, ev) for ev in events if ev.get("title")]
+                    if rows:
+                        conn.execute(ScheduleDraftEventRow.__table__.insert(), rows)
+                conn.execute(text("UPDATE schedule_drafts SET events = '[]'"))
+                conn.commit()
+
+        # tasks 캘린더 기간 조회 인덱스
+        if "tasks" in existing_tables:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_user_start ON tasks (user_id, start_at)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_user_end ON tasks (user_id, end_at)"))
+            conn.commit()
+
+        # 함께하기 복사본(shared_from_task_id) → task_participants 행으로 이전 후 복사본 삭제
+        if "tasks" in existing_tables and "task_participants" not in existing_tables:
+            TaskParticipant.__table__.create(bind=conn)
+            conn.execute(text("""
+                INSERT INTO task_participants (task_id, user_id, status, joined_at)
+                SELECT shared_from_task_id, user_id, MAX(status), MIN(created_at)
+                FROM tasks
+                WHERE shared_from_task_id IS NOT NULL
+                  AND shared_from_task_id IN (SELECT id FROM tasks)
+                GROUP BY shared_from_task_id, user_id
+            """))
+            copies = "SELECT id FROM tasks WHERE shared_from_task_id IS NOT NULL"
+            for table in ("task_visibility_friends", "task_occurrence_overrides", "task_comments"):
+                if table in existing_tables:
+                    conn.execute(text(f"DELETE FROM {table} WHERE task_id IN ({copies})"))
+            conn.execute(text("DELETE FROM tasks WHERE shared_from_task_id IS NOT NULL"))
+            conn.commit()
+
+        # task_comments 스레드 조회 인덱스
+        if "task_comments" in existing_tables:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_task_comments_thread ON task_comments (task_id, parent_id)"
+            ))
+            conn.commit()
+
+        # 일정 공개 범위 ACL — public 은 친구 전원, selective 는 선택된 사용자로 펼치기
+        if "task_acl" not in existing_tables and "tasks" in existing_tables and "friendships" in existing_tables:
+            TaskAclEntry.__table__.create(bind=conn)
+            conn.execute(text("""
+                INSERT INTO task_acl (viewer_id, task_id, owner_id, start_at)
+                SELECT DISTINCT CASE WHEN f.user_id = t.user_id THEN f.friend_id ELSE f.user_id END,
+                       t.id, t.user_id, t.start_at
+                FROM tasks t
+                JOIN friendships f
+                  ON f.status = 'accepted' AND (f.user_id = t.user_id OR f.friend_id = t.user_id)
+                WHERE t.visibility = 'public'
+            """))
+            if "task_visibility_friends" in existing_tables:
+                conn.execute(text("""
+                    INSERT INTO task_acl (viewer_id, task_id, owner_id, start_at)
+                    SELECT DISTINCT v.friend_user_id, t.id, t.user_id, t.start_at
+                    FROM task_visibility_friends v
+                    JOIN tasks t ON t.id = v.task_id
+                    WHERE t.visibility = 'selective' AND v.friend_user_id != t.user_id
+                """))
+            conn.commit()
+
+        # 친구 활동 피드 — 최근 기록을 친구들 피드로 채워 넣기
+        if (
+            "activity_feed_items" not in existing_tables
+            and "log_entries" in existing_tables
+            and "friendships" in existing_tables
+        ):
+            ActivityFeedItem.__table__.create(bind=conn)
+            conn.execute(text("""
+                INSERT INTO activity_feed_items
+                  (owner_id, actor_id, kind, ref_id, log_type, summary, value, occurred_at, created_at)
+                SELECT CASE WHEN f.user_id = l.user_id THEN f.friend_id ELSE f.user_id END,
+                       l.user_id, 'log', l.id, l.type, l.note, l.value, l.timestamp, :now
+                FROM log_entries l
+                JOIN friendships f
+                  ON f.status = 'accepted' AND (f.user_id = l.user_id OR f.friend_id = l.user_id)
+                WHERE l.timestamp >= :since
+            """), {"now": datetime.utcnow(), "since": datetime.utcnow() - timedelta(days=BACKFILL_DAYS)})
+            conn.commit()
+
+        # activity_feed_items.summary 를 LogEntry.note 길이(500)에 맞추기 (SQLite 는 길이를 강제하지 않음)
+        if "activity_feed_items" in existing_tables and engine.dialect.name != "sqlite":
+            summary_col = next(c for c in inspector.get_columns("activity_feed_items") if c["name"] == "summary")
+            if (getattr(summary_col["type"], "length", None) or 500) < 500:
+                conn.execute(text("ALTER TABLE activity_feed_items ALTER COLUMN summary TYPE VARCHAR(500)"))
+                conn.commit()
+
+        # transactions.date 문자열(YYYY-MM-DD) → DATE 컬럼 + (user_id, date, type) 인덱스
+        transactions_rebuilt = False
+        if "transactions" in existing_tables:
+            date_col = next(c for c in inspector.get_columns("transactions") if c["name"] == "date")
+            if not str(date_col["type"]).upper().startswith("DATE"):
+                if engine.dialect.name == "sqlite":
+                    # SQLite 는 컬럼 타입 변경이 안 되므로 새 테이블로 옮겨 담는다
+                    # (날짜로 읽을 수 없는 값은 생성일로 대체)
+                    for idx in inspector.get_indexes("transactions"):
+                        conn.execute(text(f"DROP INDEX IF EXISTS {idx['name']}"))
+                    conn.execute(text("ALTER TABLE transactions RENAME TO transactions_old"))
+                    Transaction.__table__.create(bind=conn)
+                    conn.execute(text("""
+                        INSERT INTO transactions (id, user_id, type, date, amount, category, memo, created_at)
+                        SELECT id, user_id, type,
+                               COALESCE(date(substr(date, 1, 10)), date(created_at), date('now')),
+                               amount, category, memo, created_at
+                        FROM transactions_old
+                    """))
+                    conn.execute(text("DROP TABLE transactions_old"))
+                    transactions_rebuilt = True
+                else:
+                    conn.execute(text("ALTER TABLE transactions ALTER COLUMN date TYPE DATE USING date::date"))
+                    conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS ix_transactions_user_date_type "
+                        "ON transactions (user_id, date, type)"
+                    ))
+                conn.commit()
+
+        # transactions 에 CSV 가져오기 중복 제거용 content_hash 추가
+        # (위에서 테이블을 새로 만들었을 수 있으므로 컬럼은 새로 조회)
+        if "transactions" in existing_tables:
+            cols = [c["name"] for c in inspect(conn).get_columns("transactions")]
+            if "content_hash" not in cols:
+                conn.execute(text("ALTER TABLE transactions ADD COLUMN content_hash VARCHAR(64)"))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_transactions_user_content_hash "
+                "ON transactions (user_id, content_hash)"
+            ))
+            conn.commit()
+
+        # 소비 기록 일원화 (1) transactions.is_impulse 추가
+        # (위 SQLite 재생성에서는 새 테이블에 이미 들어 있다 — 그 경우도 처음 추가된 것으로 본다)
+        impulse_added = transactions_rebuilt
+        if "transactions" in existing_tables:
+            cols = [c["name"] for c in inspect(conn).get_columns("transactions")]
+            if "is_impulse" not in cols:
+                conn.execute(text("ALTER TABLE transactions ADD COLUMN is_impulse BOOLEAN NOT NULL DEFAULT FALSE"))
+                impulse_added = True
+            conn.commit()
+
+        # 소비 기록 일원화 (2) spend 로그 → 지출 트랜잭션
+        # 컬럼 유무가 아니라 옮길 spend 로그가 남아 있는지로 판단한다
+        spend_migrated = False
+        if "log_entries" in existing_tables and conn.execute(text(
+            "SELECT 1 FROM log_entries WHERE type = 'spend' AND value > 0 LIMIT 1"
+        )).first():
+            if "transactions" not in existing_tables:
+                Transaction.__table__.create(bind=conn)
+            # 이미 있던 지출만 이중 입력 후보 — 이 루프가 넣은 행과는 맞추지 않는다
+            max_tx_id = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM transactions")).scalar()
+            spend_logs = conn.execute(text(
+                "SELECT id, user_id, timestamp, value, meta, note FROM log_entries "
+                "WHERE type = 'spend' AND value > 0 ORDER BY id"
+            )).all()
+            consumed: set[int] = set()   # 로그 하나를 이미 흡수한 기존 지출
+            moved: list[int] = []        # 옮기거나 1:1 로 맞춘 로그 id — 이것만 지운다
+            inserted = 0
+            for log_id, uid, ts, value, meta, note in spend_logs:
+                try:
+                    meta = json.loads(meta) if meta else {}
+                except (json.JSONDecodeError, TypeError):
+                    meta = {}
+                day = str(ts)[:10]
+                is_impulse = bool(meta.get("is_impulse"))
+                # 같은 날 같은 금액의 기존 지출이 남아 있으면 이중 입력으로 보고 충동 여부만 옮긴다
+                candidates = conn.execute(text(
+                    "SELECT id FROM transactions WHERE user_id = :uid AND type = 'expense' "
+                    "AND date = :day AND amount = :amount AND id <= :max_id ORDER BY id"
+                ), {"uid": uid, "day": day, "amount": value, "max_id": max_tx_id}).scalars()
+                match = next((tx_id for tx_id in candidates if tx_id not in consumed), None)
+                if match is not None:
+                    consumed.add(match)
+                    if is_impulse:
+                        conn.execute(text("UPDATE transactions SET is_impulse = TRUE WHERE id = :id"), {"id": match})
+                else:
+                    conn.execute(text(
+                        "INSERT INTO transactions (user_id, type, date, amount, category, memo, is_impulse, created_at) "
+                        "VALUES (:uid, 'expense', :day, :amount, :category, :memo, :impulse, :ts)"
+                    ), {"uid": uid, "day": day, "amount": value, "category": meta.get("category"),
+                        "memo": note, "impulse": is_impulse, "ts": ts})
+                    inserted += 1
+                moved.append(log_id)
+
+            # 옮긴 행 수를 확인한 뒤에만 원본 로그를 지운다 — 어긋나면 전부 되돌리고 로그를 남겨 둔다
+            copied = conn.execute(text("SELECT COUNT(*) FROM transactions WHERE id > :max_id"),
+                                  {"max_id": max_tx_id}).scalar()
+            if copied != inserted:
+                conn.rollback()
+            else:
+                for i in range(0, len(moved), 500):
+                    chunk = moved[i:i + 500]
+                    params = {f"id{k}": log_id for k, log_id in enumerate(chunk)}
+                    placeholders = ", ".join(f":{key}" for key in params)
+                    if "activity_feed_items" in existing_tables:
+                        conn.execute(text(
+                            f"DELETE FROM activity_feed_items WHERE kind = 'log' AND ref_id IN ({placeholders})"
+                        ), params)
+                    conn.execute(text(f"DELETE FROM log_entries WHERE id IN ({placeholders})"), params)
+                if "transaction_rollups" in existing_tables:
+                    conn.execute(text("DELETE FROM transaction_rollups"))
+                    conn.execute(rollup_rebuild_statement(engine.dialect.name))
+                conn.commit()
+                spend_migrated = True
+
+        # 소비 기록 일원화 (3) spend 일 집계를 지출 트랜잭션에서 다시 만든다
+        if (impulse_added or spend_migrated) and "daily_aggregates" in existing_tables:
+            rebuild_spend_aggregates(conn)
+            conn.commit()
+
+        # 가계부 월별 롤업 — 기존 트랜잭션으로 채우기
+        if "transactions" in existing_tables and "transaction_rollups" not in existing_tables:
+            TransactionRollup.__table__.create(bind=conn)
+            conn.execute(rollup_rebuild_statement(engine.dialect.name))
+            conn.commit()
+
+        # 그룹 통계 수면 합계: group_stats_rollup.sleep_buckets(JSON) → 사용자 × 일자 행
+        if "log_entries" in existing_tables and "sleep_day_rollups" not in existing_tables:
+            SleepDayRollup.__table__.create(bind=conn)
+            rebuild_sleep_days(conn)
+            conn.commit()
+        # 부모 댓글만 지워져 남은 고아 답글 정리 (스레드 조회에서 보이지 않는다) — 손자 답글까지 반복
+        if "task_comments" in existing_tables:
+            while conn.execute(text("""
+                DELETE FROM task_comments
+                WHERE parent_id IS NOT NULL AND parent_id NOT IN (SELECT id FROM task_comments)
+            """)).rowcount:
+                pass
+            conn.commit()
+
+        # 더 이상 쓰지 않는 group_stats_rollup.sleep_buckets (NOT NULL) 컬럼 제거
+        if "group_stats_rollup" in existing_tables:
+            cols = [c["name"] for c in inspector.get_columns("group_stats_rollup")]
+            if "sleep_buckets" in cols:
+                conn.execute(text("ALTER TABLE group_stats_rollup DROP COLUMN sleep_buckets"))
+                conn.commit()
+
+        # 프로젝트 번다운 — 배포 전부터 있던 프로젝트는 첫 스냅샷 이전 날짜를 할 일 이력으로 채운다
+        if "project_tasks" in existing_tables:
+            if "project_daily_snapshots" not in existing_tables:
+                ProjectDailySnapshot.__table__.create(bind=conn)
+            backfill_snapshots(conn)
+            conn.commit()
+
+        # group_project_tasks 마감 초과 스윕 인덱스
+        if "group_project_tasks" in existing_tables:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_gpt_overdue_sweep "
+                "ON group_project_tasks (deadline, is_done, overdue_recorded)"
+            ))
+            conn.commit()
+
 
 _run_migrations()
 Base.metadata.create_all(bind=engine)
+ensure_nickname_index(engine)
+
+# 주기 작업 등록 (시작 직후 1회 실행 후 간격마다 반복)
+register_job("group_stats_reconcile", settings.GROUP_STATS_RECONCILE_MINUTES * 60, reconcile_group_stats)
+register_job("group_task_overdue_sweep", settings.GROUP_TASK_OVERDUE_SWEEP_MINUTES * 60, sweep_overdue_group_tasks)
+register_job("task_rank_rebalance", settings.TASK_RANK_REBALANCE_MINUTES * 60, rebalance_task_ranks)
+register_job("activity_feed_trim", settings.ACTIVITY_FEED_TRIM_MINUTES * 60, trim_feeds)
 
 
 @app.get("/health")
@@ -115,3 +490,5 @@ app.include_router(projects_router)
 app.include_router(group_goals_router)
 app.include_router(group_projects_router)
 app.include_router(group_stats_router)
+app.include_router(freebusy_router)
+app.include_router(activity_router)
@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ActivityFeedItem(Base):
+    """
+    친구 활동 타임라인 항목 — 쓰기 시점에 친구마다 한 행씩 복제(fan-out-on-write)
+    owner 의 피드는 (owner_id, occurred_at, id) 인덱스 범위만 읽으면 된다.
+    """
+    __tablename__ = "activity_feed_items"
+    __table_args__ = (
+        Index("ix_activity_feed_owner_time", "owner_id", "occurred_at", "id"),
+        Index("ix_activity_feed_ref", "kind", "ref_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # 피드 주인
+    actor_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # 활동한 친구
+    # log | task_done | project_milestone
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    ref_id: Mapped[int] = mapped_column(Integer, nullable=False)  # LogEntry / Task / Project id
+    log_type: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    summary: Mapped[str | None] = mapped_column(String(500), nullable=True)  # LogEntry.note / 제목 사본
+    value: Mapped[float | None] = mapped_column(Float, nullable=True)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
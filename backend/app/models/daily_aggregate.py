@@ -4,7 +4,7 @@ from app.db.base import Base
 
 
 class DailyAggregate(Base):
-    """날짜 × 타입 단위 집계 캐시 (LogEntry → 집계)"""
+    """날짜 × 타입 단위 집계 캐시 (LogEntry → 집계, spend 는 지출 Transaction → 집계)"""
     __tablename__ = "daily_aggregates"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -22,7 +22,7 @@ class DailyAggregate(Base):
     # sleep  → {"avg_quality": float}
     # study  → {"concentration_avg": float, "subjects": [...]}
     # health → {"has_exercise": bool, "total_duration_min": int, "exercise_types": [...]}
-    # spend  → {"impulse_ratio": float, "categories": {...}}
+    # spend  → {"impulse_ratio": float, "savings_ratio": float, "impulse_count": int, "categories": {...}}
     # mood   → {"emotion_counts": {...}}
     meta_summary = Column(Text, nullable=True)
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,6 +12,8 @@ class Group(Base):
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(60), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # 멤버 수 (가입 / 탈퇴 시 같은 트랜잭션에서 증감)
+    member_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     owner = relationship("User", back_populates="owned_groups")
     members = relationship("GroupMember", back_populates="group", cascade="all, delete-orphan")
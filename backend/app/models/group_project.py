@@ -23,5 +23,5 @@ class GroupProject(Base):
         "GroupProjectTask",
         back_populates="project",
         cascade="all, delete-orphan",
-        order_by="GroupProjectTask.order_index",
+        order_by="GroupProjectTask.rank",
     )
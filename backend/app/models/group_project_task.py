@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -7,6 +7,11 @@ from app.db.base import Base
 
 class GroupProjectTask(Base):
     __tablename__ = "group_project_tasks"
+    __table_args__ = (
+        # 마감 초과 스윕 (services/overdue_service.py) 용
+        Index("ix_gpt_overdue_sweep", "deadline", "is_done", "overdue_recorded"),
+        Index("ix_gpt_rank", "group_project_id", "rank"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     group_project_id: Mapped[int] = mapped_column(
@@ -17,7 +22,8 @@ class GroupProjectTask(Base):
     deadline: Mapped[str] = mapped_column(String(20), nullable=True)
     is_done: Mapped[bool] = mapped_column(Boolean, default=False)
     done_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    order_index: Mapped[int] = mapped_column(Integer, default=0)
+    order_index: Mapped[int] = mapped_column(Integer, default=0)  # 레거시 — 정렬은 rank 사용
+    rank: Mapped[str] = mapped_column(String(64), nullable=False)  # 분수 랭크 키 (services/rank_service.py)
     overdue_recorded: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class GroupStatsRollup(Base):
+    """그룹 × 멤버 단위 통계 캐시 (LogEntry / ProjectTask → 증분 반영)"""
+    __tablename__ = "group_stats_rollup"
+    __table_args__ = (
+        UniqueConstraint("group_id", "user_id", name="uq_group_stats_rollup"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    group_id: Mapped[int] = mapped_column(ForeignKey("groups.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # 개인 프로젝트 태스크 완료 수 / 전체 수
+    project_done_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    project_total_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
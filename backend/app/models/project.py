@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -14,6 +14,13 @@ class Project(Base):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     deadline: Mapped[str | None] = mapped_column(String(10), nullable=True)  # YYYY-MM-DD
+
+    # 할 일 진행 카운터 (projects 라우트의 할 일 추가/수정/삭제에서 함께 갱신)
+    task_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    task_done: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    estimated_hours_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
+    last_done_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -21,5 +28,5 @@ class Project(Base):
     goal = relationship("Goal", back_populates="projects")
     tasks = relationship(
         "ProjectTask", back_populates="project", cascade="all, delete-orphan",
-        order_by="ProjectTask.order_index",
+        order_by="ProjectTask.rank",
     )
@@ -0,0 +1,25 @@
+from datetime import date
+from sqlalchemy import Date, Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ProjectDailySnapshot(Base):
+    """프로젝트 × 날짜 번다운 스냅샷 (할 일 완료/취소/추가/삭제 시 당일 행 증분 갱신)"""
+    __tablename__ = "project_daily_snapshots"
+    __table_args__ = (
+        # (project_id, date) 범위 조회 = 번다운 1년치도 인덱스 범위 스캔 1번
+        UniqueConstraint("project_id", "date", name="uq_project_snapshot_day"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    remaining_tasks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    remaining_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # 당일 순완료 수 (완료 - 완료 취소)
+    completions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
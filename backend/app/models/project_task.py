@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -7,6 +7,9 @@ from app.db.base import Base
 
 class ProjectTask(Base):
     __tablename__ = "project_tasks"
+    __table_args__ = (
+        Index("ix_project_tasks_rank", "project_id", "rank"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     project_id: Mapped[int] = mapped_column(
@@ -17,7 +20,8 @@ class ProjectTask(Base):
     difficulty: Mapped[int | None] = mapped_column(Integer, nullable=True)  # 1-5
     is_done: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     done_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    order_index: Mapped[int] = mapped_column(Integer, default=0)
+    order_index: Mapped[int] = mapped_column(Integer, default=0)  # 레거시 — 정렬은 rank 사용
+    rank: Mapped[str] = mapped_column(String(64), nullable=False)  # 분수 랭크 키 (services/rank_service.py)
     memo: Mapped[str | None] = mapped_column(Text, nullable=True)
     deadline: Mapped[str | None] = mapped_column(String(10), nullable=True)  # YYYY-MM-DD
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
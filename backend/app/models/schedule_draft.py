@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -12,14 +12,35 @@ class ScheduleDraft(Base):
 
     plan_name = Column(String(100), nullable=False)
 
-    # JSON list of event objects:
-    # [{"title": str, "category": str, "start_at": ISO8601, "end_at": ISO8601,
-    #   "note": str, "status": "planned"}]
+    # (구) 이벤트 JSON 목록 — 이벤트는 schedule_draft_events 로 옮겨졌고 새 초안은 "[]" 로 남는다
     events = Column(Text, nullable=False, default="[]")
 
     # draft → applied
     status = Column(String(10), nullable=False, default="draft")
 
+    # 적용 요청의 Idempotency-Key 와 그때 생성된 Task ID (JSON list) — 같은 키로 재시도하면 그대로 돌려준다
+    apply_key = Column(String(64), nullable=True)
+    applied_task_ids = Column(Text, nullable=True)
+
     created_at = Column(DateTime, default=func.now())
 
     user = relationship("User", back_populates="schedule_drafts")
+
+
+class ScheduleDraftEventRow(Base):
+    """초안 이벤트 1건 (초안별로 (start_at, id) 순 조회 / 이벤트 단위 수정)"""
+    __tablename__ = "schedule_draft_events"
+    __table_args__ = (
+        Index("ix_schedule_draft_events_draft_start", "draft_id", "start_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    draft_id = Column(Integer, ForeignKey("schedule_drafts.id", ondelete="CASCADE"), nullable=False)
+
+    title = Column(String(200), nullable=False)
+    category = Column(String(50), nullable=False, default="general")
+    start_at = Column(DateTime, nullable=False)
+    end_at = Column(DateTime, nullable=False)
+    note = Column(Text, nullable=True)
+    status = Column(String(20), nullable=False, default="planned")
+    rrule = Column(String(200), nullable=True)
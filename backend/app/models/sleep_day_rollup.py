@@ -0,0 +1,20 @@
+from datetime import date
+from sqlalchemy import Date, Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SleepDayRollup(Base):
+    """사용자 × 일자 수면 기록 합계 (그룹 통계용, 기록 추가 / 삭제 시 + n 으로 원자적 갱신)"""
+    __tablename__ = "sleep_day_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_sleep_day_rollup"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+
+    sleep_total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sleep_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
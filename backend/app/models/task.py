@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -7,6 +7,11 @@ from app.db.base import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 캘린더 기간 조회 (GET /tasks?date_from&date_to) 용
+        Index("ix_tasks_user_start", "user_id", "start_at"),
+        Index("ix_tasks_user_end", "user_id", "end_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
@@ -24,7 +29,12 @@ class Task(Base):
         String(10), nullable=False, default="private", server_default="private"
     )
 
-    # 함께하기로 공유된 원본 일정 ID (복사본인 경우에만 값 존재)
+    # 반복 규칙 (RRULE 부분집합, app/services/recurrence_service.py). 있으면 이 행은 반복 일정의 원본이다.
+    rrule: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    # 마지막 회차 종료 시각의 상한 (무한 반복이면 NULL) — 기간 조회 시 원본 행 필터용
+    recurrence_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # (구) 함께하기 복사본의 원본 일정 ID — 참여자는 task_participants 로 옮겨져 더 이상 채우지 않는다
     shared_from_task_id: Mapped[int | None] = mapped_column(ForeignKey("tasks.id"), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
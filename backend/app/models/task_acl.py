@@ -0,0 +1,24 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index, PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TaskAclEntry(Base):
+    """
+    조회자별로 볼 수 있는 다른 사람 일정 (materialized ACL)
+    public 일정은 소유자의 친구 전원, selective 일정은 선택된 친구에게 한 행씩.
+    친구 캘린더는 (viewer_id, owner_id, start_at) 인덱스 범위 한 번으로 읽는다.
+    """
+    __tablename__ = "task_acl"
+    __table_args__ = (
+        PrimaryKeyConstraint("viewer_id", "task_id", name="pk_task_acl"),
+        Index("ix_task_acl_viewer_owner_start", "viewer_id", "owner_id", "start_at", "task_id"),
+        Index("ix_task_acl_task", "task_id"),
+    )
+
+    viewer_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    start_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # 정렬 키 (Task.start_at 사본)
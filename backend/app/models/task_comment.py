@@ -1,11 +1,15 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class TaskComment(Base):
-    """일정 댓글 — 일정 소유자와 참여자(shared copy) 간 소통"""
+    """일정 댓글 — 일정 소유자와 참여자(task_participants) 간 소통"""
     __tablename__ = "task_comments"
+    __table_args__ = (
+        # 스레드 조회: 일정의 최상위 댓글 / 부모 댓글의 답글 (id 순)
+        Index("ix_task_comments_thread", "task_id", "parent_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
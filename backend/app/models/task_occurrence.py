@@ -0,0 +1,25 @@
+from datetime import datetime
+from sqlalchemy import Boolean, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TaskOccurrenceOverride(Base):
+    """반복 일정의 회차별 예외(취소) / 수정 내용. 회차는 원래 시작 시각으로 식별한다."""
+    __tablename__ = "task_occurrence_overrides"
+    __table_args__ = (
+        UniqueConstraint("task_id", "occurrence_start", name="uq_task_occurrence"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
+    occurrence_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    is_cancelled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    # NULL 이면 원본 값을 그대로 사용
+    title: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    start_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    end_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    status: Mapped[str | None] = mapped_column(String(20), nullable=True)
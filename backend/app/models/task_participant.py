@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TaskParticipant(Base):
+    """함께하기 참여자 — 일정은 원본 1행만 두고 참여자별 진행 상태만 따로 저장"""
+    __tablename__ = "task_participants"
+    __table_args__ = (
+        UniqueConstraint("task_id", "user_id", name="uq_task_participant"),
+        # 내가 참여한 일정 조회 (user_id → task_id)
+        Index("ix_task_participants_user", "user_id", "task_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="planned")
+    joined_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
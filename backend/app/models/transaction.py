@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Float, Boolean, Date, DateTime, ForeignKey, Index, func, false
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -6,15 +6,20 @@ from app.db.base import Base
 class Transaction(Base):
     """가계부 트랜잭션 — 소비/소득/투자 기록"""
     __tablename__ = "transactions"
+    __table_args__ = (
+        # 사용자 × 기간 (× 유형) 조회 / 월 요약은 이 인덱스 범위 스캔
+        Index("ix_transactions_user_date_type", "user_id", "date", "type"),
+        # CSV 가져오기 중복 제거 (직접 입력한 행은 NULL)
+        Index("uq_transactions_user_content_hash", "user_id", "content_hash", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # income / expense / investment
-    type = Column(String(20), nullable=False, index=True)
+    type = Column(String(20), nullable=False)
 
-    # 날짜 (YYYY-MM-DD)
-    date = Column(String(10), nullable=False, index=True)
+    date = Column(Date, nullable=False)
 
     amount = Column(Float, nullable=False)
 
@@ -24,6 +29,12 @@ class Transaction(Base):
     category = Column(String(50), nullable=True)
 
     memo = Column(String(500), nullable=True)
+
+    # 충동 소비 여부 (expense 만 의미 있음) — spend DailyAggregate 의 impulse_ratio 로 집계
+    is_impulse = Column(Boolean, nullable=False, default=False, server_default=false())
+
+    # 가져온 행의 내용 해시 (sha256 hex) — transaction_import_service.content_hash
+    content_hash = Column(String(64), nullable=True)
     created_at = Column(DateTime, default=func.now())
 
     user = relationship("User", back_populates="transactions")
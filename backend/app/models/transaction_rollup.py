@@ -0,0 +1,23 @@
+from datetime import date
+from sqlalchemy import Date, Float, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TransactionRollup(Base):
+    """사용자 × 월 × 유형 × 분류 가계부 합계 (트랜잭션 생성 / 삭제 시 증분 갱신)"""
+    __tablename__ = "transaction_rollups"
+    __table_args__ = (
+        # (user_id, month) 범위 조회 = 여러 해 추이도 인덱스 범위 스캔 1번
+        UniqueConstraint("user_id", "month", "type", "category", name="uq_transaction_rollup"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    month: Mapped[date] = mapped_column(Date, nullable=False)  # 해당 월 1일
+    type: Mapped[str] = mapped_column(String(20), nullable=False)
+    category: Mapped[str] = mapped_column(String(50), nullable=False)  # 분류 없음은 "기타"
+
+    amount_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    tx_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ActivityItemOut(BaseModel):
+    id: int
+    actor_id: int
+    actor_nickname: Optional[str] = None
+    kind: str                       # log | task_done | project_milestone
+    ref_id: int
+    log_type: Optional[str] = None
+    summary: Optional[str] = None
+    value: Optional[float] = None   # 기록 수치 / 마일스톤 진행률(%)
+    occurred_at: datetime
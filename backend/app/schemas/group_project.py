@@ -29,6 +29,7 @@ class GroupProjectTaskOut(BaseModel):
     is_done: bool
     done_at: Optional[datetime]
     order_index: int
+    rank: str
     is_overdue: bool
     overdue_recorded: bool
     created_at: datetime
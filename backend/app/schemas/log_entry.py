@@ -1,10 +1,11 @@
 from pydantic import BaseModel, Field
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 
 
 class LogEntryCreate(BaseModel):
-    type: str = Field(..., pattern="^(health|study|spend|sleep|mood)$")
+    # 소비(spend)는 가계부 트랜잭션(/transactions)으로 기록한다
+    type: str = Field(..., pattern="^(health|study|sleep|mood)$")
     timestamp: Optional[datetime] = None  # None이면 서버에서 현재 시각 사용
     value: float
     meta: Optional[str] = None   # JSON 문자열
@@ -27,7 +28,7 @@ class LogEntryOut(BaseModel):
 class DailyAggregateOut(BaseModel):
     id: int
     user_id: int
-    date: str       # YYYY-MM-DD
+    date: date      # YYYY-MM-DD
     type: str
     total: float
     average: float
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from pydantic import BaseModel
 
@@ -31,6 +31,7 @@ class ProjectTaskOut(BaseModel):
     is_done: bool
     done_at: Optional[datetime] = None
     order_index: int
+    rank: str
     memo: Optional[str] = None
     deadline: Optional[str] = None  # YYYY-MM-DD
     created_at: datetime
@@ -39,6 +40,24 @@ class ProjectTaskOut(BaseModel):
         from_attributes = True
 
 
+class TaskMove(BaseModel):
+    task_id: int
+    prev_id: Optional[int] = None  # 이동 후 바로 앞 할 일 (None = 맨 앞)
+    next_id: Optional[int] = None  # 이동 후 바로 뒤 할 일 (None = 맨 뒤)
+
+
+class TaskReorderPayload(BaseModel):
+    moves: list[TaskMove]  # 순서대로 적용
+
+
+class TaskRankOut(BaseModel):
+    id: int
+    rank: str
+
+    class Config:
+        from_attributes = True
+
+
 class ProjectStatsOut(BaseModel):
     total_tasks: int
     done_tasks: int
@@ -51,6 +70,30 @@ class ProjectStatsOut(BaseModel):
     total_estimated_hours: Optional[float] = None
 
 
+class ProjectSnapshotOut(BaseModel):
+    date: date
+    remaining_tasks: int
+    remaining_hours: float
+    completions: int
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectForecastOut(BaseModel):
+    project_id: int
+    remaining_tasks: int
+    remaining_hours: Optional[float] = None
+    ewma_pace_per_day: float                  # 지수가중 일일 완료 속도
+    pace_std: float
+    projected_completion_date: Optional[date] = None   # 속도 0이면 None
+    optimistic_date: Optional[date] = None
+    pessimistic_date: Optional[date] = None
+    confidence: float                         # optimistic~pessimistic 구간 신뢰 수준
+    deadline: Optional[str] = None
+    on_track: Optional[bool] = None
+
+
 class ProjectCreate(BaseModel):
     goal_id: Optional[int] = None
     title: str
@@ -74,7 +117,7 @@ class ProjectOut(BaseModel):
     description: Optional[str] = None
     deadline: Optional[str] = None
     created_at: datetime
-    tasks: list[ProjectTaskOut]
+    tasks: Optional[list[ProjectTaskOut]] = None  # GET /projects?include_tasks=true 일 때만 포함
     stats: ProjectStatsOut
 
     class Config:
@@ -1,15 +1,36 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
 
 class ScheduleDraftEvent(BaseModel):
+    id: Optional[int] = None  # 저장된 이벤트 ID (PATCH / DELETE 대상)
     title: str
     category: str = "general"
     start_at: str    # ISO8601
     end_at: str      # ISO8601
     note: Optional[str] = None
     status: str = "planned"
+    rrule: Optional[str] = None  # 반복 규칙 (app/services/recurrence_service.py)
+
+
+class ScheduleDraftEventUpdate(BaseModel):
+    """이벤트 1건 부분 수정 (보낸 필드만 반영)"""
+    title: Optional[str] = None
+    category: Optional[str] = None
+    start_at: Optional[str] = None
+    end_at: Optional[str] = None
+    note: Optional[str] = None
+    status: Optional[str] = None
+    rrule: Optional[str] = None
+
+    @field_validator("title", "category", "start_at", "end_at", "status")
+    @classmethod
+    def _not_null(cls, v: Optional[str]) -> str:
+        # 생략은 허용하지만 null 로 보내 NOT NULL 컬럼을 비울 수는 없다 (note / rrule 만 null 허용)
+        if v is None:
+            raise ValueError("null 로 지울 수 없는 필드입니다.")
+        return v
 
 
 class ScheduleDraftCreate(BaseModel):
@@ -17,14 +38,20 @@ class ScheduleDraftCreate(BaseModel):
     events: list[ScheduleDraftEvent]
     # what-if 입력 파라미터 (changes, horizon_days) 를 그대로 사용해 생성하는 경우
     changes: Optional[dict] = None
-    horizon_days: Optional[int] = 7
+    horizon_days: Optional[int] = Field(7, ge=1, le=90)  # 배치/반복 전개 비용 상한
+    # 배치 선호 (sleep_target_hour, wake_target_hour, study_format, exercise_days)
+    preferences: Optional[dict] = None
 
 
 class ScheduleDraftOut(BaseModel):
     id: int
     user_id: int
     plan_name: str
-    events: list[ScheduleDraftEvent]
+    # 목록 조회에서는 생략 (GET /plan/drafts/{id}/events 로 페이지 단위 조회)
+    events: Optional[list[ScheduleDraftEvent]] = None
+    event_count: int = 0
+    # 생성 시 기존 일정과 겹치지 않는 시각을 찾지 못해 빠진 회차의 선호 시작 시각 (ISO8601, 생성 응답에만)
+    unplaced: list[str] = []
     status: str
     created_at: datetime
 
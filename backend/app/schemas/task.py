@@ -1,8 +1,15 @@
-from datetime import datetime
-from pydantic import BaseModel
+from datetime import date, datetime, timezone
+from pydantic import BaseModel, field_validator
 from typing import Optional
 
 
+def naive_utc(dt: datetime | None) -> datetime | None:
+    """DB 는 naive UTC 로 저장하므로 오프셋이 붙은 입력("...Z", "+09:00")은 UTC 로 맞춰 tzinfo 를 뗀다."""
+    if dt is None or dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 class TaskCreate(BaseModel):
     title: str
     category: str = "general"
@@ -14,6 +21,7 @@ class TaskCreate(BaseModel):
     visibility: str = "private"
     visible_to_user_ids: list[int] = []
     participant_ids: list[int] = []   # 함께 일정 공유할 친구 IDs
+    rrule: str | None = None          # 반복 규칙 (예: "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10")
 
 
 class TaskUpdate(BaseModel):
@@ -26,6 +34,7 @@ class TaskUpdate(BaseModel):
     status: str | None = None
     visibility: str | None = None
     visible_to_user_ids: list[int] | None = None
+    rrule: str | None = None          # "" 이면 반복 해제
 
 
 class TaskOut(BaseModel):
@@ -40,6 +49,11 @@ class TaskOut(BaseModel):
     status: str
     visibility: str
     shared_from_task_id: int | None = None
+    rrule: str | None = None
+    # 반복 일정의 회차로 전개된 항목이면 회차 식별자 (원래 시작 시각)
+    occurrence_start: datetime | None = None
+    # 다른 사람 일정에 참여 중이면 True (status 는 내 참여 상태)
+    participating: bool = False
     created_at: datetime
     updated_at: datetime
 
@@ -47,6 +61,45 @@ class TaskOut(BaseModel):
         from_attributes = True
 
 
+class TaskCalendarItem(BaseModel):
+    """월간 캘린더용 경량 응답 (ORM 객체 없이 컬럼만 조회)"""
+    id: int
+    title: str
+    category: str
+    start_at: datetime
+    end_at: datetime
+    status: str
+    occurrence_start: datetime | None = None
+    participating: bool = False
+
+    class Config:
+        from_attributes = True
+
+
+class TaskParticipationUpdate(BaseModel):
+    status: str
+
+
+class TaskParticipantOut(BaseModel):
+    user_id: int
+    nickname: str | None = None
+    status: str
+    joined_at: datetime
+
+
+class TaskOccurrenceUpdate(BaseModel):
+    """반복 일정 한 회차만 수정 (NULL 이면 원본 값 유지)"""
+    title: str | None = None
+    start_at: datetime | None = None
+    end_at: datetime | None = None
+    status: str | None = None
+
+    @field_validator("start_at", "end_at")
+    @classmethod
+    def _to_naive_utc(cls, v: datetime | None) -> datetime | None:
+        return naive_utc(v)
+
+
 # ── 댓글 스키마 ──────────────────────────────────────────────────────────────
 class TaskCommentCreate(BaseModel):
     content: str
@@ -64,3 +117,22 @@ class TaskCommentOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ── free/busy 스키마 ─────────────────────────────────────────────────────────
+class TimeSlot(BaseModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class UserBusyOut(BaseModel):
+    user_id: int
+    busy: list[TimeSlot]
+
+
+class FreeBusyOut(BaseModel):
+    date_from: date
+    date_to: date
+    user_ids: list[int]
+    free: list[TimeSlot]       # 모두가 비어 있는 시간
+    users: list[UserBusyOut]   # 사용자별 바쁜 시간 (제목 등 내용 없이 시간만)
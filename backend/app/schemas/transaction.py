@@ -1,22 +1,25 @@
+from datetime import date
 from pydantic import BaseModel
 from typing import Optional
 
 
 class TransactionCreate(BaseModel):
     type: str         # income / expense / investment
-    date: str         # YYYY-MM-DD
+    date: date        # YYYY-MM-DD
     amount: float
     category: Optional[str] = None
     memo: Optional[str] = None
+    is_impulse: bool = False
 
 
 class TransactionOut(BaseModel):
     id: int
     type: str
-    date: str
+    date: date
     amount: float
     category: Optional[str] = None
     memo: Optional[str] = None
+    is_impulse: bool = False
 
     class Config:
         from_attributes = True
@@ -31,3 +34,24 @@ class MonthlySummary(BaseModel):
     net_savings: float
     expense_by_category: dict
     income_by_category: dict
+
+
+class TransactionImportProfile(BaseModel):
+    """CSV 가져오기 열 매핑 (값은 CSV 헤더 이름)"""
+    date_column: str = "date"
+    amount_column: str = "amount"
+    type_column: Optional[str] = "type"   # None 이면 금액 부호로 판단 (음수 expense / 양수 income)
+    category_column: Optional[str] = "category"
+    memo_column: Optional[str] = "memo"
+    impulse_column: Optional[str] = None  # 값이 1 / true / y / yes / 충동 이면 충동 소비
+    date_format: str = "%Y-%m-%d"
+    type_map: dict[str, str] = {}         # 예) {"출금": "expense", "입금": "income"}
+    delimiter: str = ","
+    encoding: str = "utf-8-sig"
+
+
+class TransactionImportResult(BaseModel):
+    imported: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: list[str] = []                # 앞쪽 일부 행의 실패 사유
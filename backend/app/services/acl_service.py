@@ -0,0 +1,82 @@
+"""
+일정 공개 범위 ACL (task_acl) 유지
+
+Task.visibility + TaskVisibilityFriend 를 조회자 기준 행으로 펼쳐 둔다.
+  - public    → 소유자의 수락된 친구 전원
+  - selective → TaskVisibilityFriend 에 선택된 사용자
+  - private   → 없음
+일정 생성 / 공개 범위·시작 시각 변경 / 삭제, 친구 수락 / 삭제 때 바뀐 행만 증분 반영한다.
+"""
+from typing import Optional
+
+from sqlalchemy import and_, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.task_acl import TaskAclEntry
+from app.models.task_visibility import TaskVisibilityFriend
+from app.services.friend_service import friend_ids
+
+
+def _viewers(db: Session, task: Task) -> set[int]:
+    if task.visibility == "public":
+        return friend_ids(db, task.user_id)
+    if task.visibility == "selective":
+        return {uid for (uid,) in db.query(TaskVisibilityFriend.friend_user_id).filter(
+            TaskVisibilityFriend.task_id == task.id
+        )}
+    return set()
+
+
+def sync_task(db: Session, task: Task) -> None:
+    """task 의 ACL 행을 현재 공개 범위에 맞춘다 (추가 / 삭제된 조회자만 반영, start_at 갱신)"""
+    wanted = _viewers(db, task) - {task.user_id}
+    existing = {uid for (uid,) in db.query(TaskAclEntry.viewer_id).filter(TaskAclEntry.task_id == task.id)}
+    removed = existing - wanted
+    if removed:
+        db.query(TaskAclEntry).filter(
+            TaskAclEntry.task_id == task.id, TaskAclEntry.viewer_id.in_(removed)
+        ).delete(synchronize_session=False)
+    if existing - removed:
+        db.query(TaskAclEntry).filter(
+            TaskAclEntry.task_id == task.id, TaskAclEntry.start_at != task.start_at
+        ).update({TaskAclEntry.start_at: task.start_at}, synchronize_session=False)
+    added = wanted - existing
+    if added:
+        db.execute(insert(TaskAclEntry).values([
+            {"viewer_id": uid, "task_id": task.id, "owner_id": task.user_id, "start_at": task.start_at}
+            for uid in sorted(added)
+        ]))
+
+
+def remove_task(db: Session, task_id: int) -> None:
+    db.query(TaskAclEntry).filter(TaskAclEntry.task_id == task_id).delete(synchronize_session=False)
+
+
+def on_friendship_added(db: Session, a: int, b: int) -> None:
+    """서로의 public 일정을 상대 ACL 에 추가 (INSERT ... SELECT)"""
+    for owner_id, viewer_id in ((a, b), (b, a)):
+        db.execute(insert(TaskAclEntry).from_select(
+            ["viewer_id", "task_id", "owner_id", "start_at"],
+            select(literal(viewer_id), Task.id, Task.user_id, Task.start_at).where(
+                Task.user_id == owner_id,
+                Task.visibility == "public",
+                Task.id.notin_(select(TaskAclEntry.task_id).where(TaskAclEntry.viewer_id == viewer_id)),
+            ),
+        ))
+
+
+def on_friendship_removed(db: Session, a: int, b: int) -> None:
+    """서로의 일정에 대한 ACL 행 제거 (selective 선택도 함께 해제됨)"""
+    db.query(TaskAclEntry).filter(or_(
+        and_(TaskAclEntry.viewer_id == a, TaskAclEntry.owner_id == b),
+        and_(TaskAclEntry.viewer_id == b, TaskAclEntry.owner_id == a),
+    )).delete(synchronize_session=False)
+
+
+def visible_task_ids(viewer_id: int, owner_id: Optional[int] = None):
+    """조회자에게 보이는 (owner 의) 일정 ID 서브쿼리"""
+    q = select(TaskAclEntry.task_id).where(TaskAclEntry.viewer_id == viewer_id)
+    if owner_id is not None:
+        q = q.where(TaskAclEntry.owner_id == owner_id)
+    return q.scalar_subquery()
@@ -0,0 +1,173 @@
+"""
+친구 활동 타임라인 (fan-out-on-write)
+
+기록 / 일정 완료 / 프로젝트 마일스톤이 쓰일 때 작성자의 친구마다 피드 항목을 한 행씩 넣어 둔다.
+읽을 때는 내 피드의 (owner_id, occurred_at, id) 인덱스 범위만 키셋으로 읽으므로
+친구 수와 관계없이 비용은 페이지 크기에 비례한다.
+
+피드는 사용자당 FEED_MAX_ITEMS 개로 유지 — trim_feeds() 가 scheduler 에서 주기적으로 오래된 항목을 지운다.
+새 친구의 기록은 BACKFILL_DAYS 일치만 채우므로, 피드가 빠짐없이 담고 있는 구간은 feed_complete_since() 이후뿐이다.
+"""
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, insert, or_, text
+from sqlalchemy.orm import Session
+
+from app.models.activity_feed import ActivityFeedItem
+from app.models.log_entry import LogEntry
+from app.services.friend_service import friend_ids
+
+FEED_MAX_ITEMS = 1000
+BACKFILL_DAYS = 7           # 새 친구가 생기면 서로의 최근 기록을 이만큼 채워 넣는다
+MILESTONES = (25, 50, 75, 100)  # 프로젝트 진행률 마일스톤 (%)
+
+
+def fan_out(
+    db: Session,
+    actor_id: int,
+    kind: str,
+    ref_id: int,
+    occurred_at: datetime,
+    summary: Optional[str] = None,
+    value: Optional[float] = None,
+    log_type: Optional[str] = None,
+    recipients: Optional[Iterable[int]] = None,
+) -> int:
+    """actor 의 친구들(recipients 를 주면 그 중 친구인 사용자만) 피드에 항목 추가 — INSERT 1번"""
+    owners = friend_ids(db, actor_id)
+    if recipients is not None:
+        owners &= set(recipients)
+    if not owners:
+        return 0
+    db.execute(insert(ActivityFeedItem).values([
+        {
+            "owner_id": owner_id, "actor_id": actor_id, "kind": kind, "ref_id": ref_id,
+            "log_type": log_type, "summary": summary, "value": value,
+            "occurred_at": occurred_at, "created_at": datetime.utcnow(),
+        }
+        for owner_id in sorted(owners)
+    ]))
+    return len(owners)
+
+
+def fan_out_log(db: Session, entry: LogEntry) -> int:
+    return fan_out(
+        db, entry.user_id, "log", entry.id, entry.timestamp,
+        value=entry.value, log_type=entry.type, summary=entry.note,
+    )
+
+
+def retract(db: Session, kind: str, ref_id: int, actor_id: Optional[int] = None) -> None:
+    """원본이 지워지거나 취소되면 모든 피드에서 항목 제거 (actor_id 를 주면 그 사용자의 활동만)"""
+    q = db.query(ActivityFeedItem).filter(ActivityFeedItem.kind == kind, ActivityFeedItem.ref_id == ref_id)
+    if actor_id is not None:
+        q = q.filter(ActivityFeedItem.actor_id == actor_id)
+    q.delete(synchronize_session=False)
+
+
+def crossed_milestone(done_before: int, done_after: int, total: int) -> Optional[int]:
+    """완료 수가 늘면서 새로 넘어선 가장 큰 마일스톤 (%)"""
+    if total <= 0 or done_after <= done_before:
+        return None
+    before, after = done_before * 100 / total, done_after * 100 / total
+    passed = [m for m in MILESTONES if before < m <= after]
+    return passed[-1] if passed else None
+
+
+def on_friendship_added(db: Session, a: int, b: int) -> None:
+    """새 친구끼리 최근 BACKFILL_DAYS 일의 기록을 서로의 피드에 채운다"""
+    since = datetime.utcnow() - timedelta(days=BACKFILL_DAYS)
+    for actor_id, owner_id in ((a, b), (b, a)):
+        entries = (
+            db.query(LogEntry.id, LogEntry.type, LogEntry.timestamp, LogEntry.value, LogEntry.note)
+            .filter(LogEntry.user_id == actor_id, LogEntry.timestamp >= since)
+            .order_by(LogEntry.timestamp.desc())
+            .limit(FEED_MAX_ITEMS)
+            .all()
+        )
+        if entries:
+            db.execute(insert(ActivityFeedItem).values([
+                {
+                    "owner_id": owner_id, "actor_id": actor_id, "kind": "log", "ref_id": e.id,
+                    "log_type": e.type, "summary": e.note, "value": e.value,
+                    "occurred_at": e.timestamp, "created_at": datetime.utcnow(),
+                }
+                for e in entries
+            ]))
+
+
+def on_friendship_removed(db: Session, a: int, b: int) -> None:
+    db.query(ActivityFeedItem).filter(or_(
+        and_(ActivityFeedItem.owner_id == a, ActivityFeedItem.actor_id == b),
+        and_(ActivityFeedItem.owner_id == b, ActivityFeedItem.actor_id == a),
+    )).delete(synchronize_session=False)
+
+
+def feed_complete_since(db: Session, owner_id: int) -> datetime:
+    """
+    이 시각 이후의 친구 활동은 피드에 모두 들어 있다 — 그 이전은 백필 범위 밖이거나 trim 으로 잘렸을 수 있다.
+    """
+    since = datetime.utcnow() - timedelta(days=BACKFILL_DAYS)
+    oldest = (
+        db.query(ActivityFeedItem.occurred_at)
+        .filter(ActivityFeedItem.owner_id == owner_id)
+        .order_by(ActivityFeedItem.occurred_at.desc(), ActivityFeedItem.id.desc())
+        .offset(FEED_MAX_ITEMS - 1)
+        .limit(1)
+        .scalar()
+    )
+    # FEED_MAX_ITEMS 개가 꽉 찼으면 가장 오래 남은 항목 이전은 이미 잘렸을 수 있다 (같은 시각 항목도 보장 못 함)
+    return max(since, oldest + timedelta(microseconds=1)) if oldest is not None else since
+
+
+def feed_query(
+    db: Session,
+    owner_id: int,
+    *entities,
+    after: Optional[tuple[datetime, int]] = None,
+    kinds: Optional[list[str]] = None,
+    log_types: Optional[list[str]] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+):
+    """
+    내 피드 최신순 (occurred_at desc, id desc) 키셋 쿼리 — after 는 이전 페이지 마지막 항목.
+    entities 를 주면 그 컬럼들을 조회 (호출 측에서 조인 / limit 추가).
+    """
+    q = (
+        db.query(*(entities or (ActivityFeedItem,)))
+        .select_from(ActivityFeedItem)
+        .filter(ActivityFeedItem.owner_id == owner_id)
+    )
+    if kinds:
+        q = q.filter(ActivityFeedItem.kind.in_(kinds))
+    if log_types:
+        q = q.filter(ActivityFeedItem.log_type.in_(log_types))
+    if date_from is not None:
+        q = q.filter(ActivityFeedItem.occurred_at >= date_from)
+    if date_to is not None:
+        q = q.filter(ActivityFeedItem.occurred_at < date_to)
+    if after is not None:
+        q = q.filter(or_(
+            ActivityFeedItem.occurred_at < after[0],
+            and_(ActivityFeedItem.occurred_at == after[0], ActivityFeedItem.id < after[1]),
+        ))
+    return q.order_by(ActivityFeedItem.occurred_at.desc(), ActivityFeedItem.id.desc())
+
+
+def trim_feeds(db: Session, max_items: int = FEED_MAX_ITEMS) -> int:
+    """사용자별 최신 max_items 개만 남기고 삭제. 반환값: 삭제된 항목 수"""
+    result = db.execute(text("""
+        DELETE FROM activity_feed_items WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY owner_id ORDER BY occurred_at DESC, id DESC
+                ) AS rn
+                FROM activity_feed_items
+            ) ranked
+            WHERE rn > :max_items
+        )
+    """), {"max_items": max_items})
+    db.commit()
+    return result.rowcount
@@ -1,19 +1,28 @@
 """
-LogEntry → DailyAggregate 계산 서비스
+LogEntry / Transaction → DailyAggregate 계산 서비스
 날짜 × 타입 단위로 집계하고 캐시 테이블에 저장한다.
+
+spend 집계는 가계부 지출(Transaction type="expense")에서 만든다.
+트랜잭션 생성 / 삭제 / 가져오기 때 apply_spend_deltas() 로 해당 날짜 행만 증분 갱신한다.
 """
 import json
 from datetime import date
+from typing import Optional, Union
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
 
 from app.models.log_entry import LogEntry
 from app.models.daily_aggregate import DailyAggregate
+from app.models.transaction import Transaction
+
+DEFAULT_SPEND_CATEGORY = "기타"
 
 
 def build_daily_aggregates(db: Session, user_id: int, target_date: date) -> list[DailyAggregate]:
     """
     해당 날짜의 모든 LogEntry를 타입별로 집계하여 DailyAggregate를 upsert 한다.
+    spend 는 LogEntry 대신 그날의 지출 트랜잭션에서 다시 계산한다.
     반환값: 해당 날짜의 DailyAggregate 목록
     """
     entries = (
@@ -21,6 +30,7 @@ def build_daily_aggregates(db: Session, user_id: int, target_date: date) -> list
         .filter(
             LogEntry.user_id == user_id,
             func.date(LogEntry.timestamp) == target_date,
+            LogEntry.type != "spend",
         )
         .all()
     )
@@ -62,6 +72,10 @@ def build_daily_aggregates(db: Session, user_id: int, target_date: date) -> list
         agg.meta_summary = json.dumps(meta_summary, ensure_ascii=False)
         results.append(agg)
 
+    spend = _rebuild_spend_day(db, user_id, target_date)
+    if spend is not None:
+        results.append(spend)
+
     db.commit()
     for agg in results:
         db.refresh(agg)
@@ -103,22 +117,6 @@ def _build_meta_summary(log_type: str, entries: list[LogEntry]) -> dict:
             "exercise_types": exercise_types,
         }
 
-    if log_type == "spend":
-        impulse_flags = [m.get("is_impulse", False) for m in metas]
-        total_entries = len(impulse_flags)
-        impulse_count = sum(1 for f in impulse_flags if f)
-        impulse_ratio = impulse_count / total_entries if total_entries else 0.0
-        savings_ratio = 1.0 - impulse_ratio
-        categories = {}
-        for m in metas:
-            cat = m.get("category", "기타")
-            categories[cat] = categories.get(cat, 0) + 1
-        return {
-            "impulse_ratio": impulse_ratio,
-            "savings_ratio": savings_ratio,
-            "categories": categories,
-        }
-
     if log_type == "mood":
         emotion_types = [m.get("emotion_type") for m in metas if m.get("emotion_type")]
         counts: dict = {}
@@ -129,6 +127,149 @@ def _build_meta_summary(log_type: str, entries: list[LogEntry]) -> dict:
     return {}
 
 
+# ─── spend (가계부 지출) ──────────────────────────────────────────────────────
+
+def _spend_meta(count: int, impulse_count: int, categories: dict) -> dict:
+    impulse_ratio = impulse_count / count if count else 0.0
+    return {
+        "impulse_ratio": impulse_ratio,
+        "savings_ratio": 1.0 - impulse_ratio,
+        "impulse_count": impulse_count,
+        "categories": categories,
+    }
+
+
+def add_spend_delta(
+    deltas: dict[date, list],
+    tx_date: date,
+    amount: float,
+    is_impulse: bool,
+    category: Optional[str],
+    sign: int = 1,
+) -> None:
+    """deltas[날짜] = [금액 합, 건수, 충동 건수, {분류: 건수}] 에 지출 1건을 더하거나 뺀다."""
+    delta = deltas.setdefault(tx_date, [0.0, 0, 0, {}])
+    cat = category or DEFAULT_SPEND_CATEGORY
+    delta[0] += sign * amount
+    delta[1] += sign
+    delta[2] += sign if is_impulse else 0
+    delta[3][cat] = delta[3].get(cat, 0) + sign
+
+
+def record_spend(db: Session, tx: Transaction, sign: int = 1) -> None:
+    """지출 트랜잭션 1건 생성(sign=1) / 삭제(sign=-1)를 그날 spend 집계에 반영 (커밋은 호출 측)"""
+    if tx.type != "expense":
+        return
+    deltas: dict[date, list] = {}
+    add_spend_delta(deltas, tx.date, tx.amount, tx.is_impulse, tx.category, sign)
+    apply_spend_deltas(db, tx.user_id, deltas)
+
+
+def apply_spend_deltas(db: Session, user_id: int, deltas: dict[date, list]) -> None:
+    """날짜별 변경분을 spend DailyAggregate 에 반영. 건수가 0 이 되면 행을 지운다."""
+    if not deltas:
+        return
+    existing = {
+        agg.date: agg
+        for agg in db.query(DailyAggregate).filter(
+            DailyAggregate.user_id == user_id,
+            DailyAggregate.type == "spend",
+            DailyAggregate.date.in_(list(deltas)),
+        )
+    }
+    for day, (amount, count, impulse, cats) in deltas.items():
+        agg = existing.get(day)
+        if agg is None:
+            if count <= 0:
+                continue
+            agg = DailyAggregate(user_id=user_id, date=day, type="spend", total=0.0, count=0)
+            db.add(agg)
+            meta = {}
+        else:
+            try:
+                meta = json.loads(agg.meta_summary) if agg.meta_summary else {}
+            except (json.JSONDecodeError, TypeError):
+                meta = {}
+        new_count = (agg.count or 0) + count
+        if new_count <= 0:
+            db.delete(agg)
+            continue
+        categories = dict(meta.get("categories", {}))
+        for cat, n in cats.items():
+            categories[cat] = categories.get(cat, 0) + n
+            if categories[cat] <= 0:
+                del categories[cat]
+        impulse_count = max(0, meta.get("impulse_count", 0) + impulse)
+        agg.total = (agg.total or 0.0) + amount
+        agg.count = new_count
+        agg.average = agg.total / new_count
+        agg.meta_summary = json.dumps(_spend_meta(new_count, impulse_count, categories), ensure_ascii=False)
+
+
+def _spend_rows(
+    bind: Union[Session, Connection],
+    user_id: Optional[int] = None,
+    target_date: Optional[date] = None,
+) -> dict[tuple[int, date], dict]:
+    """지출 트랜잭션을 (사용자, 날짜, 분류, 충동 여부) 로 GROUP BY 해서 날짜별 spend 집계 값으로 접는다."""
+    category = func.coalesce(Transaction.category, DEFAULT_SPEND_CATEGORY)
+    q = select(
+        Transaction.user_id, Transaction.date, category, Transaction.is_impulse,
+        func.sum(Transaction.amount), func.count(Transaction.id),
+    ).where(Transaction.type == "expense")
+    if user_id is not None:
+        q = q.where(Transaction.user_id == user_id)
+    if target_date is not None:
+        q = q.where(Transaction.date == target_date)
+    q = q.group_by(Transaction.user_id, Transaction.date, category, Transaction.is_impulse)
+
+    days: dict[tuple[int, date], list] = {}
+    for uid, day, cat, is_impulse, amount, count in bind.execute(q):
+        acc = days.setdefault((uid, day), [0.0, 0, 0, {}])
+        acc[0] += amount
+        acc[1] += count
+        acc[2] += count if is_impulse else 0
+        acc[3][cat] = acc[3].get(cat, 0) + count
+    return {
+        key: {
+            "total": amount, "count": count, "average": amount / count,
+            "meta_summary": json.dumps(_spend_meta(count, impulse, cats), ensure_ascii=False),
+        }
+        for key, (amount, count, impulse, cats) in days.items()
+    }
+
+
+def _rebuild_spend_day(db: Session, user_id: int, target_date: date) -> Optional[DailyAggregate]:
+    values = _spend_rows(db, user_id, target_date).get((user_id, target_date))
+    agg = db.query(DailyAggregate).filter(
+        DailyAggregate.user_id == user_id,
+        DailyAggregate.date == target_date,
+        DailyAggregate.type == "spend",
+    ).first()
+    if values is None:
+        if agg is not None:
+            db.delete(agg)
+        return None
+    if agg is None:
+        agg = DailyAggregate(user_id=user_id, date=target_date, type="spend")
+        db.add(agg)
+    for key, value in values.items():
+        setattr(agg, key, value)
+    return agg
+
+
+def rebuild_spend_aggregates(bind: Union[Session, Connection]) -> int:
+    """모든 spend 집계를 지출 트랜잭션에서 다시 만든다 (마이그레이션용, 커밋은 호출 측). 반환값: 행 수"""
+    bind.execute(DailyAggregate.__table__.delete().where(DailyAggregate.type == "spend"))
+    rows = [
+        {"user_id": uid, "date": day, "type": "spend", **values}
+        for (uid, day), values in _spend_rows(bind).items()
+    ]
+    if rows:
+        bind.execute(insert(DailyAggregate.__table__), rows)
+    return len(rows)
+
+
 def get_aggregates_range(
     db: Session,
     user_id: int,
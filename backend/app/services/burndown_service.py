@@ -0,0 +1,222 @@
+"""
+프로젝트 번다운 / 완료 예측 서비스
+
+ProjectDailySnapshot 을 할 일 이벤트마다 증분 갱신하고,
+스냅샷 시계열의 일일 완료 수에 지수가중이동평균(EWMA)을 적용해 완료 예상일을 추정한다.
+"""
+import math
+from datetime import date, timedelta
+from typing import Optional, Union
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+from app.models.project_snapshot import ProjectDailySnapshot
+from app.models.project_task import ProjectTask
+from app.schemas.project import ProjectForecastOut
+
+EWMA_ALPHA = 0.2            # 최근 하루의 가중치 (span ≈ 9일)
+FORECAST_WINDOW_DAYS = 90   # 예측에 사용하는 최근 스냅샷 기간
+CONFIDENCE_Z = 1.28         # 80% 구간
+
+
+# ─── 증분 갱신 ────────────────────────────────────────────────────────────────
+
+def _current_remaining(db: Session, project_id: int) -> tuple[int, float]:
+    remaining, hours = (
+        db.query(
+            func.count(ProjectTask.id),
+            func.coalesce(func.sum(ProjectTask.estimated_hours), 0.0),
+        )
+        .filter(ProjectTask.project_id == project_id, ProjectTask.is_done == False)
+        .one()
+    )
+    return int(remaining), float(hours)
+
+
+def record_task_event(
+    db: Session,
+    project_id: int,
+    remaining_delta: int = 0,
+    hours_delta: float = 0.0,
+    completions_delta: int = 0,
+) -> None:
+    """
+    당일 스냅샷에 할 일 변경분을 반영한다 (커밋은 호출 측).
+    INSERT … ON CONFLICT DO UPDATE SET x = x + n 한 문장이라 같은 날 동시에 기록해도 증분이 사라지지 않는다.
+    당일 행이 없으면 직전 스냅샷 값을 이어받고, 스냅샷이 처음이면 할 일 테이블에서 시작값을 계산한다.
+    """
+    if not (remaining_delta or hours_delta or completions_delta):
+        return
+    today = date.today()
+    latest = (
+        db.query(ProjectDailySnapshot.remaining_tasks, ProjectDailySnapshot.remaining_hours)
+        .filter(ProjectDailySnapshot.project_id == project_id, ProjectDailySnapshot.date <= today)
+        .order_by(ProjectDailySnapshot.date.desc())
+        .first()
+    )
+    if latest is not None:
+        remaining, hours = latest.remaining_tasks + remaining_delta, latest.remaining_hours + hours_delta
+    else:
+        # 첫 스냅샷: flush 후 계산하므로 이번 변경이 이미 반영돼 있다
+        db.flush()
+        remaining, hours = _current_remaining(db, project_id)
+
+    # 당일 행이 이미 있으면 시작값은 쓰이지 않고 증분만 더해진다
+    table = ProjectDailySnapshot.__table__
+    dialect_insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = dialect_insert(table).values(
+        project_id=project_id, date=today,
+        remaining_tasks=remaining, remaining_hours=max(hours, 0.0),
+        completions=completions_delta,
+    )
+    new_hours = table.c.remaining_hours + hours_delta
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[table.c.project_id, table.c.date],
+        set_={
+            "remaining_tasks": table.c.remaining_tasks + remaining_delta,
+            "remaining_hours": case((new_hours > 0, new_hours), else_=0.0),
+            "completions": table.c.completions + completions_delta,
+        },
+    ))
+
+
+def backfill_snapshots(bind: Union[Session, Connection]) -> None:
+    """
+    첫 스냅샷 이전 기간을 할 일 created_at / done_at 이력으로 재구성해 채운다 (스냅샷이 없으면 오늘까지).
+    이력이 있는 날만 행을 만든다 — 증분 갱신과 같은 모양. 삭제된 할 일은 이력이 없어 빠진다. 커밋은 호출 측.
+    """
+    snaps = ProjectDailySnapshot.__table__
+    tasks = ProjectTask.__table__
+    first_snap = dict(bind.execute(
+        select(snaps.c.project_id, func.min(snaps.c.date)).group_by(snaps.c.project_id)
+    ).all())
+    first_task = bind.execute(
+        select(tasks.c.project_id, func.min(tasks.c.created_at)).group_by(tasks.c.project_id)
+    ).all()
+    tomorrow = date.today() + timedelta(days=1)
+
+    for project_id, created_min in first_task:
+        cutoff = first_snap.get(project_id, tomorrow)
+        if created_min is None or created_min.date() >= cutoff:
+            continue
+        # 날짜별 (남은 할 일 증감, 남은 시간 증감, 완료 수)
+        deltas: dict[date, list] = {}
+        rows = bind.execute(
+            select(tasks.c.created_at, tasks.c.done_at, tasks.c.is_done, tasks.c.estimated_hours)
+            .where(tasks.c.project_id == project_id)
+        ).all()
+        for created_at, done_at, is_done, est in rows:
+            if created_at is None or (is_done and done_at is None):
+                continue  # 완료 시점을 모르는 완료 항목은 이력에서 제외
+            est = est or 0.0
+            d = deltas.setdefault(created_at.date(), [0, 0.0, 0])
+            d[0] += 1
+            d[1] += est
+            if is_done:
+                d = deltas.setdefault(done_at.date(), [0, 0.0, 0])
+                d[0] -= 1
+                d[1] -= est
+                d[2] += 1
+
+        remaining, hours = 0, 0.0
+        values = []
+        for day in sorted(deltas):
+            if day >= cutoff:
+                break
+            remaining += deltas[day][0]
+            hours += deltas[day][1]
+            values.append({
+                "project_id": project_id, "date": day,
+                "remaining_tasks": remaining, "remaining_hours": max(hours, 0.0),
+                "completions": deltas[day][2],
+            })
+        if values:
+            bind.execute(insert(snaps), values)
+
+
+def delete_snapshots(db: Session, project_id: int) -> None:
+    db.query(ProjectDailySnapshot).filter(
+        ProjectDailySnapshot.project_id == project_id
+    ).delete(synchronize_session=False)
+
+
+# ─── 조회 ─────────────────────────────────────────────────────────────────────
+
+def get_burndown(db: Session, project_id: int, date_from: date, date_to: date) -> list[ProjectDailySnapshot]:
+    return (
+        db.query(ProjectDailySnapshot)
+        .filter(
+            ProjectDailySnapshot.project_id == project_id,
+            ProjectDailySnapshot.date >= date_from,
+            ProjectDailySnapshot.date <= date_to,
+        )
+        .order_by(ProjectDailySnapshot.date.asc())
+        .all()
+    )
+
+
+def _ewma(values: list[float], alpha: float) -> tuple[float, float]:
+    """지수가중 평균 / 표준편차"""
+    mean = values[0]
+    var = 0.0
+    for x in values[1:]:
+        diff = x - mean
+        incr = alpha * diff
+        mean += incr
+        var = (1 - alpha) * (var + diff * incr)
+    return mean, math.sqrt(var)
+
+
+def forecast_completion(db: Session, project: Project) -> ProjectForecastOut:
+    today = date.today()
+    snaps = get_burndown(db, project.id, today - timedelta(days=FORECAST_WINDOW_DAYS - 1), today)
+
+    remaining_tasks = project.task_total - project.task_done
+    remaining_hours = snaps[-1].remaining_hours if snaps else None
+
+    pace = 0.0
+    pace_std = 0.0
+    if snaps:
+        # 기록 없는 날은 완료 0건으로 채운다
+        by_day = {s.date: s.completions for s in snaps}
+        start = snaps[0].date
+        series = [float(by_day.get(start + timedelta(days=i), 0)) for i in range((today - start).days + 1)]
+        pace, pace_std = _ewma(series, EWMA_ALPHA)
+        pace = max(pace, 0.0)
+
+    def _eta(rate: float) -> Optional[date]:
+        if remaining_tasks <= 0:
+            return today
+        if rate <= 0:
+            return None
+        return today + timedelta(days=math.ceil(remaining_tasks / rate))
+
+    projected = _eta(pace)
+    optimistic = _eta(pace + CONFIDENCE_Z * pace_std)
+    pessimistic = _eta(pace - CONFIDENCE_Z * pace_std)
+
+    on_track = None
+    if project.deadline and projected is not None:
+        try:
+            on_track = projected <= date.fromisoformat(project.deadline)
+        except ValueError:
+            pass
+
+    return ProjectForecastOut(
+        project_id=project.id,
+        remaining_tasks=remaining_tasks,
+        remaining_hours=remaining_hours,
+        ewma_pace_per_day=round(pace, 4),
+        pace_std=round(pace_std, 4),
+        projected_completion_date=projected,
+        optimistic_date=optimistic,
+        pessimistic_date=pessimistic,
+        confidence=0.8,
+        deadline=project.deadline,
+        on_track=on_track,
+    )
@@ -0,0 +1,47 @@
+"""
+프로세스 내 TTL 캐시
+
+읽기 빈도가 높은 계산 결과(그룹 목표 달성률 등)를 키 단위로 보관한다.
+쓰기 경로에서 커밋 후 invalidate() 로 즉시 무효화하고,
+다른 워커 프로세스의 쓰기는 TTL 만료로 따라잡는다.
+"""
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, ttl_sec: Optional[float] = None, maxsize: int = 10000):
+        self.ttl_sec = ttl_sec
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_sec if self.ttl_sec else 0.0
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # 가장 오래 전에 넣은 항목부터 제거 (dict 삽입 순서)
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (expires_at, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
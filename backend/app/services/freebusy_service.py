@@ -0,0 +1,224 @@
+"""
+여러 사용자의 빈 시간 / 바쁜 시간 (free/busy) 집계 서비스
+
+사용자 × 날짜마다 15분 칸 96개짜리 비트맵(int)을 만들어 캐시하고,
+날짜별로 모든 사용자 비트맵을 OR 한 뒤 0 인 칸이 이어지는 구간을 공통 빈 시간으로 돌려준다.
+다른 사용자의 일정은 조회자에게 보이는 것(public / 나에게 selective 공유)만 바쁜 시간으로 친다.
+함께하기로 참여 중인 일정(task_participants)은 참여자의 바쁜 시간에도 포함된다.
+
+일정이 바뀌면 invalidate_user() 로 그 사용자의 버전을 올려 캐시된 비트맵을 모두 무효화한다.
+"""
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.models.group import GroupMember
+from app.models.task import Task
+from app.models.task_participant import TaskParticipant
+from app.models.task_visibility import TaskVisibilityFriend
+from app.services import recurrence_service
+from app.services.cache import TTLCache
+from app.services.friend_service import friend_ids
+
+SLOT_MIN = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MIN
+FULL_DAY = (1 << SLOTS_PER_DAY) - 1
+
+_bitmap_cache = TTLCache(ttl_sec=600, maxsize=50000)
+_versions: dict[int, int] = {}
+
+
+def invalidate_user(*user_ids: int) -> None:
+    """사용자 일정(또는 공개 범위)이 바뀐 뒤 호출"""
+    for uid in user_ids:
+        _versions[uid] = _versions.get(uid, 0) + 1
+
+
+def _cache_key(viewer_id: int, user_id: int, day: date) -> tuple:
+    # 본인 일정은 전부, 다른 사람 일정은 조회자별로 보이는 범위가 다르다
+    scope = "self" if viewer_id == user_id else viewer_id
+    return (user_id, scope, day, _versions.get(user_id, 0))
+
+
+# ─── 비트맵 생성 ──────────────────────────────────────────────────────────────
+
+def _mark(bitmaps: dict[date, int], start: datetime, end: datetime, first_day: date, last_day: date) -> None:
+    """[start, end) 가 걸치는 15분 칸을 모두 바쁨으로 표시 (칸 경계 바깥쪽으로 올림)"""
+    day = max(start.date(), first_day)
+    while day <= min(end.date(), last_day):
+        day_start = datetime.combine(day, time.min)
+        lo = max(0, int((start - day_start).total_seconds() // 60) // SLOT_MIN)
+        hi = min(SLOTS_PER_DAY, -(-int((end - day_start).total_seconds() // 60) // SLOT_MIN))
+        if hi > lo:
+            bitmaps[day] = bitmaps.get(day, 0) | (((1 << (hi - lo)) - 1) << lo)
+        day += timedelta(days=1)
+
+
+def _load_bitmaps(db: Session, viewer_id: int, user_ids: list[int], first_day: date, last_day: date) -> dict[int, dict[date, int]]:
+    """캐시에 없는 사용자들의 기간 비트맵을 한 번에 계산 (단발 일정 쿼리 1번 + 반복 일정 쿼리 1번)"""
+    date_from = datetime.combine(first_day, time.min)
+    date_to = datetime.combine(last_day + timedelta(days=1), time.min)
+    selective_ids = db.query(TaskVisibilityFriend.task_id).filter(
+        TaskVisibilityFriend.friend_user_id == viewer_id
+    ).scalar_subquery()
+    viewer_participating = db.query(TaskParticipant.task_id).filter(
+        TaskParticipant.user_id == viewer_id
+    ).scalar_subquery()
+    visible = or_(
+        Task.user_id == viewer_id,
+        Task.id.in_(viewer_participating),
+        Task.visibility == "public",
+        and_(Task.visibility == "selective", Task.id.in_(selective_ids)),
+    )
+
+    # 소유자 또는 참여자 — 참여 일정은 (일정, 참여자) 쌍마다 한 행
+    participant = db.query(TaskParticipant.task_id, TaskParticipant.user_id).filter(
+        TaskParticipant.user_id.in_(user_ids)
+    ).subquery()
+    owner_or_participant = or_(Task.user_id.in_(user_ids), participant.c.user_id.isnot(None))
+
+    result: dict[int, dict[date, int]] = {uid: {} for uid in user_ids}
+    rows = (
+        db.query(Task.user_id, participant.c.user_id, Task.start_at, Task.end_at)
+        .outerjoin(participant, participant.c.task_id == Task.id)
+        .filter(
+            owner_or_participant,
+            Task.rrule.is_(None),
+            Task.start_at < date_to,
+            Task.end_at > date_from,
+            visible,
+        )
+        .all()
+    )
+    for owner_id, participant_id, start, end in rows:
+        for uid in {owner_id, participant_id} & result.keys():
+            _mark(result[uid], start, end, first_day, last_day)
+
+    masters: dict[int, Task] = {}
+    busy_users: dict[int, set[int]] = {}
+    for task, participant_id in (
+        db.query(Task, participant.c.user_id)
+        .outerjoin(participant, participant.c.task_id == Task.id)
+        .filter(
+            owner_or_participant,
+            Task.rrule.isnot(None),
+            Task.start_at < date_to,
+            or_(Task.recurrence_until.is_(None), Task.recurrence_until > date_from),
+            visible,
+        )
+    ):
+        masters[task.id] = task
+        busy_users.setdefault(task.id, set()).update({task.user_id, participant_id} & result.keys())
+    for occ in recurrence_service.expand(db, list(masters.values()), date_from, date_to):
+        for uid in busy_users[occ.task.id]:
+            _mark(result[uid], occ.start_at, occ.end_at, first_day, last_day)
+    return result
+
+
+def get_bitmaps(db: Session, viewer_id: int, user_ids: list[int], first_day: date, last_day: date) -> dict[int, dict[date, int]]:
+    """{user_id: {day: 96비트 바쁨 비트맵}} — 사용자 × 날짜 단위로 캐시"""
+    days = [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+    result: dict[int, dict[date, int]] = {}
+    missing = []
+    for uid in user_ids:
+        cached = [_bitmap_cache.get(_cache_key(viewer_id, uid, d)) for d in days]
+        if any(b is None for b in cached):
+            missing.append(uid)
+        else:
+            result[uid] = dict(zip(days, cached))
+
+    if missing:
+        loaded = _load_bitmaps(db, viewer_id, missing, first_day, last_day)
+        for uid in missing:
+            result[uid] = {d: loaded[uid].get(d, 0) for d in days}
+            for d in days:
+                _bitmap_cache.set(_cache_key(viewer_id, uid, d), result[uid][d])
+    return result
+
+
+# ─── 빈 시간 계산 ─────────────────────────────────────────────────────────────
+
+def _runs(bitmap: int, value: int) -> list[tuple[int, int]]:
+    """비트맵에서 bit == value 인 연속 칸 [lo, hi) 목록"""
+    runs = []
+    lo = None
+    for i in range(SLOTS_PER_DAY + 1):
+        bit = (bitmap >> i) & 1 if i < SLOTS_PER_DAY else 1 - value
+        if bit == value and lo is None:
+            lo = i
+        elif bit != value and lo is not None:
+            runs.append((lo, i))
+            lo = None
+    return runs
+
+
+def _to_intervals(day_runs: list[tuple[date, int, int]]) -> list[tuple[datetime, datetime]]:
+    """(날짜, 시작 칸, 끝 칸) → datetime 구간. 자정에서 이어지는 구간은 하나로 합친다."""
+    intervals: list[tuple[datetime, datetime]] = []
+    for day, lo, hi in day_runs:
+        day_start = datetime.combine(day, time.min)
+        start = day_start + timedelta(minutes=lo * SLOT_MIN)
+        end = day_start + timedelta(minutes=hi * SLOT_MIN)
+        if intervals and intervals[-1][1] == start:
+            intervals[-1] = (intervals[-1][0], end)
+        else:
+            intervals.append((start, end))
+    return intervals
+
+
+def _hours_mask(day_start_hour: int, day_end_hour: int) -> int:
+    lo = day_start_hour * 60 // SLOT_MIN
+    hi = day_end_hour * 60 // SLOT_MIN
+    return ((1 << (hi - lo)) - 1) << lo
+
+
+def free_busy(
+    db: Session,
+    viewer_id: int,
+    user_ids: list[int],
+    first_day: date,
+    last_day: date,
+    min_duration_min: int = 30,
+    day_start_hour: int = 0,
+    day_end_hour: int = 24,
+) -> tuple[list[tuple[datetime, datetime]], dict[int, list[tuple[datetime, datetime]]]]:
+    """
+    반환값: (공통 빈 시간 목록, {user_id: 바쁜 시간 목록})
+    빈 시간은 하루 중 [day_start_hour, day_end_hour) 안에서 min_duration_min 이상인 구간만.
+    """
+    bitmaps = get_bitmaps(db, viewer_id, user_ids, first_day, last_day)
+    mask = _hours_mask(day_start_hour, day_end_hour)
+
+    free_runs = []
+    busy_runs: dict[int, list[tuple[date, int, int]]] = {uid: [] for uid in user_ids}
+    day = first_day
+    while day <= last_day:
+        merged = 0
+        for uid in user_ids:
+            bitmap = bitmaps[uid][day]
+            merged |= bitmap
+            busy_runs[uid].extend((day, lo, hi) for lo, hi in _runs(bitmap, 1))
+        # 시간대 밖은 바쁨으로 취급
+        merged |= FULL_DAY & ~mask
+        free_runs.extend((day, lo, hi) for lo, hi in _runs(merged, 0))
+        day += timedelta(days=1)
+
+    min_duration = timedelta(minutes=min_duration_min)
+    free = [(s, e) for s, e in _to_intervals(free_runs) if e - s >= min_duration]
+    busy = {uid: _to_intervals(runs) for uid, runs in busy_runs.items()}
+    return free, busy
+
+
+def allowed_user_ids(db: Session, viewer_id: int) -> set[int]:
+    """조회 가능한 사용자: 본인 + 수락된 친구 + 같은 그룹 멤버"""
+    allowed = {viewer_id} | friend_ids(db, viewer_id)
+    my_groups = db.query(GroupMember.group_id).filter(GroupMember.user_id == viewer_id).scalar_subquery()
+    allowed.update(
+        uid for (uid,) in db.query(GroupMember.user_id).filter(GroupMember.group_id.in_(my_groups))
+    )
+    return allowed
+
+
+def group_member_ids(db: Session, group_id: int) -> list[int]:
+    return [uid for (uid,) in db.query(GroupMember.user_id).filter(GroupMember.group_id == group_id)]
@@ -0,0 +1,55 @@
+"""
+친구 관계 서비스
+
+사용자별 친구 관계 {상대 user_id: Relation(friendship_id, status, 내가 보낸 신청인지)} 를
+쿼리 1번으로 읽어 캐시한다. 검색 결과의 관계 표시, 친구 일정 조회, 그룹 초대 같은
+관계 확인은 모두 캐시 조회로 끝난다.
+
+친구 신청 / 수락 / 거절·취소 / 삭제 커밋 후 invalidate_friends() 로 양쪽 사용자를 무효화한다.
+"""
+from typing import NamedTuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.models.friendship import Friendship
+from app.services.cache import TTLCache
+
+_relation_cache = TTLCache(ttl_sec=300, maxsize=20000)
+
+
+class Relation(NamedTuple):
+    friendship_id: int
+    status: str      # pending | accepted
+    outgoing: bool   # 내가 보낸 신청이면 True
+
+
+def get_relations(db: Session, user_id: int) -> dict[int, "Relation"]:
+    """{상대 user_id: Relation} — 반환값은 캐시와 공유되므로 수정하지 않는다"""
+    relations = _relation_cache.get(user_id)
+    if relations is not None:
+        return relations
+
+    relations = {}
+    for fid, a, b, status in db.query(
+        Friendship.id, Friendship.user_id, Friendship.friend_id, Friendship.status
+    ).filter(or_(Friendship.user_id == user_id, Friendship.friend_id == user_id)):
+        outgoing = a == user_id
+        relations[b if outgoing else a] = Relation(fid, status, outgoing)
+    _relation_cache.set(user_id, relations)
+    return relations
+
+
+def friend_ids(db: Session, user_id: int) -> set[int]:
+    """수락된 친구 user_id 집합"""
+    return {uid for uid, r in get_relations(db, user_id).items() if r.status == "accepted"}
+
+
+def are_friends(db: Session, a: int, b: int) -> bool:
+    relation = get_relations(db, a).get(b)
+    return relation is not None and relation.status == "accepted"
+
+
+def invalidate_friends(*user_ids: int) -> None:
+    for uid in user_ids:
+        _relation_cache.invalidate(uid)
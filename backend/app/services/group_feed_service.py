@@ -0,0 +1,101 @@
+"""
+그룹 피드 (멤버들의 공개 일정) 페이지 조회 + 첫 페이지 캐시
+
+멤버별로 (user_id, start_at) 또는 task_acl (viewer_id, owner_id, start_at) 인덱스 범위를 limit + 1 개씩 읽는 서브쿼리를 UNION ALL 로 한 번에 보내고,
+이미 start_at 순으로 정렬된 멤버별 결과를 heapq.merge 로 k-way 병합해 앞의 limit 개만 쓴다.
+멤버가 많고 일정이 오래 쌓여도 한 페이지 비용은 (멤버 수 × limit) 행을 넘지 않는다.
+
+커서 없는 첫 페이지는 (그룹, 조회자, 멤버별 버전) 키로 짧게 캐시한다.
+멤버가 일정 / 목표를 쓰면 invalidate_user() 로 그 사용자 버전을 올려, 그가 속한 모든 그룹의 캐시가 빗나가게 한다.
+"""
+import heapq
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import and_, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.task_acl import TaskAclEntry
+from app.services.acl_service import visible_task_ids
+from app.services.cache import TTLCache
+from app.services.friend_service import friend_ids
+
+_first_page_cache = TTLCache(ttl_sec=60, maxsize=5000)
+_versions: dict[int, int] = {}
+
+
+def invalidate_user(*user_ids: int) -> None:
+    """사용자의 일정 / 목표 / 공개 범위가 바뀐 뒤 호출"""
+    for uid in user_ids:
+        _versions[uid] = _versions.get(uid, 0) + 1
+
+
+def first_page_key(group_id: int, viewer_id: int, member_ids: list[int], limit: int) -> tuple:
+    return (group_id, viewer_id, limit, tuple((uid, _versions.get(uid, 0)) for uid in sorted(member_ids)))
+
+
+def get_cached(key: tuple):
+    return _first_page_cache.get(key)
+
+
+def set_cached(key: tuple, value) -> None:
+    _first_page_cache.set(key, value)
+
+
+def page_tasks(
+    db: Session,
+    viewer_id: int,
+    member_ids: list[int],
+    limit: int,
+    after: Optional[tuple[datetime, int]] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> tuple[list[Task], bool]:
+    """(start_at, id) 순 한 페이지의 일정과 다음 페이지 존재 여부"""
+    if not member_ids:
+        return [], False
+    friends = friend_ids(db, viewer_id)
+
+    per_member = []
+    for uid in member_ids:
+        if uid in friends:
+            # 친구 일정은 ACL 에 public / selective 가 모두 펼쳐져 있다
+            owner_id, start_at, task_id = TaskAclEntry.owner_id, TaskAclEntry.start_at, TaskAclEntry.task_id
+            q = select(owner_id, start_at, task_id).where(
+                TaskAclEntry.viewer_id == viewer_id, TaskAclEntry.owner_id == uid
+            )
+        else:
+            # 친구가 아닌 멤버(또는 본인)는 public 일정 + 나에게 selective 공유된 일정
+            owner_id, start_at, task_id = Task.user_id, Task.start_at, Task.id
+            q = select(owner_id, start_at, task_id).where(
+                Task.user_id == uid,
+                or_(Task.visibility == "public", Task.id.in_(visible_task_ids(viewer_id, uid))),
+            )
+        if date_from is not None:
+            q = q.where(start_at >= date_from)
+        if date_to is not None:
+            q = q.where(start_at < date_to)
+        if after is not None:
+            q = q.where(or_(start_at > after[0], and_(start_at == after[0], task_id > after[1])))
+        sub = q.order_by(start_at, task_id).limit(limit + 1).subquery()
+        per_member.append(select(*sub.c))
+    rows = db.execute(union_all(*per_member) if len(per_member) > 1 else per_member[0]).all()
+
+    # 멤버별 결과(각 limit + 1 행 이하)를 정렬된 run 으로 모아 k-way 병합
+    # (UNION ALL 결과 순서는 보장되지 않으므로 run 단위로 다시 정렬)
+    by_member: dict[int, list[tuple[datetime, int]]] = {}
+    for uid, start_at, task_id in rows:
+        by_member.setdefault(uid, []).append((start_at, task_id))
+    runs = [sorted(run) for run in by_member.values()]
+    merged = []
+    for item in heapq.merge(*runs):
+        merged.append(item)
+        if len(merged) > limit:
+            break
+    has_more = len(merged) > limit
+    ids = [task_id for _, task_id in merged[:limit]]
+    if not ids:
+        return [], False
+    by_id = {t.id: t for t in db.query(Task).filter(Task.id.in_(ids))}
+    return [by_id[i] for i in ids], has_more
@@ -0,0 +1,38 @@
+"""
+그룹 목표 달성률 서비스
+
+달성률 = 그룹의 모든 그룹 프로젝트 태스크 중 완료 비율.
+집계 쿼리 1번으로 계산하고 그룹 단위로 캐시하며,
+그룹 프로젝트 태스크가 바뀌면 invalidate_achievement_rate() 로 무효화한다.
+"""
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.models.group_project import GroupProject
+from app.models.group_project_task import GroupProjectTask
+from app.services.cache import TTLCache
+
+_rate_cache = TTLCache(ttl_sec=300)
+
+
+def get_achievement_rate(db: Session, group_id: int) -> float:
+    rate = _rate_cache.get(group_id)
+    if rate is not None:
+        return rate
+
+    total, done = (
+        db.query(
+            func.count(GroupProjectTask.id),
+            func.sum(case((GroupProjectTask.is_done == True, 1), else_=0)),
+        )
+        .join(GroupProject, GroupProject.id == GroupProjectTask.group_project_id)
+        .filter(GroupProject.group_id == group_id)
+        .one()
+    )
+    rate = round((done or 0) / total, 4) if total else 0.0
+    _rate_cache.set(group_id, rate)
+    return rate
+
+
+def invalidate_achievement_rate(group_id: int) -> None:
+    _rate_cache.invalidate(group_id)
@@ -0,0 +1,243 @@
+"""
+그룹 통계 롤업 서비스
+
+/groups/{id}/stats 가 매 요청마다 원시 테이블(LogEntry, ProjectTask)을 다시 읽지 않도록
+그룹 × 멤버 단위 GroupStatsRollup(프로젝트 카운트)과 사용자 × 일자 SleepDayRollup(수면 합계)을 유지한다.
+
+- 수면 기록 / 프로젝트 태스크 변경 / 그룹 가입·탈퇴 시 증분 반영 (커밋은 호출 측 트랜잭션)
+  카운트는 모두 SET x = x + n 으로 갱신하므로 동시에 기록해도 증분이 사라지지 않는다.
+- reconcile_group_stats() 가 주기적으로 원시 테이블에서 재계산해 드리프트를 바로잡는다.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Union
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.group import Group, GroupMember
+from app.models.group_stats_rollup import GroupStatsRollup
+from app.models.log_entry import LogEntry
+from app.models.project import Project
+from app.models.project_task import ProjectTask
+from app.models.sleep_day_rollup import SleepDayRollup
+from app.models.user import User
+
+SLEEP_WINDOW_DAYS = 7
+
+
+def _window_start() -> date:
+    return (datetime.utcnow() - timedelta(days=SLEEP_WINDOW_DAYS)).date()
+
+
+# ─── 원시 테이블 기반 계산 ────────────────────────────────────────────────────
+
+def rebuild_sleep_days(bind: Union[Session, Connection], user_ids: Optional[list[int]] = None) -> None:
+    """
+    최근 SLEEP_WINDOW_DAYS 일의 SleepDayRollup 을 수면 기록에서 다시 만든다 (user_ids 가 없으면 전체).
+    창 밖으로 밀려난 일자 행은 함께 지운다. 커밋은 호출 측.
+    """
+    window_start = _window_start()
+    table = SleepDayRollup.__table__
+    bind.execute(table.delete().where(table.c.day < window_start))
+    clear = table.delete()
+    day_col = func.date(LogEntry.timestamp)
+    source = (
+        select(LogEntry.user_id, day_col, func.sum(LogEntry.value), func.count(LogEntry.id))
+        .where(LogEntry.type == "sleep", LogEntry.timestamp >= datetime.combine(window_start, time.min))
+        .group_by(LogEntry.user_id, day_col)
+    )
+    if user_ids is not None:
+        clear = clear.where(table.c.user_id.in_(user_ids))
+        source = source.where(LogEntry.user_id.in_(user_ids))
+    bind.execute(clear)
+    bind.execute(insert(table).from_select(["user_id", "day", "sleep_total", "sleep_count"], source))
+
+
+def _compute_member_stats(db: Session, user_ids: list[int]) -> dict[int, dict]:
+    """user_ids 의 프로젝트 카운트를 grouped 쿼리 1번으로 계산한다."""
+    stats = {uid: {"done": 0, "total": 0} for uid in user_ids}
+    if not user_ids:
+        return stats
+
+    project_rows = (
+        db.query(
+            Project.user_id,
+            func.count(ProjectTask.id),
+            func.sum(case((ProjectTask.is_done == True, 1), else_=0)),
+        )
+        .join(ProjectTask, ProjectTask.project_id == Project.id)
+        .filter(Project.user_id.in_(user_ids))
+        .group_by(Project.user_id)
+        .all()
+    )
+    for uid, total, done in project_rows:
+        stats[uid]["total"] = int(total or 0)
+        stats[uid]["done"] = int(done or 0)
+    return stats
+
+
+def _apply_stats(row: GroupStatsRollup, member_stats: dict) -> None:
+    row.project_done_count = member_stats["done"]
+    row.project_total_count = member_stats["total"]
+
+
+# ─── 증분 반영 훅 ─────────────────────────────────────────────────────────────
+
+def on_sleep_logged(db: Session, user_id: int, timestamp: datetime, value: float, sign: int = 1) -> None:
+    """
+    수면 기록 추가(sign=1) / 삭제(sign=-1)를 그날의 SleepDayRollup 행에 반영.
+    INSERT … ON CONFLICT DO UPDATE SET x = x + n 한 문장이라 동시에 기록해도 증분이 사라지지 않는다.
+    """
+    day = timestamp.date()
+    if day < _window_start():
+        return
+    table = SleepDayRollup.__table__
+    dialect_insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = dialect_insert(table).values(
+        user_id=user_id, day=day, sleep_total=sign * float(value), sleep_count=sign,
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.day],
+        set_={
+            "sleep_total": table.c.sleep_total + stmt.excluded.sleep_total,
+            "sleep_count": table.c.sleep_count + stmt.excluded.sleep_count,
+        },
+    ))
+
+
+def on_project_tasks_changed(db: Session, user_id: int, done_delta: int = 0, total_delta: int = 0) -> None:
+    """개인 프로젝트 태스크 완료/추가/삭제를 해당 유저의 모든 그룹 롤업에 반영"""
+    if not done_delta and not total_delta:
+        return
+    db.query(GroupStatsRollup).filter(GroupStatsRollup.user_id == user_id).update(
+        {
+            GroupStatsRollup.project_done_count: GroupStatsRollup.project_done_count + done_delta,
+            GroupStatsRollup.project_total_count: GroupStatsRollup.project_total_count + total_delta,
+        },
+        synchronize_session=False,
+    )
+
+
+def on_member_joined(db: Session, group_id: int, user_id: int) -> None:
+    row = GroupStatsRollup(group_id=group_id, user_id=user_id)
+    _apply_stats(row, _compute_member_stats(db, [user_id])[user_id])
+    db.add(row)
+
+
+def on_member_left(db: Session, group_id: int, user_id: int) -> None:
+    db.query(GroupStatsRollup).filter(
+        GroupStatsRollup.group_id == group_id,
+        GroupStatsRollup.user_id == user_id,
+    ).delete(synchronize_session=False)
+
+
+def on_group_deleted(db: Session, group_id: int) -> None:
+    db.query(GroupStatsRollup).filter(
+        GroupStatsRollup.group_id == group_id
+    ).delete(synchronize_session=False)
+
+
+# ─── 재계산 (주기 작업) ───────────────────────────────────────────────────────
+
+def reconcile_group_stats(db: Session, group_id: Optional[int] = None) -> int:
+    """
+    원시 테이블에서 롤업을 다시 계산해 증분 반영 중 생긴 드리프트를 복구한다.
+    group_id 가 없으면 전체 그룹 대상. 반환값: 갱신된 롤업 행 수
+    """
+    member_q = db.query(GroupMember.group_id, GroupMember.user_id)
+    rollup_q = db.query(GroupStatsRollup)
+    if group_id is not None:
+        member_q = member_q.filter(GroupMember.group_id == group_id)
+        rollup_q = rollup_q.filter(GroupStatsRollup.group_id == group_id)
+
+    memberships = {(gid, uid) for gid, uid in member_q.all()}
+    rows = {(r.group_id, r.user_id): r for r in rollup_q.all()}
+    member_ids = sorted({uid for _, uid in memberships})
+    member_stats = _compute_member_stats(db, member_ids)
+    rebuild_sleep_days(db, member_ids if group_id is not None else None)
+
+    for key, row in rows.items():
+        if key not in memberships:
+            db.delete(row)
+    for gid, uid in sorted(memberships):
+        row = rows.get((gid, uid))
+        if row is None:
+            row = GroupStatsRollup(group_id=gid, user_id=uid)
+            db.add(row)
+        _apply_stats(row, member_stats[uid])
+
+    # Group.member_count 카운터도 실제 멤버 수로 맞춘다
+    group_q = db.query(Group)
+    if group_id is not None:
+        group_q = group_q.filter(Group.id == group_id)
+    member_counts: dict[int, int] = {}
+    for gid, _ in memberships:
+        member_counts[gid] = member_counts.get(gid, 0) + 1
+    for group in group_q:
+        if group.member_count != member_counts.get(group.id, 0):
+            group.member_count = member_counts.get(group.id, 0)
+
+    db.commit()
+    return len(memberships)
+
+
+# ─── 조회 ─────────────────────────────────────────────────────────────────────
+
+def load_group_stats(db: Session, group_id: int) -> dict:
+    rows = (
+        db.query(GroupStatsRollup, User)
+        .join(User, User.id == GroupStatsRollup.user_id)
+        .filter(GroupStatsRollup.group_id == group_id)
+        .order_by(GroupStatsRollup.id.asc())
+        .all()
+    )
+    sleep = {
+        uid: (total, count)
+        for uid, total, count in db.query(
+            SleepDayRollup.user_id, func.sum(SleepDayRollup.sleep_total), func.sum(SleepDayRollup.sleep_count),
+        )
+        .filter(
+            SleepDayRollup.user_id.in_([user.id for _, user in rows]),
+            SleepDayRollup.day >= _window_start(),
+        )
+        .group_by(SleepDayRollup.user_id)
+    }
+
+    member_activity = []
+    all_sleep_values = []
+    for row, user in rows:
+        sleep_total, sleep_count = sleep.get(user.id, (0.0, 0))
+        avg_sleep = round(sleep_total / sleep_count, 1) if sleep_count > 0 else None
+        if avg_sleep is not None:
+            all_sleep_values.append(avg_sleep)
+
+        done_count = row.project_done_count
+        total_count = row.project_total_count
+        project_progress = round((done_count / total_count) * 100, 1) if total_count > 0 else 0.0
+
+        member_activity.append({
+            "user_id": user.id,
+            "nickname": user.nickname or user.email.split("@")[0],
+            "avg_sleep": avg_sleep,
+            "project_done_count": done_count,
+            "project_progress_pct": project_progress,
+        })
+
+    avg_sleep_7d = (
+        round(sum(all_sleep_values) / len(all_sleep_values), 1)
+        if all_sleep_values else None
+    )
+    all_progress = [m["project_progress_pct"] for m in member_activity]
+    avg_project_progress = (
+        round(sum(all_progress) / len(all_progress), 1)
+        if all_progress else 0.0
+    )
+
+    return {
+        "avg_sleep_7d": avg_sleep_7d,
+        "avg_project_progress": avg_project_progress,
+        "member_activity": member_activity,
+    }
@@ -0,0 +1,42 @@
+"""
+그룹 프로젝트 태스크 마감 초과 스윕
+
+마감일이 지났는데 완료되지 않은 태스크의 overdue_recorded 를 일괄 기록한다.
+한 번 기록되면 이후 완료하더라도 지연 이력으로 남는다.
+GET 요청 경로는 읽기 전용으로 두고, 이 작업이 scheduler 에서 주기적으로 실행된다.
+스윕 주기 사이에 마감을 넘겨 완료된 태스크는 완료 시점에 record_if_completed_late() 가 기록한다.
+"""
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.models.group_project_task import GroupProjectTask
+
+
+def sweep_overdue_group_tasks(db: Session, today: date | None = None) -> int:
+    """
+    (deadline, is_done, overdue_recorded) 인덱스 범위 스캔 + 단일 UPDATE.
+    deadline 은 YYYY-MM-DD 문자열이므로 사전순 비교가 날짜 비교와 같다.
+    반환값: 새로 기록된 태스크 수
+    """
+    today_str = (today or date.today()).isoformat()
+    updated = (
+        db.query(GroupProjectTask)
+        .filter(
+            GroupProjectTask.deadline.isnot(None),
+            GroupProjectTask.deadline != "",
+            GroupProjectTask.deadline < today_str,
+            GroupProjectTask.is_done == False,
+            GroupProjectTask.overdue_recorded == False,
+        )
+        .update({GroupProjectTask.overdue_recorded: True}, synchronize_session=False)
+    )
+    db.commit()
+    return updated
+
+
+def record_if_completed_late(task: GroupProjectTask, today: date | None = None) -> None:
+    """마감일이 지난 뒤 완료 처리되는 태스크면 overdue_recorded 기록 (커밋은 호출 측)"""
+    if task.is_done and task.deadline and not task.overdue_recorded:
+        if task.deadline < (today or date.today()).isoformat():
+            task.overdue_recorded = True
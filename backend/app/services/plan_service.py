@@ -3,16 +3,26 @@ Twin Lab → 캘린더 초안 자동 생성 서비스
 
 시뮬레이션 변수 변화량을 받아 실행 가능한 일정 이벤트를 생성한다.
 생성된 이벤트 목록은 ScheduleDraft에 저장되고, 사용자가 편집 후 Task로 적용한다.
+매일 / 매주 반복되는 이벤트는 날짜별로 복사하지 않고 rrule 을 가진 이벤트 하나로 만든다.
+각 이벤트는 선호 시각 근처에서 기존 일정과 겹치지 않는 시각으로 배치한다 (placement_service).
+일부 회차만 겹치는 반복 이벤트는 여러 이벤트(나뉜 시리즈 + 단발)로 나뉘고, 빈 시각이 없는 회차는 빠진다.
 """
 import json
 from datetime import date, datetime, timedelta
 from typing import Optional
+from sqlalchemy import and_, func, insert, or_
 from sqlalchemy.orm import Session
 
-from app.models.schedule_draft import ScheduleDraft
+from app.models.schedule_draft import ScheduleDraft, ScheduleDraftEventRow
+from app.models.task import Task
 from app.schemas.schedule_draft import ScheduleDraftCreate, ScheduleDraftEvent, ScheduleDraftOut
+from app.schemas.task import naive_utc
+from app.services.placement_service import Placement, load_busy, place
+from app.services.recurrence_service import WEEKDAYS, series_until
 
 
+APPLY_CHUNK_SIZE = 500  # INSERT 한 문장에 넣는 최대 행 수 (초안 이벤트 / 적용 Task)
+
 # 요일 인덱스 0=월 ~ 6=일
 _WEEKDAY_DEFAULT_EXERCISE = [0, 2, 4]  # 월/수/금
 
@@ -24,9 +34,10 @@ def generate_draft(
     changes: dict,
     horizon_days: int = 7,
     preferences: Optional[dict] = None,
-) -> ScheduleDraft:
+) -> tuple[ScheduleDraft, list[datetime]]:
     """
     changes 에 따라 일정 이벤트 목록을 생성하고 ScheduleDraft를 DB에 저장한다.
+    반환값: (초안, 빈 시각을 찾지 못해 빠진 회차들의 선호 시작 시각)
 
     preferences (optional):
       sleep_target_hour  : 취침 목표 시각 (0~23, 기본 23)
@@ -44,6 +55,21 @@ def generate_draft(
     spend_reduction = changes.get("spend_reduction_10pct", 0)
     phone_reduction = changes.get("phone_minus_30min", 0)
 
+    first_day = today + timedelta(days=1)
+    daily_rule = f"FREQ=DAILY;COUNT={horizon_days}"
+
+    # 기간 안의 기존 일정 (수면 이벤트가 자정을 넘기므로 하루 여유)
+    horizon_start = datetime(first_day.year, first_day.month, first_day.day)
+    horizon_end = horizon_start + timedelta(days=horizon_days + 1)
+    busy = load_busy(db, user_id, horizon_start, horizon_end)
+
+    unplaced: list[datetime] = []
+
+    def _place(preferred: datetime, duration: timedelta, rrule: Optional[str], max_shift_min: int) -> list[Placement]:
+        result = place(busy, preferred, duration, rrule, horizon_end, max_shift_min, not_before=horizon_start)
+        unplaced.extend(result.unplaced)
+        return result.placements
+
     # ─── 수면 목표 이벤트 (매일) ─────────────────────────────────────────────
     if abs(sleep_delta) >= 0.5:
         sleep_hour = int(prefs.get("sleep_target_hour", 23))
@@ -51,9 +77,10 @@ def generate_draft(
         # 목표 수면 시간 반영
         target_sleep = 7.0 + sleep_delta
         actual_duration = max(5.0, min(10.0, target_sleep))
-        for day_offset in range(min(horizon_days, 14)):  # 최대 2주
-            d = today + timedelta(days=day_offset + 1)
-            bedtime = datetime(d.year, d.month, d.day, sleep_hour, 0)
+        for bedtime, rrule in _place(
+            datetime(first_day.year, first_day.month, first_day.day, sleep_hour, 0),
+            timedelta(hours=actual_duration), daily_rule, max_shift_min=90,
+        ):
             # 기상 시각 = 취침 + 목표 수면 시간
             wake_dt = bedtime + timedelta(hours=actual_duration)
             events.append({
@@ -63,17 +90,21 @@ def generate_draft(
                 "end_at": wake_dt.isoformat(),
                 "note": f"Twin Lab 플랜: 수면 {sleep_delta:+.1f}h",
                 "status": "planned",
+                "rrule": rrule,
             })
 
     # ─── 공부 블록 (매일) ────────────────────────────────────────────────────
     if study_delta > 0:
         study_format = prefs.get("study_format", "pomodoro")
         target_hours = max(1.0, study_delta)
-        for day_offset in range(min(horizon_days, 14)):
-            d = today + timedelta(days=day_offset + 1)
-            if study_format == "pomodoro":
-                sets = max(1, round(target_hours / 0.5))  # 25분 × N세트
-                block_start = datetime(d.year, d.month, d.day, 9, 0)
+        d = first_day
+        if study_format == "pomodoro":
+            sets = max(1, round(target_hours / 0.5))  # 25분 × N세트
+            # 세트 전체(마지막 휴식 제외)를 한 블록으로 배치
+            for block_start, rrule in _place(
+                datetime(d.year, d.month, d.day, 9, 0),
+                timedelta(minutes=sets * 35 - 10), daily_rule, max_shift_min=180,
+            ):
                 for s in range(sets):
                     s_start = block_start + timedelta(minutes=s * 35)  # 25분 공부 + 10분 휴식
                     s_end = s_start + timedelta(minutes=25)
@@ -84,10 +115,14 @@ def generate_draft(
                         "end_at": s_end.isoformat(),
                         "note": f"Twin Lab 플랜: 공부 {study_delta:+.1f}h / Pomodoro",
                         "status": "planned",
+                        "rrule": rrule,
                     })
-            else:
-                # 블록 방식: 하나의 긴 블록
-                block_start = datetime(d.year, d.month, d.day, 10, 0)
+        else:
+            # 블록 방식: 하나의 긴 블록
+            for block_start, rrule in _place(
+                datetime(d.year, d.month, d.day, 10, 0),
+                timedelta(hours=target_hours), daily_rule, max_shift_min=180,
+            ):
                 block_end = block_start + timedelta(hours=target_hours)
                 events.append({
                     "title": f"공부 블록 {target_hours:.1f}h",
@@ -96,6 +131,7 @@ def generate_draft(
                     "end_at": block_end.isoformat(),
                     "note": f"Twin Lab 플랜: 공부 {study_delta:+.1f}h",
                     "status": "planned",
+                    "rrule": rrule,
                 })
 
     # ─── 운동 이벤트 (주 N회) ────────────────────────────────────────────────
@@ -105,18 +141,20 @@ def generate_draft(
         raw_days = prefs.get("exercise_days", [])
         day_map = {"MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4, "SAT": 5, "SUN": 6}
         preferred_weekdays = [day_map[d] for d in raw_days if d in day_map] or _WEEKDAY_DEFAULT_EXERCISE
-        target_weekdays = preferred_weekdays[:sessions_per_week]
+        target_weekdays = sorted(preferred_weekdays[:sessions_per_week])
 
-        weeks = max(1, horizon_days // 7)
-        for week in range(weeks):
-            for wd in target_weekdays:
-                # 이번 주의 해당 요일 날짜 찾기
-                start_of_range = today + timedelta(days=week * 7 + 1)
-                days_until = (wd - start_of_range.weekday()) % 7
-                exercise_date = start_of_range + timedelta(days=days_until)
-                if (exercise_date - today).days > horizon_days:
-                    continue
-                ex_start = datetime(exercise_date.year, exercise_date.month, exercise_date.day, 7, 0)
+        # 내일 이후 첫 운동 요일부터 기간 끝날까지 주간 반복
+        exercise_date = min(
+            first_day + timedelta(days=(wd - first_day.weekday()) % 7) for wd in target_weekdays
+        )
+        last_day = today + timedelta(days=horizon_days)
+        if exercise_date <= last_day:
+            byday = ",".join(WEEKDAYS[wd] for wd in target_weekdays)
+            ex_rule = f"FREQ=WEEKLY;BYDAY={byday};UNTIL={last_day:%Y%m%d}"
+            for ex_start, rrule in _place(
+                datetime(exercise_date.year, exercise_date.month, exercise_date.day, 7, 0),
+                timedelta(minutes=45), ex_rule, max_shift_min=120,
+            ):
                 ex_end = ex_start + timedelta(minutes=45)
                 events.append({
                     "title": "운동 45분",
@@ -125,15 +163,18 @@ def generate_draft(
                     "end_at": ex_end.isoformat(),
                     "note": f"Twin Lab 플랜: 운동 주 {sessions_per_week}회",
                     "status": "planned",
+                    "rrule": rrule,
                 })
 
     # ─── 소비 예산 알림 (주간) ───────────────────────────────────────────────
     if spend_reduction > 0:
         reduction_pct = spend_reduction * 10
         weeks = max(1, horizon_days // 7)
-        for week in range(weeks):
-            check_date = today + timedelta(days=week * 7 + 1)
-            check_dt = datetime(check_date.year, check_date.month, check_date.day, 8, 0)
+        check_rule = f"FREQ=WEEKLY;COUNT={weeks}"
+        for check_dt, rrule in _place(
+            datetime(first_day.year, first_day.month, first_day.day, 8, 0),
+            timedelta(minutes=15), check_rule, max_shift_min=240,
+        ):
             events.append({
                 "title": f"주간 소비 목표 체크 (-{reduction_pct:.0f}% 목표)",
                 "category": "general",
@@ -141,14 +182,16 @@ def generate_draft(
                 "end_at": (check_dt + timedelta(minutes=15)).isoformat(),
                 "note": f"Twin Lab 플랜: 소비 {reduction_pct:.0f}% 절감 목표",
                 "status": "planned",
+                "rrule": rrule,
             })
 
     # ─── 집중 모드 / 폰 제한 알림 (매일) ────────────────────────────────────
     if phone_reduction > 0:
         reduction_min = phone_reduction * 30
-        for day_offset in range(min(horizon_days, 14)):
-            d = today + timedelta(days=day_offset + 1)
-            focus_start = datetime(d.year, d.month, d.day, 20, 0)  # 저녁 8시
+        for focus_start, rrule in _place(
+            datetime(first_day.year, first_day.month, first_day.day, 20, 0),  # 저녁 8시
+            timedelta(minutes=int(reduction_min)), daily_rule, max_shift_min=120,
+        ):
             focus_end = focus_start + timedelta(minutes=int(reduction_min))
             events.append({
                 "title": f"집중 모드 / 폰 제한 ({int(reduction_min)}분)",
@@ -157,47 +200,174 @@ def generate_draft(
                 "end_at": focus_end.isoformat(),
                 "note": f"Twin Lab 플랜: 휴대폰 -{int(reduction_min)}분",
                 "status": "planned",
+                "rrule": rrule,
             })
 
     # ─── DB 저장 ─────────────────────────────────────────────────────────────
     draft = ScheduleDraft(
         user_id=user_id,
         plan_name=plan_name,
-        events=json.dumps(events, ensure_ascii=False),
         status="draft",
     )
     db.add(draft)
+    db.flush()
+    _insert_events(db, draft.id, events)
     db.commit()
     db.refresh(draft)
-    return draft
+    return draft, unplaced
+
+
+# ─── 초안 이벤트 ─────────────────────────────────────────────────────────────
+
+def event_row(draft_id: int, ev: dict) -> dict:
+    return {
+        "draft_id": draft_id,
+        "title": ev["title"],
+        "category": ev.get("category") or "general",
+        "start_at": _parse_dt(ev["start_at"]),
+        "end_at": _parse_dt(ev["end_at"]),
+        "note": ev.get("note"),
+        "status": ev.get("status") or "planned",
+        "rrule": ev.get("rrule") or None,
+    }
 
 
-def apply_draft(db: Session, draft: ScheduleDraft) -> int:
+def _insert_events(db: Session, draft_id: int, events: list[dict]) -> None:
+    rows = [event_row(draft_id, ev) for ev in events]
+    for i in range(0, len(rows), APPLY_CHUNK_SIZE):
+        db.execute(insert(ScheduleDraftEventRow).values(rows[i:i + APPLY_CHUNK_SIZE]))
+
+
+def event_out(row: ScheduleDraftEventRow) -> ScheduleDraftEvent:
+    return ScheduleDraftEvent(
+        id=row.id,
+        title=row.title,
+        category=row.category,
+        start_at=row.start_at.isoformat(),
+        end_at=row.end_at.isoformat(),
+        note=row.note,
+        status=row.status,
+        rrule=row.rrule,
+    )
+
+
+def list_events(
+    db: Session,
+    draft_id: int,
+    after: Optional[tuple[datetime, int]] = None,
+    limit: Optional[int] = None,
+) -> list[ScheduleDraftEventRow]:
+    """(start_at, id) 순 — after 를 주면 그 다음부터 (키셋 페이지네이션)"""
+    query = db.query(ScheduleDraftEventRow).filter(ScheduleDraftEventRow.draft_id == draft_id)
+    if after:
+        query = query.filter(or_(
+            ScheduleDraftEventRow.start_at > after[0],
+            and_(ScheduleDraftEventRow.start_at == after[0], ScheduleDraftEventRow.id > after[1]),
+        ))
+    query = query.order_by(ScheduleDraftEventRow.start_at.asc(), ScheduleDraftEventRow.id.asc())
+    return query.all() if limit is None else query.limit(limit).all()
+
+
+def event_counts(db: Session, draft_ids: list[int]) -> dict[int, int]:
+    if not draft_ids:
+        return {}
+    return dict(
+        db.query(ScheduleDraftEventRow.draft_id, func.count(ScheduleDraftEventRow.id))
+        .filter(ScheduleDraftEventRow.draft_id.in_(draft_ids))
+        .group_by(ScheduleDraftEventRow.draft_id)
+        .all()
+    )
+
+
+def replace_events(db: Session, draft: ScheduleDraft, events: list[ScheduleDraftEvent]) -> None:
+    """이벤트 목록 전체 교체 (PUT) — 커밋은 호출 측"""
+    db.query(ScheduleDraftEventRow).filter(
+        ScheduleDraftEventRow.draft_id == draft.id
+    ).delete(synchronize_session=False)
+    _insert_events(db, draft.id, [e.model_dump(exclude={"id"}) for e in events])
+
+
+def update_event(row: ScheduleDraftEventRow, changes: dict) -> None:
     """
-    ScheduleDraft의 이벤트를 Task 테이블에 일괄 등록한다.
-    반환값: 생성된 Task 수
+    이벤트 1건 부분 수정 — 커밋은 호출 측.
+    시각 형식이 틀리거나 반영 후 종료가 시작보다 빠르면 ValueError (row 는 바꾸지 않는다).
     """
-    from app.models.task import Task
-
-    events = json.loads(draft.events)
-    created = 0
-    for ev in events:
-        task = Task(
-            user_id=draft.user_id,
-            title=ev["title"],
-            category=ev.get("category", "general"),
-            start_at=_parse_dt(ev["start_at"]),
-            end_at=_parse_dt(ev["end_at"]),
-            status=ev.get("status", "planned"),
-            visibility="private",
-        )
+    changes = dict(changes)
+    for key in ("start_at", "end_at"):
+        if key in changes:
+            changes[key] = parse_event_dt(changes[key])
+    start_at = changes.get("start_at", row.start_at)
+    end_at = changes.get("end_at", row.end_at)
+    if end_at <= start_at:
+        raise ValueError("종료 시각은 시작 시각 이후여야 합니다.")
+    for key, value in changes.items():
+        setattr(row, key, value)
+
+
+def apply_draft(db: Session, draft: ScheduleDraft, idempotency_key: Optional[str] = None) -> list[int]:
+    """
+    ScheduleDraft의 이벤트를 Task 테이블에 한 번의 bulk INSERT 로 등록한다.
+    반환값: 생성된 Task ID 목록 (이벤트 순서)
+
+    status 를 draft → applied 로 바꾸는 조건부 UPDATE(compare-and-set)가 먼저 성공한 요청만 등록하므로
+    동시에 두 번 제출해도 한 번만 적용된다. 같은 idempotency_key 로 재시도하면 처음 결과를 그대로 돌려준다.
+    이미 다른 요청으로 적용된 초안이면 ValueError.
+    """
+    if idempotency_key and draft.status == "applied" and draft.apply_key == idempotency_key:
+        return json.loads(draft.applied_task_ids or "[]")
+
+    claimed = (
+        db.query(ScheduleDraft)
+        .filter(ScheduleDraft.id == draft.id, ScheduleDraft.status == "draft")
+        .update({"status": "applied", "apply_key": idempotency_key})
+    )
+    if not claimed:
+        db.rollback()
+        db.refresh(draft)
+        if idempotency_key and draft.apply_key == idempotency_key:
+            return json.loads(draft.applied_task_ids or "[]")
+        raise ValueError("draft already applied")
+
+    rows = []
+    events = db.query(
+        ScheduleDraftEventRow.title, ScheduleDraftEventRow.category, ScheduleDraftEventRow.start_at,
+        ScheduleDraftEventRow.end_at, ScheduleDraftEventRow.status, ScheduleDraftEventRow.rrule,
+    ).filter(ScheduleDraftEventRow.draft_id == draft.id).order_by(
+        ScheduleDraftEventRow.start_at.asc(), ScheduleDraftEventRow.id.asc()
+    )
+    for title, category, start_at, end_at, status, rrule in events:
         # note 필드는 Task 모델에 없으므로 title에 포함
-        db.add(task)
-        created += 1
+        rows.append({
+            "user_id": draft.user_id,
+            "title": title,
+            "category": category,
+            "expected_min": max(0, int((end_at - start_at).total_seconds() // 60)),
+            "start_at": start_at,
+            "end_at": end_at,
+            "status": status,
+            "visibility": "private",
+            # 반복 이벤트는 원본 한 행으로 저장하고 캘린더 조회 시 회차를 전개한다
+            "rrule": rrule,
+            "recurrence_until": series_until(start_at, end_at, rrule) if rrule else None,
+        })
 
-    draft.status = "applied"
+    # 다중 VALUES INSERT ... RETURNING 한 문장 (바인드 변수 한도 때문에 청크 단위)
+    task_ids = []
+    for i in range(0, len(rows), APPLY_CHUNK_SIZE):
+        task_ids += db.scalars(insert(Task).values(rows[i:i + APPLY_CHUNK_SIZE]).returning(Task.id)).all()
+    # 한 문장 안에서 id 는 VALUES 순서대로 증가한다
+    task_ids.sort()
+    draft.applied_task_ids = json.dumps(task_ids)
     db.commit()
-    return created
+    return task_ids
+
+
+def parse_event_dt(s: str) -> datetime:
+    """사용자가 보낸 ISO8601 시각 (naive UTC 로 맞춤) — _parse_dt 와 달리 형식이 틀리면 ValueError"""
+    try:
+        return naive_utc(datetime.fromisoformat(s))
+    except (ValueError, TypeError):
+        raise ValueError(f"잘못된 시각 형식입니다: {s}")
 
 
 def _parse_dt(s: str) -> datetime:
@@ -0,0 +1,159 @@
+"""
+할 일 정렬용 분수(사전순) 랭크 키
+
+ProjectTask / GroupProjectTask 는 정수 order_index 대신 문자열 rank 로 정렬한다.
+두 키 사이에 항상 새 키를 만들 수 있으므로, 드래그앤드롭 이동은 옮긴 행 1개만 갱신한다.
+맨 뒤 추가는 자리값을 올려 키 길이를 거의 유지하고, 같은 자리에 반복 삽입하면 키가 길어지므로 rebalance_task_ranks() 가 주기적으로
+긴 키를 가진 목록만 골라 균등 간격 키로 다시 매긴다.
+
+키 규칙: 알파벳은 0-9a-z, 마지막 문자는 '0' 이 아니다.
+대문자를 쓰지 않으므로 SQLite(BINARY)와 PostgreSQL 로케일 정렬에서 순서가 같다.
+"""
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.group_project_task import GroupProjectTask
+from app.models.project_task import ProjectTask
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+RANK_MAX_LEN = 64        # 컬럼 길이 — 이보다 길어지면 요청 안에서 즉시 재정렬
+REBALANCE_THRESHOLD = 24  # 주기 작업이 재정렬하는 키 길이 기준
+
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    """a < b 인 두 키(a 는 '' 가능, b 는 None = +∞) 사이의 가장 짧은 키"""
+    if b is not None:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else "0") == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else BASE
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _increment(a: str) -> str:
+    """a 보다 큰 가장 짧은 키 — 'z' 가 아닌 첫 자리를 1 올린다 ('i'→'j', 'zk'→'zl', 'zz'→'zz1').
+    맨 뒤 추가를 +∞ 쪽으로 이등분하면 추가할 때마다 키가 한 글자씩 길어지므로,
+    자리값을 올려 BASE - 1 번 추가할 때 한 글자만 늘어나게 한다."""
+    for i, ch in enumerate(a):
+        if ch != DIGITS[-1]:
+            return a[:i] + DIGITS[DIGITS.index(ch) + 1]
+    return a + DIGITS[1]
+
+
+def key_between(a: Optional[str], b: Optional[str]) -> str:
+    """a 와 b 사이의 키. a=None 이면 맨 앞, b=None 이면 맨 뒤."""
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f"invalid rank range: {a!r} >= {b!r}")
+    if a and b is None:
+        return _increment(a)
+    return _midpoint(a or "", b)
+
+
+def spread_keys(n: int) -> list[str]:
+    """균등 간격의 짧은 키 n개 (재정렬 / 마이그레이션 백필용)"""
+    width = 1
+    while BASE ** width <= n * 4:
+        width += 1
+    span = BASE ** width
+    keys = []
+    for i in range(1, n + 1):
+        value = i * span // (n + 1)
+        digits = []
+        for _ in range(width):
+            value, r = divmod(value, BASE)
+            digits.append(DIGITS[r])
+        keys.append("".join(reversed(digits)).rstrip("0"))
+    return keys
+
+
+# ─── 목록 조작 ────────────────────────────────────────────────────────────────
+
+def next_rank(db: Session, model, parent_col, parent_id: int) -> str:
+    """목록 맨 뒤 키 — (parent, rank) 인덱스로 MAX 1번"""
+    last = db.query(func.max(model.rank)).filter(parent_col == parent_id).scalar()
+    key = key_between(last, None)
+    if len(key) > RANK_MAX_LEN:
+        # 키가 컬럼 한도를 넘으면 목록 전체를 즉시 재정렬 후 다시 계산
+        rebalance_tasks(db.query(model).filter(parent_col == parent_id).all())
+        db.flush()
+        last = db.query(func.max(model.rank)).filter(parent_col == parent_id).scalar()
+        key = key_between(last, None)
+    return key
+
+
+def apply_moves(db: Session, model, parent_col, parent_id: int, moves: list) -> list:
+    """
+    moves: [{task_id, prev_id, next_id}] — 이동 후 바로 앞/뒤 할 일 (None = 맨 앞/맨 뒤).
+    앞선 이동이 반영된 목록 기준으로 순서대로 적용하며, 이동마다 옮긴 행의 rank 만 바뀐다.
+    없는 할 일은 LookupError, 앞/뒤 순서가 맞지 않으면 ValueError.
+    """
+    ids = {m.task_id for m in moves} | {m.prev_id for m in moves if m.prev_id} | {m.next_id for m in moves if m.next_id}
+    tasks = {
+        t.id: t for t in db.query(model).filter(parent_col == parent_id, model.id.in_(ids)).all()
+    }
+    missing = ids - tasks.keys()
+    if missing:
+        raise LookupError(sorted(missing))
+
+    moved = []
+    for m in moves:
+        task = tasks[m.task_id]
+        if task.id in (m.prev_id, m.next_id):
+            raise ValueError("task cannot be its own neighbour")
+        prev_rank = tasks[m.prev_id].rank if m.prev_id else None
+        next_rank_ = tasks[m.next_id].rank if m.next_id else None
+        if prev_rank is None and next_rank_ is None:
+            db.flush()
+            others = db.query(func.max(model.rank)).filter(parent_col == parent_id, model.id != task.id).scalar()
+            prev_rank = others
+        key = key_between(prev_rank, next_rank_)
+        if len(key) > RANK_MAX_LEN:
+            # 드물게 키가 컬럼 한도를 넘으면 목록 전체를 즉시 재정렬 후 다시 계산
+            rebalance_tasks(db.query(model).filter(parent_col == parent_id).all())
+            prev_rank = tasks[m.prev_id].rank if m.prev_id else None
+            next_rank_ = tasks[m.next_id].rank if m.next_id else None
+            key = key_between(prev_rank, next_rank_)
+        task.rank = key
+        moved.append(task)
+    return moved
+
+
+# ─── 재정렬 ───────────────────────────────────────────────────────────────────
+
+def rebalance_tasks(tasks: list) -> None:
+    """같은 목록의 할 일들(현재 rank 순)에 균등 간격 키를 다시 매긴다 (커밋은 호출 측)"""
+    ordered = sorted(tasks, key=lambda t: (t.rank or "", t.id))
+    for task, key in zip(ordered, spread_keys(len(ordered))):
+        task.rank = key
+
+
+def rebalance_task_ranks(db: Session) -> int:
+    """키 길이가 기준을 넘은 목록만 재정렬. 반환값: 재정렬한 목록 수"""
+    count = 0
+    for model, parent_col in (
+        (ProjectTask, ProjectTask.project_id),
+        (GroupProjectTask, GroupProjectTask.group_project_id),
+    ):
+        parent_ids = [
+            pid for (pid,) in db.query(parent_col)
+            .group_by(parent_col)
+            .having(func.max(func.length(model.rank)) > REBALANCE_THRESHOLD)
+            .all()
+        ]
+        for pid in parent_ids:
+            rebalance_tasks(db.query(model).filter(parent_col == pid).all())
+            count += 1
+    db.commit()
+    return count
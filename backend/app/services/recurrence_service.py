@@ -0,0 +1,206 @@
+"""
+반복 일정 (RRULE 부분집합) 전개 서비스
+
+반복 일정은 Task 한 행(원본)으로 저장하고, 조회 기간에 해당하는 회차만 그때그때 전개한다.
+회차별 취소 / 수정은 TaskOccurrenceOverride 에 원래 시작 시각을 키로 저장한다.
+
+지원 규칙 (RFC 5545 의 부분집합):
+  FREQ=DAILY|WEEKLY ; INTERVAL=n ; BYDAY=MO,WE,FR (WEEKLY 전용) ; COUNT=n | UNTIL=YYYYMMDD[THHMMSS]
+예) "FREQ=DAILY;COUNT=90", "FREQ=WEEKLY;BYDAY=MO,WE,FR;UNTIL=20261231"
+"""
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Iterator, NamedTuple, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.task_occurrence import TaskOccurrenceOverride
+from app.models.task_participant import TaskParticipant
+
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+
+@dataclass(frozen=True)
+class RRule:
+    freq: str
+    interval: int = 1
+    byday: tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+
+class Occurrence(NamedTuple):
+    task: Task
+    occurrence_start: datetime  # 회차 식별자 (규칙상 원래 시작 시각)
+    title: str
+    start_at: datetime
+    end_at: datetime
+    status: str
+
+
+# ─── 규칙 파싱 ────────────────────────────────────────────────────────────────
+
+def parse_rrule(value: str) -> RRule:
+    """RRULE 문자열 파싱. 지원하지 않는 규칙은 ValueError."""
+    parts = {}
+    for item in value.upper().removeprefix("RRULE:").split(";"):
+        if not item:
+            continue
+        key, sep, val = item.partition("=")
+        if not sep or not val:
+            raise ValueError(f"invalid rrule part: {item!r}")
+        parts[key] = val
+
+    freq = parts.pop("FREQ", None)
+    if freq not in ("DAILY", "WEEKLY"):
+        raise ValueError("FREQ must be DAILY or WEEKLY")
+    interval = int(parts.pop("INTERVAL", "1"))
+    if interval < 1:
+        raise ValueError("INTERVAL must be >= 1")
+
+    byday: tuple[int, ...] = ()
+    if "BYDAY" in parts:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        try:
+            byday = tuple(sorted({WEEKDAYS.index(d) for d in parts.pop("BYDAY").split(",")}))
+        except ValueError:
+            raise ValueError("invalid BYDAY")
+
+    count = int(parts.pop("COUNT")) if "COUNT" in parts else None
+    if count is not None and count < 1:
+        raise ValueError("COUNT must be >= 1")
+    until = None
+    if "UNTIL" in parts:
+        raw = parts.pop("UNTIL").rstrip("Z")
+        fmt = "%Y%m%dT%H%M%S" if "T" in raw else "%Y%m%d"
+        until = datetime.strptime(raw, fmt)
+        if "T" not in raw:
+            until = datetime.combine(until.date(), time.max)
+    if count is not None and until is not None:
+        raise ValueError("COUNT and UNTIL cannot be combined")
+    if parts:
+        raise ValueError(f"unsupported rrule parts: {', '.join(sorted(parts))}")
+    return RRule(freq=freq, interval=interval, byday=byday, count=count, until=until)
+
+
+def series_until(start_at: datetime, end_at: datetime, rrule: str) -> Optional[datetime]:
+    """마지막 회차 종료 시각의 상한 (Task.recurrence_until 용). 무한 반복이면 None."""
+    rule = parse_rrule(rrule)
+    duration = end_at - start_at
+    if rule.until is not None:
+        return rule.until + duration
+    if rule.count is None:
+        return None
+    if rule.freq == "DAILY":
+        return start_at + timedelta(days=(rule.count - 1) * rule.interval) + duration
+    days = rule.byday or (start_at.weekday(),)
+    monday = start_at - timedelta(days=start_at.weekday())
+    skipped = sum(1 for d in days if d < start_at.weekday())
+    week_idx, pos = divmod(rule.count - 1 + skipped, len(days))
+    return monday + timedelta(weeks=week_idx * rule.interval, days=days[pos]) + duration
+
+
+# ─── 전개 ─────────────────────────────────────────────────────────────────────
+
+def iter_occurrences(start_at: datetime, rule: RRule, window_start: datetime, window_end: datetime) -> Iterator[datetime]:
+    """[window_start, window_end) 에 시작하는 회차의 시작 시각. 첫 회차까지 건너뛰는 비용은 O(1)."""
+    if rule.freq == "DAILY":
+        k = max(0, (window_start - start_at).days // rule.interval)
+        step = timedelta(days=rule.interval)
+        while True:
+            occ = start_at + step * k
+            if occ >= window_end or (rule.count is not None and k >= rule.count) or (rule.until and occ > rule.until):
+                return
+            if occ >= window_start:
+                yield occ
+            k += 1
+
+    # WEEKLY: 시작 주 월요일 기준 주 번호 w (interval 배수) × 요일
+    days = rule.byday or (start_at.weekday(),)
+    monday = datetime.combine(start_at.date() - timedelta(days=start_at.weekday()), start_at.time())
+    skipped = sum(1 for d in days if d < start_at.weekday())  # 시작 주에서 시작 전 요일 수
+    w = max(0, (window_start - monday).days // 7)
+    w -= w % rule.interval
+    while True:
+        for pos, d in enumerate(days):
+            occ = monday + timedelta(weeks=w, days=d)
+            if occ < start_at:
+                continue
+            index = (w // rule.interval) * len(days) + pos - skipped
+            if occ >= window_end or (rule.count is not None and index >= rule.count) or (rule.until and occ > rule.until):
+                return
+            if occ >= window_start:
+                yield occ
+        w += rule.interval
+
+
+def is_occurrence(task: Task, occurrence_start: datetime) -> bool:
+    rule = parse_rrule(task.rrule)
+    return any(True for _ in iter_occurrences(
+        task.start_at, rule, occurrence_start, occurrence_start + timedelta(microseconds=1)
+    ))
+
+
+def load_recurring(db: Session, user_id: int, date_from: datetime, date_to: datetime) -> list[Task]:
+    """기간과 겹칠 수 있는 반복 일정 원본 행 (내 일정 + 참여 중인 일정)"""
+    participating = db.query(TaskParticipant.task_id).filter(TaskParticipant.user_id == user_id)
+    return (
+        db.query(Task)
+        .filter(
+            or_(Task.user_id == user_id, Task.id.in_(participating.scalar_subquery())),
+            Task.rrule.isnot(None),
+            Task.start_at < date_to,
+            or_(Task.recurrence_until.is_(None), Task.recurrence_until > date_from),
+        )
+        .all()
+    )
+
+
+def expand(db: Session, tasks: list[Task], date_from: datetime, date_to: datetime) -> list[Occurrence]:
+    """반복 일정 원본들을 [date_from, date_to) 와 겹치는 회차로 전개 (수정 / 취소 반영)"""
+    if not tasks:
+        return []
+    # 기간 근처 회차의 수정 / 취소만 읽는다 (오래된 예외가 쌓여도 조회 비용 일정)
+    lookback = date_from - max(t.end_at - t.start_at for t in tasks)
+    overrides: dict[int, dict[datetime, TaskOccurrenceOverride]] = {}
+    for o in db.query(TaskOccurrenceOverride).filter(
+        TaskOccurrenceOverride.task_id.in_([t.id for t in tasks]),
+        or_(
+            and_(TaskOccurrenceOverride.occurrence_start >= lookback, TaskOccurrenceOverride.occurrence_start < date_to),
+            and_(TaskOccurrenceOverride.start_at >= lookback, TaskOccurrenceOverride.start_at < date_to),
+        ),
+    ):
+        overrides.setdefault(o.task_id, {})[o.occurrence_start] = o
+
+    result = []
+    for task in tasks:
+        rule = parse_rrule(task.rrule)
+        duration = task.end_at - task.start_at
+        task_overrides = overrides.get(task.id, {})
+        starts = set(iter_occurrences(task.start_at, rule, date_from - duration, date_to))
+        # 다른 날로 옮겨져 기간 안으로 들어온 회차
+        starts.update(
+            occ for occ, o in task_overrides.items()
+            if o.start_at is not None and o.start_at < date_to and (o.end_at or o.start_at + duration) > date_from
+        )
+        for occ in starts:
+            o = task_overrides.get(occ)
+            if o is not None and o.is_cancelled:
+                continue
+            start_at = o.start_at if o is not None and o.start_at else occ
+            end_at = o.end_at if o is not None and o.end_at else start_at + duration
+            if not (start_at < date_to and end_at > date_from):
+                continue
+            result.append(Occurrence(
+                task=task,
+                occurrence_start=occ,
+                title=(o.title if o is not None and o.title else task.title),
+                start_at=start_at,
+                end_at=end_at,
+                status=(o.status if o is not None and o.status else task.status),
+            ))
+    result.sort(key=lambda r: (r.start_at, r.task.id))
+    return result
@@ -0,0 +1,58 @@
+"""
+주기 작업 스케줄러
+
+요청 경로 밖에서 돌아야 하는 작업(롤업 재계산 등)을 등록해 두고,
+앱 lifespan 동안 각 작업을 자체 간격으로 반복 실행한다.
+작업 함수는 전용 세션을 받아 스스로 커밋한다.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PeriodicJob:
+    name: str
+    interval_sec: int
+    func: Callable[[Session], object]
+
+
+_JOBS: list[PeriodicJob] = []
+
+
+def register_job(name: str, interval_sec: int, func: Callable[[Session], object]) -> None:
+    _JOBS.append(PeriodicJob(name=name, interval_sec=interval_sec, func=func))
+
+
+def run_job_once(job: PeriodicJob) -> None:
+    db = SessionLocal()
+    try:
+        job.func(db)
+    except Exception:
+        db.rollback()
+        logger.exception("periodic job %s failed", job.name)
+    finally:
+        db.close()
+
+
+async def _job_loop(job: PeriodicJob) -> None:
+    while True:
+        await asyncio.to_thread(run_job_once, job)
+        await asyncio.sleep(job.interval_sec)
+
+
+def start_jobs() -> list[asyncio.Task]:
+    return [asyncio.create_task(_job_loop(job), name=job.name) for job in _JOBS]
+
+
+async def stop_jobs(tasks: list[asyncio.Task]) -> None:
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
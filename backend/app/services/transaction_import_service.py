@@ -0,0 +1,171 @@
+"""
+가계부 CSV (은행 / 카드 내역) 가져오기 서비스
+
+파일을 csv 리더로 한 줄씩 읽어 프로필(TransactionImportProfile)대로 열을 매핑하고,
+IMPORT_BATCH_SIZE 행씩 일괄 INSERT 한다. 파일 전체도, 파일 전체의 중복 확인 상태도 메모리에 올리지 않는다.
+
+중복 제거: 각 행의 내용(날짜, 유형, 금액, 분류, 메모)과 "같은 내용이 몇 번째인지"로
+content_hash 를 만들어 트랜잭션에 저장하고, (user_id, content_hash) 유니크 인덱스에
+INSERT … ON CONFLICT DO NOTHING 으로 넣는다. 같은 파일이나 기간이 겹치는 내역을 다시 가져와도
+이미 있는 행은 건너뛰고, 같은 날 같은 금액의 결제가 여러 건인 경우는 각각 유지된다.
+순번은 배치 안에서만 세고 배치 경계에 걸친 날짜의 것만 다음 배치로 넘긴다 — 날짜순으로 정렬된
+내역 파일에서는 파일 전체로 센 것과 같다.
+월 롤업과 spend 일 집계는 가져오기가 끝난 뒤 변경분을 모아 한 번에 반영한다.
+"""
+import csv
+import hashlib
+from datetime import date, datetime
+from functools import lru_cache
+from typing import IO, Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.transaction import Transaction
+from app.schemas.transaction import TransactionImportProfile, TransactionImportResult
+from app.services.aggregate_service import add_spend_delta, apply_spend_deltas
+from app.services.transaction_rollup_service import DEFAULT_CATEGORY, add_to_rollups, month_start
+
+TRANSACTION_TYPES = ("income", "expense", "investment")
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+IMPULSE_VALUES = {"1", "true", "y", "yes", "충동"}
+
+
+def validation_error(tx_type: str, amount: float) -> Optional[str]:
+    """create_transaction 과 같은 유형 / 금액 검증. 문제가 없으면 None."""
+    if tx_type not in TRANSACTION_TYPES:
+        return "type은 income/expense/investment 중 하나여야 합니다."
+    if amount <= 0:
+        return "금액은 0보다 커야 합니다."
+    return None
+
+
+def content_hash(tx_date: date, tx_type: str, amount: float, category: Optional[str], memo: Optional[str], nth: int) -> str:
+    raw = f"{tx_date.isoformat()}|{tx_type}|{amount:.2f}|{category or ''}|{memo or ''}|{nth}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str, fmt: str) -> date:
+    # 내역 파일은 같은 날짜가 반복되므로 strptime 결과를 재사용
+    return datetime.strptime(value, fmt).date()
+
+
+def _parse_amount(value: str) -> float:
+    cleaned = value.strip().replace(",", "").replace("₩", "").replace("원", "").replace(" ", "")
+    if cleaned.startswith("(") and cleaned.endswith(")"):  # 회계 표기 음수
+        cleaned = "-" + cleaned[1:-1]
+    return float(cleaned)
+
+
+def _parse_row(row: dict, profile: TransactionImportProfile) -> tuple[date, str, float, Optional[str], Optional[str], bool]:
+    """CSV 한 행 → (날짜, 유형, 금액, 분류, 메모, 충동 여부). 읽을 수 없으면 ValueError."""
+    def cell(column: Optional[str]) -> Optional[str]:
+        if not column:
+            return None
+        value = (row.get(column) or "").strip()
+        return value or None
+
+    raw_date = cell(profile.date_column)
+    raw_amount = cell(profile.amount_column)
+    if raw_date is None or raw_amount is None:
+        raise ValueError("날짜 / 금액이 비어 있습니다.")
+    try:
+        tx_date = _parse_date(raw_date, profile.date_format)
+    except ValueError:
+        raise ValueError(f"날짜 형식이 맞지 않습니다: {raw_date}")
+    try:
+        amount = _parse_amount(raw_amount)
+    except ValueError:
+        raise ValueError(f"금액을 읽을 수 없습니다: {raw_amount}")
+
+    if profile.type_column:
+        raw_type = cell(profile.type_column) or ""
+        tx_type = profile.type_map.get(raw_type, raw_type.lower())
+    else:
+        # 유형 열이 없으면 금액 부호로 판단 (출금 음수 / 입금 양수)
+        tx_type = "expense" if amount < 0 else "income"
+        amount = abs(amount)
+    is_impulse = tx_type == "expense" and (cell(profile.impulse_column) or "").lower() in IMPULSE_VALUES
+    return tx_date, tx_type, amount, cell(profile.category_column), cell(profile.memo_column), is_impulse
+
+
+def _insert_new_statement(dialect_name: str):
+    """(user_id, content_hash) 가 이미 있는 행은 건너뛰고, 실제로 들어간 행의 content_hash 를 돌려주는 INSERT"""
+    dialect_insert = sqlite_insert if dialect_name == "sqlite" else pg_insert
+    table = Transaction.__table__
+    return (
+        dialect_insert(table)
+        .on_conflict_do_nothing(index_elements=[table.c.user_id, table.c.content_hash])
+        .returning(table.c.content_hash)
+    )
+
+
+def import_csv(db: Session, user_id: int, stream: IO[str], profile: TransactionImportProfile) -> TransactionImportResult:
+    """
+    텍스트 스트림의 CSV 를 가져온다 (커밋은 호출 측).
+    헤더에 프로필의 필수 열이 없으면 ValueError.
+    """
+    reader = csv.DictReader(stream, delimiter=profile.delimiter)
+    header = set(reader.fieldnames or [])
+    required = [c for c in (profile.date_column, profile.amount_column, profile.type_column) if c]
+    missing = [c for c in required if c not in header]
+    if missing:
+        raise ValueError(f"CSV 헤더에 열이 없습니다: {', '.join(missing)}")
+
+    result = TransactionImportResult()
+    # 배치 안 같은 내용의 등장 횟수 (행 자체는 보관하지 않고 날짜 + 16바이트 digest 만)
+    occurrences: dict[tuple[date, bytes], int] = {}
+    rollup_deltas: dict[tuple[date, str, str], list] = {}
+    spend_deltas: dict[date, list] = {}
+    batch: list[dict] = []
+    insert_new = _insert_new_statement(db.bind.dialect.name)
+
+    def flush() -> None:
+        nonlocal occurrences
+        # 중복 확인은 유니크 인덱스에 맡긴다 — 배치마다 INSERT 1번 (ORM 이 아닌 Core 로 한 문장에 모아 보낸다)
+        inserted = set(db.execute(insert_new, batch).scalars())
+        new_rows = [r for r in batch if r["content_hash"] in inserted]
+        for r in new_rows:
+            delta = rollup_deltas.setdefault((month_start(r["date"]), r["type"], r["category"] or DEFAULT_CATEGORY), [0.0, 0])
+            delta[0] += r["amount"]
+            delta[1] += 1
+            if r["type"] == "expense":
+                add_spend_delta(spend_deltas, r["date"], r["amount"], r["is_impulse"], r["category"])
+        result.imported += len(new_rows)
+        result.duplicates += len(batch) - len(new_rows)
+        # 마지막 날짜는 다음 배치에서 이어질 수 있으므로 그 날짜의 순번만 남긴다
+        last_date = batch[-1]["date"]
+        occurrences = {k: n for k, n in occurrences.items() if k[0] == last_date}
+        batch.clear()
+
+    for line_no, row in enumerate(reader, start=2):
+        try:
+            tx_date, tx_type, amount, category, memo, is_impulse = _parse_row(row, profile)
+            error = validation_error(tx_type, amount)
+            if error:
+                raise ValueError(error)
+        except ValueError as err:
+            result.failed += 1
+            if len(result.errors) < MAX_REPORTED_ERRORS:
+                result.errors.append(f"{line_no}행: {err}")
+            continue
+
+        key = (tx_date, hashlib.blake2b(f"{tx_type}|{amount:.2f}|{category}|{memo}".encode(), digest_size=16).digest())
+        nth = occurrences.get(key, 0)
+        occurrences[key] = nth + 1
+        batch.append({
+            "user_id": user_id, "type": tx_type, "date": tx_date, "amount": amount,
+            "category": category, "memo": memo, "is_impulse": is_impulse,
+            "content_hash": content_hash(tx_date, tx_type, amount, category, memo, nth),
+        })
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            flush()
+    if batch:
+        flush()
+
+    add_to_rollups(db, user_id, rollup_deltas)
+    apply_spend_deltas(db, user_id, spend_deltas)
+    return result
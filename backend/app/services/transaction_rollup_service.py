@@ -0,0 +1,139 @@
+"""
+가계부 월별 롤업 서비스
+
+TransactionRollup 을 트랜잭션 생성 / 삭제마다 증분 갱신하고 (커밋은 호출 측),
+월 요약 / 여러 달 추이는 원시 트랜잭션 대신 롤업 행을 (user_id, month) 범위로 읽는다.
+rebuild_rollups() 는 원시 트랜잭션에서 롤업을 다시 만든다:
+
+    python -m app.services.transaction_rollup_service [user_id]
+"""
+import sys
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Date, cast, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.transaction import Transaction
+from app.models.transaction_rollup import TransactionRollup
+
+DEFAULT_CATEGORY = "기타"
+UPSERT_CHUNK_SIZE = 500  # INSERT 한 문장에 넣는 최대 롤업 행 수
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+# ─── 증분 갱신 ────────────────────────────────────────────────────────────────
+
+def _upsert(db: Session, values: list[dict]) -> None:
+    """
+    INSERT … ON CONFLICT (user_id, month, type, category) DO UPDATE SET x = x + n 한 문장.
+    같은 롤업 행에 동시에 기록해도 uq_transaction_rollup 충돌이나 증분 유실이 없다.
+    """
+    table = TransactionRollup.__table__
+    dialect_insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = dialect_insert(table).values(values)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.month, table.c.type, table.c.category],
+        set_={
+            "amount_sum": table.c.amount_sum + stmt.excluded.amount_sum,
+            "tx_count": table.c.tx_count + stmt.excluded.tx_count,
+        },
+    ))
+
+
+def record_transaction(db: Session, tx: Transaction, sign: int = 1) -> None:
+    """tx 를 해당 월 롤업에 더하거나(sign=1) 뺀다(sign=-1). 건수가 0 이 되면 행을 지운다."""
+    category = tx.category or DEFAULT_CATEGORY
+    month = month_start(tx.date)
+    _upsert(db, [{
+        "user_id": tx.user_id, "month": month, "type": tx.type, "category": category,
+        "amount_sum": sign * tx.amount, "tx_count": sign,
+    }])
+    if sign < 0:
+        # 지울지는 갱신이 끝난 행의 건수로 판단한다 (앞서 읽은 값이 아니라)
+        db.execute(delete(TransactionRollup).where(
+            TransactionRollup.user_id == tx.user_id,
+            TransactionRollup.month == month,
+            TransactionRollup.type == tx.type,
+            TransactionRollup.category == category,
+            TransactionRollup.tx_count <= 0,
+        ))
+
+
+def add_to_rollups(db: Session, user_id: int, deltas: dict[tuple[date, str, str], list]) -> None:
+    """{(월, 유형, 분류): [금액 합, 건수]} 변경분을 한 번에 반영 (일괄 가져오기용)"""
+    values = [
+        {"user_id": user_id, "month": month, "type": tx_type, "category": category,
+         "amount_sum": amount, "tx_count": count}
+        for (month, tx_type, category), (amount, count) in deltas.items()
+    ]
+    # 바인드 변수 한도 때문에 청크 단위
+    for i in range(0, len(values), UPSERT_CHUNK_SIZE):
+        _upsert(db, values[i:i + UPSERT_CHUNK_SIZE])
+
+
+# ─── 조회 ─────────────────────────────────────────────────────────────────────
+
+def load_months(db: Session, user_id: int, first_month: date, last_month: date) -> list[tuple[date, str, str, float]]:
+    """[first_month, last_month] 월들의 (월, 유형, 분류, 합계) 행 — 쿼리 1번"""
+    return (
+        db.query(TransactionRollup.month, TransactionRollup.type, TransactionRollup.category, TransactionRollup.amount_sum)
+        .filter(
+            TransactionRollup.user_id == user_id,
+            TransactionRollup.month >= month_start(first_month),
+            TransactionRollup.month <= month_start(last_month),
+        )
+        .all()
+    )
+
+
+# ─── 재생성 ───────────────────────────────────────────────────────────────────
+
+def _month_expr(dialect_name: str):
+    if dialect_name == "sqlite":
+        return func.date(Transaction.date, "start of month")
+    return cast(func.date_trunc("month", Transaction.date), Date)
+
+
+def rebuild_statement(dialect_name: str, user_id: Optional[int] = None):
+    """원시 트랜잭션을 GROUP BY 해서 롤업 행을 채우는 INSERT ... SELECT"""
+    month = _month_expr(dialect_name)
+    category = func.coalesce(Transaction.category, DEFAULT_CATEGORY)
+    q = select(
+        Transaction.user_id, month, Transaction.type, category,
+        func.sum(Transaction.amount), func.count(Transaction.id),
+    )
+    if user_id is not None:
+        q = q.where(Transaction.user_id == user_id)
+    q = q.group_by(Transaction.user_id, month, Transaction.type, category)
+    return insert(TransactionRollup).from_select(
+        ["user_id", "month", "type", "category", "amount_sum", "tx_count"], q
+    )
+
+
+def rebuild_rollups(db: Session, user_id: Optional[int] = None) -> int:
+    """롤업을 원시 트랜잭션에서 다시 만든다 (user_id 가 없으면 전체). 반환값: 롤업 행 수"""
+    stmt = delete(TransactionRollup)
+    if user_id is not None:
+        stmt = stmt.where(TransactionRollup.user_id == user_id)
+    db.execute(stmt)
+    db.execute(rebuild_statement(db.bind.dialect.name, user_id))
+    db.commit()
+    q = db.query(func.count(TransactionRollup.id))
+    if user_id is not None:
+        q = q.filter(TransactionRollup.user_id == user_id)
+    return q.scalar()
+
+
+if __name__ == "__main__":
+    import app.main  # noqa: F401  (마이그레이션 / 테이블 생성)
+    from app.db.session import SessionLocal
+
+    with SessionLocal() as session:
+        count = rebuild_rollups(session, int(sys.argv[1]) if len(sys.argv) > 1 else None)
+    print(f"transaction_rollups: {count} rows")
@@ -0,0 +1,121 @@
+"""
+닉네임 부분 문자열 검색
+
+ilike('%q%') 는 users 전체를 훑으므로 DB 별 부분 문자열 인덱스를 둔다.
+  - SQLite: FTS5 trigram 가상 테이블 users_nickname_fts (external content = users).
+    users INSERT / UPDATE OF nickname / DELETE 트리거로 가입·닉네임 변경과 함께 동기화된다.
+  - PostgreSQL: pg_trgm GIN 인덱스 — ILIKE 가 그대로 인덱스를 탄다.
+trigram 은 3글자부터 색인되므로 SQLite 에서 1~2글자 검색어는 접두 일치를 닉네임 인덱스로 먼저 찾고
+남는 자리만 ilike 로 채운다.
+결과는 접두 일치 → 짧은 닉네임 → 닉네임 순.
+"""
+from sqlalchemy import and_, case, func, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+MIN_TRIGRAM_LEN = 3
+
+_SQLITE_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS users_nickname_fts_ai AFTER INSERT ON users
+    WHEN new.nickname IS NOT NULL BEGIN
+      INSERT INTO users_nickname_fts (rowid, nickname) VALUES (new.id, new.nickname);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_nickname_fts_ad AFTER DELETE ON users
+    WHEN old.nickname IS NOT NULL BEGIN
+      INSERT INTO users_nickname_fts (users_nickname_fts, rowid, nickname) VALUES ('delete', old.id, old.nickname);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_nickname_fts_au AFTER UPDATE OF nickname ON users BEGIN
+      INSERT INTO users_nickname_fts (users_nickname_fts, rowid, nickname)
+        SELECT 'delete', old.id, old.nickname WHERE old.nickname IS NOT NULL;
+      INSERT INTO users_nickname_fts (rowid, nickname)
+        SELECT new.id, new.nickname WHERE new.nickname IS NOT NULL;
+    END
+    """,
+]
+
+
+def ensure_nickname_index(engine: Engine) -> None:
+    """닉네임 부분 문자열 인덱스 생성 (users 테이블 생성 후, 없을 때만)"""
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_nickname_fts'"
+            )).first()
+            if not exists:
+                conn.execute(text(
+                    "CREATE VIRTUAL TABLE users_nickname_fts USING fts5("
+                    "nickname, content='users', content_rowid='id', tokenize='trigram')"
+                ))
+                # 기존 사용자 색인 (users 를 다시 읽어 채움)
+                conn.execute(text("INSERT INTO users_nickname_fts (users_nickname_fts) VALUES ('rebuild')"))
+            for ddl in _SQLITE_DDL:
+                conn.execute(text(ddl))
+        elif engine.dialect.name == "postgresql":
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_users_nickname_trgm ON users USING gin (nickname gin_trgm_ops)"
+            ))
+        conn.commit()
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_nicknames(db: Session, query: str, exclude_user_id: int, limit: int = 20) -> list[User]:
+    """닉네임에 query 가 포함된 사용자 (본인 제외), 접두 일치 우선"""
+    escaped = _like_escape(query)
+    base = db.query(User).filter(User.id != exclude_user_id, User.nickname.isnot(None))
+
+    if db.bind.dialect.name == "sqlite" and len(query) >= MIN_TRIGRAM_LEN:
+        # trigram MATCH 는 대소문자 무시 부분 문자열 일치 — 구문 문자는 큰따옴표로 감싸 리터럴 처리
+        phrase = '"' + query.replace('"', '""') + '"'
+        matched = text("SELECT rowid FROM users_nickname_fts WHERE users_nickname_fts MATCH :phrase").bindparams(
+            phrase=phrase
+        )
+        prefix_first = case((User.nickname.ilike(f"{escaped}%", escape="\\"), 0), else_=1)
+        return (
+            base.filter(User.id.in_(matched))
+            .order_by(prefix_first, func.length(User.nickname), User.nickname)
+            .limit(limit)
+            .all()
+        )
+
+    if db.bind.dialect.name != "sqlite":
+        # pg_trgm 인덱스가 ILIKE 를 처리한다
+        prefix_first = case((User.nickname.ilike(f"{escaped}%", escape="\\"), 0), else_=1)
+        return (
+            base.filter(User.nickname.ilike(f"%{escaped}%", escape="\\"))
+            .order_by(prefix_first, func.length(User.nickname), User.nickname)
+            .limit(limit)
+            .all()
+        )
+
+    # 짧은 검색어: 접두 일치는 닉네임 인덱스 범위 조회, 모자라는 만큼만 부분 일치로 채운다
+    # (전체 정렬 없이 limit 에서 멈추므로 흔한 글자일수록 빨리 끝난다)
+    variants = {query, query.lower(), query.upper(), query.capitalize()}
+    prefix = (
+        base.filter(or_(*(and_(User.nickname >= v, User.nickname < v + "\U0010ffff") for v in variants)))
+        .order_by(func.length(User.nickname), User.nickname)
+        .limit(limit)
+        .all()
+    )
+    rest = []
+    if len(prefix) < limit:
+        rest = (
+            base.filter(
+                User.nickname.ilike(f"%{escaped}%", escape="\\"),
+                User.id.notin_([u.id for u in prefix]),
+            )
+            .limit(limit - len(prefix))
+            .all()
+        )
+        rest.sort(key=lambda u: (len(u.nickname), u.nickname))
+    return prefix + rest
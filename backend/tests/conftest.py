@@ -0,0 +1,74 @@
+"""
+API 테스트 공통 설정 — 임시 SQLite DB 로 앱을 띄우고 TestClient 로 호출한다.
+실행: backend/ 에서 python -m pytest tests
+"""
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.db"
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ["BACKGROUND_JOBS_ENABLED"] = "false"
+
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.db.session import SessionLocal, engine
+from app.main import app
+
+_seq = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_user(client):
+    """가입 + 로그인 → (user_id, 인증 헤더)"""
+    def _make(nickname: str = "user"):
+        n = next(_seq)
+        email = f"{nickname}{n}@example.com"
+        r = client.post("/auth/register", json={"email": email, "password": "pw", "nickname": f"{nickname}{n}"})
+        assert r.status_code == 200, r.text
+        token = client.post("/auth/login", data={"username": email, "password": "pw"}).json()["access_token"]
+        return r.json()["id"], {"Authorization": f"Bearer {token}"}
+    return _make
+
+
+class StatementCounter:
+    """with 블록 안에서 DB 로 나간 SQL 문 수"""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_statements():
+    return StatementCounter
@@ -0,0 +1,44 @@
+from app.models.group_project import GroupProject
+from app.models.group_project_task import GroupProjectTask
+from app.services.rank_service import spread_keys
+
+# 그룹 프로젝트 목록: 인증 / 멤버 확인 / 프로젝트 / 집계 — 프로젝트·작업 수와 무관해야 한다
+MAX_LIST_STATEMENTS = 7
+
+
+def _list_with_fixture(client, db, make_user, count_statements, n_projects: int, n_tasks: int):
+    """그룹에 프로젝트 n_projects 개 × 작업 n_tasks 개를 만들고 목록 조회 → (응답 프로젝트, 문장 카운터)"""
+    user_id, headers = make_user("owner")
+    group = client.post("/groups", json={"name": "g"}, headers=headers).json()
+    ranks = spread_keys(n_tasks)
+    for i in range(n_projects):
+        project = GroupProject(group_id=group["id"], created_by=user_id, title=f"p{i}")
+        db.add(project)
+        db.flush()
+        db.add_all([
+            GroupProjectTask(
+                group_project_id=project.id, assigned_to=user_id, title=f"t{j}",
+                is_done=(j % 2 == 0), order_index=j, rank=ranks[j],
+            )
+            for j in range(n_tasks)
+        ])
+    db.commit()
+
+    with count_statements() as counter:
+        r = client.get(f"/groups/{group['id']}/projects", headers=headers)
+
+    assert r.status_code == 200, r.text
+    projects = r.json()
+    assert len(projects) == n_projects
+    assert all(
+        p["stats"]["total"] == n_tasks and p["stats"]["done"] == (n_tasks + 1) // 2 for p in projects
+    ), projects[0]["stats"]
+    return projects, counter
+
+
+def test_list_group_projects_statement_count_is_constant(client, db, make_user, count_statements):
+    _, small = _list_with_fixture(client, db, make_user, count_statements, n_projects=1, n_tasks=2)
+    _, large = _list_with_fixture(client, db, make_user, count_statements, n_projects=20, n_tasks=50)
+
+    assert large.count == small.count, (small.statements, large.statements)
+    assert large.count <= MAX_LIST_STATEMENTS, large.statements
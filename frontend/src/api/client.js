@@ -19,11 +19,12 @@ async function throwFromResponse(res) {
   throw new Error(`오류가 발생했습니다. (${res.status})`);
 }
 
-export async function apiFetch(path, options = {}) {
+async function request(path, options = {}) {
   const token = localStorage.getItem("token");
   const headers = {
-    ...(options.body ? { "Content-Type": "application/json" } : {}),
+    ...(options.body && !(options.body instanceof FormData) ? { "Content-Type": "application/json" } : {}),
     ...(token ? { Authorization: `Bearer ${token}` } : {}),
+    ...(options.headers || {}),
   };
 
   let res;
@@ -39,10 +40,33 @@ export async function apiFetch(path, options = {}) {
     throw new Error("Unauthorized");
   }
   if (!res.ok) await throwFromResponse(res);
+  return res;
+}
+
+export async function apiFetch(path, options = {}) {
+  const res = await request(path, options);
   if (res.status === 204) return null;
   return res.json();
 }
 
+/** 키셋 페이지네이션 목록 — { items, nextCursor } (다음 페이지 커서는 X-Next-Cursor 헤더, 마지막 페이지면 null) */
+export async function apiFetchPage(path, options = {}) {
+  const res = await request(path, options);
+  return { items: await res.json(), nextCursor: res.headers.get("X-Next-Cursor") };
+}
+
+/** 커서를 끝까지 따라가며 모든 페이지를 모은다 — fetchPage(cursor) 는 apiFetchPage 결과를 돌려준다 */
+export async function collectPages(fetchPage) {
+  const items = [];
+  let cursor = null;
+  do {
+    const page = await fetchPage(cursor);
+    items.push(...page.items);
+    cursor = page.nextCursor;
+  } while (cursor);
+  return items;
+}
+
 export async function apiLogin(email, password) {
   const formData = new URLSearchParams();
   formData.append("username", email);
@@ -165,6 +189,41 @@ export const transactionsApi = {
   delete: (id) => apiFetch(`/transactions/${id}`, { method: "DELETE" }),
   summary: (year, month) =>
     apiFetch(`/transactions/summary?year=${year}&month=${month}`),
+  trend: (start, end) =>
+    apiFetch(`/transactions/trend?start=${start}&end=${end}`),
+  importCsv: (file, profile) => {
+    const form = new FormData();
+    form.append("file", file);
+    if (profile) form.append("profile", JSON.stringify(profile));
+    return apiFetch("/transactions/import", { method: "POST", body: form });
+  },
+};
+
+export const tasksApi = {
+  list: ({ date_from, date_to, cursor, limit } = {}) => {
+    const params = new URLSearchParams();
+    if (date_from) params.append("date_from", date_from);
+    if (date_to) params.append("date_to", date_to);
+    if (cursor) params.append("cursor", cursor);
+    if (limit) params.append("limit", limit);
+    return apiFetch(`/tasks?${params.toString()}`);
+  },
+  // 월간 뷰용 경량 목록 (id, title, category, start_at, end_at, status)
+  calendar: (date_from, date_to) =>
+    apiFetch(`/tasks/calendar?date_from=${encodeURIComponent(date_from)}&date_to=${encodeURIComponent(date_to)}`),
+};
+
+// 나 + 친구 / 그룹 멤버의 공통 빈 시간 (date_to 포함)
+export const freeBusyApi = {
+  get: ({ date_from, date_to, user_ids = [], group_id, min_duration_min, day_start_hour, day_end_hour }) => {
+    const params = new URLSearchParams({ date_from, date_to });
+    user_ids.forEach((id) => params.append("user_ids", id));
+    if (group_id) params.append("group_id", group_id);
+    if (min_duration_min) params.append("min_duration_min", min_duration_min);
+    if (day_start_hour != null) params.append("day_start_hour", day_start_hour);
+    if (day_end_hour != null) params.append("day_end_hour", day_end_hour);
+    return apiFetch(`/freebusy?${params.toString()}`);
+  },
 };
 
 export const taskCommentsApi = {
@@ -179,7 +238,8 @@ export const taskCommentsApi = {
 };
 
 export const projectsApi = {
-  list: () => apiFetch("/projects"),
+  list: ({ include_tasks = false } = {}) =>
+    apiFetch(`/projects${include_tasks ? "?include_tasks=true" : ""}`),
   create: ({ goal_id, title, description, deadline }) =>
     apiFetch("/projects", {
       method: "POST",
@@ -205,14 +265,35 @@ export const projectsApi = {
     apiFetch(`/projects/${project_id}/tasks/${task_id}`, { method: "DELETE" }),
   twinnyFeedback: (project_id) =>
     apiFetch(`/projects/${project_id}/twinny-feedback`, { method: "POST" }),
+  burndown: (project_id, { date_from, date_to } = {}) => {
+    const params = new URLSearchParams();
+    if (date_from) params.set("date_from", date_from);
+    if (date_to) params.set("date_to", date_to);
+    const qs = params.toString();
+    return apiFetch(`/projects/${project_id}/burndown${qs ? `?${qs}` : ""}`);
+  },
+  forecast: (project_id) => apiFetch(`/projects/${project_id}/forecast`),
+};
+
+export const activityApi = {
+  feed: ({ kinds, cursor, limit } = {}) => {
+    const params = new URLSearchParams();
+    if (kinds) kinds.forEach((k) => params.append("kinds", k));
+    if (cursor) params.append("cursor", cursor);
+    if (limit) params.append("limit", limit);
+    return apiFetch(`/activity/feed?${params.toString()}`);
+  },
 };
 
 export const friendsLogsApi = {
-  list: ({ types, log_date } = {}) => {
+  // 한 페이지 { items, nextCursor } — 하루치 전체는 collectPages 로 커서를 따라간다
+  list: ({ types, log_date, cursor, limit } = {}) => {
     const params = new URLSearchParams();
     if (types) types.forEach((t) => params.append("types", t));
     if (log_date) params.append("log_date", log_date);
-    return apiFetch(`/logs/friends?${params.toString()}`);
+    if (cursor) params.append("cursor", cursor);
+    if (limit) params.append("limit", limit);
+    return apiFetchPage(`/logs/friends?${params.toString()}`);
   },
 };
 
@@ -247,10 +328,10 @@ export const groupStatsApi = {
 };
 
 export const planApi = {
-  createDraft: (plan_name, changes, horizon_days) =>
+  createDraft: (plan_name, changes, horizon_days, preferences = null) =>
     apiFetch("/plan/drafts", {
       method: "POST",
-      body: JSON.stringify({ plan_name, changes, horizon_days }),
+      body: JSON.stringify({ plan_name, changes, horizon_days, preferences }),
     }),
   listDrafts: () => apiFetch("/plan/drafts"),
   getDraft: (id) => apiFetch(`/plan/drafts/${id}`),
@@ -259,6 +340,23 @@ export const planApi = {
       method: "PUT",
       body: JSON.stringify(events),
     }),
-  applyDraft: (id) =>
-    apiFetch(`/plan/drafts/${id}/apply`, { method: "POST" }),
+  listEvents: (id, { cursor, limit } = {}) => {
+    const params = new URLSearchParams();
+    if (cursor) params.append("cursor", cursor);
+    if (limit) params.append("limit", limit);
+    return apiFetchPage(`/plan/drafts/${id}/events?${params.toString()}`);
+  },
+  patchEvent: (id, eventId, changes) =>
+    apiFetch(`/plan/drafts/${id}/events/${eventId}`, {
+      method: "PATCH",
+      body: JSON.stringify(changes),
+    }),
+  deleteEvent: (id, eventId) =>
+    apiFetch(`/plan/drafts/${id}/events/${eventId}`, { method: "DELETE" }),
+  // 같은 idempotencyKey 로 재시도하면 중복 생성 없이 처음 결과(task_ids)를 돌려받는다
+  applyDraft: (id, idempotencyKey) =>
+    apiFetch(`/plan/drafts/${id}/apply`, {
+      method: "POST",
+      headers: idempotencyKey ? { "Idempotency-Key": idempotencyKey } : {},
+    }),
 };
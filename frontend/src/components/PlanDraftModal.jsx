@@ -6,10 +6,23 @@
  *   horizonDays    : 기간 (7 or 30)
  *   existingDraftId: 기존 초안 ID (null이면 새로 생성)
  *   onClose        : 모달 닫기
- *   onApplied      : 캘린더 적용 완료 후 콜백
+ *   onApplied      : 캘린더 적용 완료 후 콜백 (생성된 task id 목록 전달)
  */
-import { useState, useEffect } from "react";
-import { planApi } from "../api/client";
+import { useState, useEffect, useRef } from "react";
+import { planApi, collectPages } from "../api/client";
+
+const EVENT_PAGE_SIZE = 200; // 서버 상한 (plan.py MAX_EVENT_PAGE_SIZE)
+
+const RRULE_DAYS = { MO: "월", TU: "화", WE: "수", TH: "목", FR: "금", SA: "토", SU: "일" };
+
+// "FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=..." → "매주 월·수"
+function describeRRule(rrule) {
+  const parts = Object.fromEntries(rrule.split(";").map((p) => p.split("=")));
+  const count = parts.COUNT ? ` · ${parts.COUNT}회` : "";
+  if (parts.FREQ === "DAILY") return `매일${count}`;
+  const days = (parts.BYDAY || "").split(",").filter(Boolean).map((d) => RRULE_DAYS[d]).join("·");
+  return `매주 ${days}${count}`.trim();
+}
 
 export default function PlanDraftModal({ changes, horizonDays, existingDraftId, onClose, onApplied }) {
   const [draft, setDraft] = useState(null);
@@ -19,6 +32,11 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
   const [saving, setSaving] = useState(false);
   const [applying, setApplying] = useState(false);
   const [error, setError] = useState(null);
+  // 편집된 이벤트 필드 { [eventId]: { field: value } } / 삭제된 이벤트 ID — 저장 시 바뀐 것만 전송
+  const [changed, setChanged] = useState({});
+  const [removed, setRemoved] = useState([]);
+  // 모달 한 번에 키 하나 — 적용 버튼을 다시 눌러도(재시도) 일정이 중복 생성되지 않는다
+  const applyKey = useRef(crypto.randomUUID());
 
   useEffect(() => {
     if (existingDraftId) {
@@ -45,9 +63,13 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
   async function loadExistingDraft(id) {
     setLoading(true);
     try {
+      // 초안 정보(개수만) + 이벤트는 커서를 따라 페이지 단위로
       const d = await planApi.getDraft(id);
+      const loaded = await collectPages((cursor) =>
+        planApi.listEvents(id, { cursor, limit: EVENT_PAGE_SIZE })
+      );
       setDraft(d);
-      setEvents(d.events || []);
+      setEvents(loaded);
     } catch (e) {
       setError("초안 로드에 실패했습니다.");
     } finally {
@@ -56,13 +78,28 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
   }
 
   function updateEvent(index, field, value) {
+    const id = events[index].id;
     setEvents((prev) =>
       prev.map((ev, i) => (i === index ? { ...ev, [field]: value } : ev))
     );
+    setChanged((prev) => ({ ...prev, [id]: { ...prev[id], [field]: value } }));
   }
 
   function removeEvent(index) {
+    const id = events[index].id;
     setEvents((prev) => prev.filter((_, i) => i !== index));
+    setRemoved((prev) => [...prev, id]);
+    setChanged(({ [id]: _, ...rest }) => rest);
+  }
+
+  // 바뀐 이벤트만 PATCH / DELETE
+  async function saveChanges() {
+    await Promise.all([
+      ...removed.map((id) => planApi.deleteEvent(draft.id, id)),
+      ...Object.entries(changed).map(([id, fields]) => planApi.patchEvent(draft.id, id, fields)),
+    ]);
+    setRemoved([]);
+    setChanged({});
   }
 
   async function handleSave() {
@@ -70,7 +107,7 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
     setSaving(true);
     setError(null);
     try {
-      await planApi.updateDraft(draft.id, events);
+      await saveChanges();
     } catch (e) {
       setError("저장 실패: " + e.message);
     } finally {
@@ -84,11 +121,11 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
     setError(null);
     try {
       // 먼저 편집 내용 저장
-      await planApi.updateDraft(draft.id, events);
+      await saveChanges();
       // 캘린더에 적용
-      const res = await planApi.applyDraft(draft.id);
+      const res = await planApi.applyDraft(draft.id, applyKey.current);
       alert(`${res.task_count}개의 일정이 캘린더에 추가되었습니다! 🎉`);
-      onApplied && onApplied();
+      onApplied && onApplied(res.task_ids);
     } catch (e) {
       setError("적용 실패: " + e.message);
     } finally {
@@ -131,6 +168,12 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
               <span className="plan-draft-count">{events.length}개 일정</span>
             </div>
 
+            {draft?.unplaced?.length > 0 && (
+              <div className="error-banner">
+                기존 일정과 겹쳐 빈 시간을 찾지 못한 {draft.unplaced.length}개 회차는 초안에서 빠졌습니다.
+              </div>
+            )}
+
             <div className="plan-draft-events">
               {events.length === 0 ? (
                 <div className="plan-draft-empty">
@@ -138,7 +181,7 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
                 </div>
               ) : (
                 events.map((ev, i) => (
-                  <div key={i} className="plan-event-row">
+                  <div key={ev.id ?? i} className="plan-event-row">
                     <div className="plan-event-main">
                       <input
                         className="plan-event-title-input"
@@ -170,6 +213,7 @@ export default function PlanDraftModal({ changes, horizonDays, existingDraftId,
                         <option value="health">건강</option>
                         <option value="finance">소비</option>
                       </select>
+                      {ev.rrule && <span className="plan-event-repeat">🔁 {describeRRule(ev.rrule)}</span>}
                     </div>
                     <button
                       className="plan-event-remove"
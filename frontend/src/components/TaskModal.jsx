@@ -40,6 +40,8 @@ function formatCommentTime(dt) {
 
 export default function TaskModal({ task, defaultDate, onClose, onSave }) {
   const isEdit = Boolean(task?.id);
+  // 다른 사람 일정에 함께하기로 참여 중: 내 진행 상태만 바꾸거나 참여를 취소할 수 있다
+  const isParticipant = Boolean(task?.participating);
 
   const [form, setForm] = useState({
     title: task?.title || "",
@@ -63,6 +65,9 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
   const [myUserId, setMyUserId] = useState(null);
 
   const set = (key, val) => setForm((f) => ({ ...f, [key]: val }));
+  const occurrencePath = task?.occurrence_start
+    ? `/tasks/${task.id}/occurrences/${encodeURIComponent(task.occurrence_start)}`
+    : null;
 
   useEffect(() => {
     friendsApi.list().then(setFriends).catch(() => {});
@@ -93,7 +98,13 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
         start_at: new Date(form.start_at).toISOString(),
         end_at: new Date(form.end_at).toISOString(),
       };
-      if (isEdit) {
+      if (isParticipant) {
+        await apiFetch(`/tasks/${task.id}/participation`, { method: "PUT", body: JSON.stringify({ status: base.status }) });
+      } else if (isEdit && task.occurrence_start) {
+        // 반복 일정의 회차: 이 회차만 수정
+        const { title, start_at, end_at, status } = base;
+        await apiFetch(occurrencePath, { method: "PUT", body: JSON.stringify({ title, start_at, end_at, status }) });
+      } else if (isEdit) {
         await apiFetch(`/tasks/${task.id}`, { method: "PUT", body: JSON.stringify(base) });
       } else {
         await apiFetch("/tasks", {
@@ -111,10 +122,13 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
   };
 
   const handleDelete = async () => {
-    if (!window.confirm("이 일정을 삭제하시겠습니까?")) return;
+    if (!window.confirm(isParticipant ? "이 일정 참여를 취소하시겠습니까?" : "이 일정을 삭제하시겠습니까?")) return;
     setLoading(true);
     try {
-      await apiFetch(`/tasks/${task.id}`, { method: "DELETE" });
+      const path = isParticipant
+        ? `/tasks/${task.id}/participation`
+        : task.occurrence_start ? occurrencePath : `/tasks/${task.id}`;
+      await apiFetch(path, { method: "DELETE" });
       onSave(); onClose();
     } catch (err) {
       setError(err.message); setLoading(false);
@@ -166,7 +180,7 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
             <input
               className="form-input" type="text"
               placeholder="일정 제목을 입력하세요"
-              value={form.title}
+              value={form.title} disabled={isParticipant}
               onChange={(e) => set("title", e.target.value)}
             />
           </div>
@@ -174,7 +188,7 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
           <div className="form-row">
             <div className="form-group">
               <label className="form-label">카테고리</label>
-              <select className="form-select" value={form.category} onChange={(e) => set("category", e.target.value)}>
+              <select className="form-select" value={form.category} disabled={isParticipant} onChange={(e) => set("category", e.target.value)}>
                 {CATEGORIES.map(c => <option key={c} value={c}>{CATEGORY_LABELS[c]}</option>)}
               </select>
             </div>
@@ -189,12 +203,12 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
           <div className="form-row">
             <div className="form-group">
               <label className="form-label">시작 시간</label>
-              <input className="form-input" type="datetime-local" value={form.start_at}
+              <input className="form-input" type="datetime-local" value={form.start_at} disabled={isParticipant}
                 onChange={(e) => set("start_at", e.target.value)} />
             </div>
             <div className="form-group">
               <label className="form-label">종료 시간</label>
-              <input className="form-input" type="datetime-local" value={form.end_at}
+              <input className="form-input" type="datetime-local" value={form.end_at} disabled={isParticipant}
                 onChange={(e) => set("end_at", e.target.value)} />
             </div>
           </div>
@@ -203,7 +217,7 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
           <div className="form-group">
             <label className="form-label">공개 범위</label>
             <select
-              className="form-select" value={form.visibility}
+              className="form-select" value={form.visibility} disabled={isParticipant}
               onChange={(e) => { set("visibility", e.target.value); set("visible_to_user_ids", []); }}
             >
               {Object.entries(VISIBILITY_LABELS).map(([val, label]) => (
@@ -236,7 +250,7 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
           {/* 함께 하기 (새 일정 생성 시만) */}
           {!isEdit && friends.length > 0 && (
             <div className="form-group">
-              <label className="form-label">함께 할 친구 <span style={{ fontWeight: 400, fontSize: "0.78rem", color: "var(--text-muted)" }}>— 선택 시 친구 캘린더에도 일정이 생성됩니다</span></label>
+              <label className="form-label">함께 할 친구 <span style={{ fontWeight: 400, fontSize: "0.78rem", color: "var(--text-muted)" }}>— 선택 시 친구 캘린더에도 일정이 표시됩니다</span></label>
               <div className="friend-select-list">
                 {friends.map(f => (
                   <label key={f.id} className="friend-select-item">
@@ -256,7 +270,7 @@ export default function TaskModal({ task, defaultDate, onClose, onSave }) {
           <div className="modal-actions">
             {isEdit && (
               <button type="button" className="btn btn-danger" style={{ marginRight: "auto" }}
-                onClick={handleDelete} disabled={loading}>삭제</button>
+                onClick={handleDelete} disabled={loading}>{isParticipant ? "참여 취소" : "삭제"}</button>
             )}
             <button type="button" className="btn btn-ghost" onClick={onClose} disabled={loading}>취소</button>
             <button type="submit" className="btn btn-primary" disabled={loading}>
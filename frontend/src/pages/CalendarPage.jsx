@@ -1,7 +1,7 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { useAuth } from "../contexts/AuthContext";
-import { apiFetch } from "../api/client";
+import { tasksApi } from "../api/client";
 import TaskModal from "../components/TaskModal";
 
 const WEEKDAYS = ["일", "월", "화", "수", "목", "금", "토"];
@@ -68,11 +68,18 @@ export default function CalendarPage() {
   const year  = viewDate.getFullYear();
   const month = viewDate.getMonth();
 
+  // 보이는 달과 겹치는 일정만 조회
   const fetchTasks = async () => {
-    try { setTasks(await apiFetch("/tasks")); }
+    const next = new Date(year, month + 1, 1);
+    try {
+      setTasks(await tasksApi.list({
+        date_from: `${year}-${pad(month + 1)}-01T00:00:00`,
+        date_to:   `${next.getFullYear()}-${pad(next.getMonth() + 1)}-01T00:00:00`,
+      }));
+    }
     catch (err) { console.error(err); }
   };
-  useEffect(() => { fetchTasks(); }, []);
+  useEffect(() => { fetchTasks(); }, [year, month]);
 
   const prevMonth = () => setViewDate(new Date(year, month - 1, 1));
   const nextMonth = () => setViewDate(new Date(year, month + 1, 1));
@@ -279,7 +286,7 @@ export default function CalendarPage() {
             ) : (
               selectedDayTasks.map((task) => (
                 <div
-                  key={task.id}
+                  key={`${task.id}-${task.occurrence_start || ""}`}
                   className="task-card"
                   style={{ borderLeftColor: CATEGORY_COLORS[task.category] || "#6366f1" }}
                   onClick={() => openEdit(task)}
@@ -581,7 +581,7 @@ export default function GoalTwinPage() {
 
   const load = async () => {
     try {
-      const [g, p] = await Promise.all([goalsApi.list(), projectsApi.list()]);
+      const [g, p] = await Promise.all([goalsApi.list(), projectsApi.list({ include_tasks: true })]);
       setGoals(g);
       setProjects(p);
       // 목표와 연결되지 않은 프로젝트
@@ -94,7 +94,7 @@ export default function HomePage() {
       }
     });
     // 전체 프로젝트 달성률 — 개인 + 그룹 프로젝트
-    projectsApi.list().then(setPersonalProjects).catch(() => {});
+    projectsApi.list({ include_tasks: true }).then(setPersonalProjects).catch(() => {});
     groupsApi.list().then(async (gs) => {
       const results = await Promise.allSettled(gs.map((g) => groupProjectsApi.list(g.id)));
       setGroupProjects(results.flatMap((r) => r.status === "fulfilled" ? r.value : []));
@@ -1,6 +1,6 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
-import { logsApi, friendsLogsApi, friendsApi } from "../api/client";
+import { logsApi, friendsLogsApi, friendsApi, collectPages } from "../api/client";
 
 // 오늘 날짜 (YYYY-MM-DD)
 function todayStr() {
@@ -9,6 +9,7 @@ function todayStr() {
 }
 
 const SECTION_KEYS = ["sleep", "health", "mood"];
+const FRIENDS_LOGS_PAGE_SIZE = 500; // 서버 상한 (logs.py friends_logs)
 const SECTION_META = {
   sleep:  { label: "수면",  icon: "😴", unit: "시간", color: "#c7d2fe" },
   health: { label: "운동",  icon: "🏃", unit: "회",   color: "#bbf7d0" },
@@ -160,7 +161,9 @@ export default function SelfCareTwinPage() {
   useEffect(() => {
     Promise.allSettled([
       logsApi.list({ date_from: today, date_to: today, limit: 200 }),
-      friendsLogsApi.list({ types: SECTION_KEYS, log_date: today }),
+      collectPages((cursor) =>
+        friendsLogsApi.list({ types: SECTION_KEYS, log_date: today, cursor, limit: FRIENDS_LOGS_PAGE_SIZE })
+      ),
       friendsApi.list(),
     ]).then(([myRes, friendsRes, friendListRes]) => {
       if (myRes.status === "fulfilled") setMyLogs(myRes.value || []);
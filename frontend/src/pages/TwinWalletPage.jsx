@@ -89,6 +89,7 @@ export default function TwinWalletPage() {
         amount: amt,
         category: form.category || null,
         memo: form.memo || null,
+        is_impulse: form.type === "expense" && form.is_impulse,
       });
       setShowModal(false);
       setForm({ type: "expense", amount: "", category: "", memo: "" });
@@ -228,6 +229,7 @@ export default function TwinWalletPage() {
                     <div className="wallet-tx-info">
                       <span className="wallet-tx-category">{tx.category || TYPE_META[tx.type]?.label}</span>
                       {tx.memo && <span className="wallet-tx-memo">{tx.memo}</span>}
+                      {tx.is_impulse && <span className="wallet-tx-memo">충동 소비</span>}
                     </div>
                     <span className={`wallet-tx-amount ${tx.type}`}>
                       {tx.type === "income" ? "+" : tx.type === "expense" ? "-" : ""}
@@ -334,6 +336,20 @@ export default function TwinWalletPage() {
                 />
               </div>
 
+              {/* 충동 소비 (지출만) */}
+              {form.type === "expense" && (
+                <div className="wallet-form-field">
+                  <label>
+                    <input
+                      type="checkbox"
+                      checked={!!form.is_impulse}
+                      onChange={(e) => setForm(f => ({ ...f, is_impulse: e.target.checked }))}
+                    />{" "}
+                    충동 소비였어요
+                  </label>
+                </div>
+              )}
+
               <button type="submit" className="btn btn-primary" style={{ width: "100%", justifyContent: "center" }}>
                 저장
               </button>